@@ -0,0 +1,65 @@
+"""add materialized habit streak state
+
+Revision ID: 3b9c1e7a5d20
+Revises: d6f785b5f77b
+Create Date: 2026-10-18 14:02:11.418230+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9c1e7a5d20'
+down_revision: Union[str, None] = 'd6f785b5f77b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('habits', sa.Column('current_streak', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('habits', sa.Column('longest_streak', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('habits', sa.Column('last_completed_date', sa.Date(), nullable=True))
+
+    # Backfill from existing completions (same gaps-and-islands logic as
+    # `flask habits rebuild-streaks`), bucketing by each owner's local date
+    op.execute("""
+        WITH days AS (
+            SELECT DISTINCT hc.habit_id, (hc.created_at AT TIME ZONE u.timezone)::date AS local_date
+            FROM habit_completions hc
+            JOIN users u ON u.id = hc.user_id
+        ),
+        islands AS (
+            SELECT habit_id, local_date,
+                   local_date - (row_number() OVER (PARTITION BY habit_id ORDER BY local_date))::int AS island
+            FROM days
+        ),
+        runs AS (
+            SELECT habit_id, max(local_date) AS run_end, count(*) AS run_length
+            FROM islands
+            GROUP BY habit_id, island
+        ),
+        stats AS (
+            SELECT DISTINCT ON (habit_id)
+                   habit_id, run_end, run_length,
+                   max(run_length) OVER (PARTITION BY habit_id) AS longest
+            FROM runs
+            ORDER BY habit_id, run_end DESC
+        )
+        UPDATE habits h
+        SET current_streak = s.run_length,
+            longest_streak = s.longest,
+            last_completed_date = s.run_end
+        FROM stats s
+        WHERE s.habit_id = h.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('habits', 'last_completed_date')
+    op.drop_column('habits', 'longest_streak')
+    op.drop_column('habits', 'current_streak')
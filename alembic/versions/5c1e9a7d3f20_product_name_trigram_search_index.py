@@ -0,0 +1,46 @@
+"""trigram index on products.name, pattern ops on barcode index for prefix search
+
+Revision ID: 5c1e9a7d3f20
+Revises: 339a43b421e1
+Create Date: 2026-10-18 15:40:12.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e9a7d3f20'
+down_revision: Union[str, None] = '339a43b421e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm ships with Postgres' contrib modules (included in the official Docker images)
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        raise RuntimeError(
+            "Postgres extension pg_trgm is not available on this server; install the "
+            "contrib modules (eg, the postgresql-contrib package) and re-run the migration"
+        )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_product_name_trgm', 'products', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+    # Recreate with varchar_pattern_ops so it also serves barcode prefix matches
+    op.drop_index('ix_user_product_barcode_active', table_name='products', postgresql_where=sa.text('deleted_at IS NULL'))
+    op.create_index('ix_user_product_barcode_active', 'products', ['user_id', 'barcode'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_ops={'barcode': 'varchar_pattern_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_product_barcode_active', table_name='products', postgresql_where=sa.text('deleted_at IS NULL'))
+    op.create_index('ix_user_product_barcode_active', 'products', ['user_id', 'barcode'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'))
+
+    op.drop_index('ix_product_name_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    # Extension left installed; other objects may depend on it
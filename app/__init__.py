@@ -20,6 +20,7 @@ from app.config import get_config
 from app.extensions import _setup_extensions
 from app.shared import jinja_filters
 from app.shared.debug import setup_dev_debugging
+from app.shared.json_provider import init_json_provider
 from app.shared.setup_logging import setup_logging
 
 
@@ -42,12 +43,14 @@ def create_app(config_name: str | None = None) -> Flask:
 
     _apply_config(app, config_name)
     setup_logging(app)  # Must read logging level after being set by apply_config
+    init_json_provider(app)
     if config_name in ("dev", "testing"):
         setup_dev_debugging(app)
     _setup_extensions(app)
     _setup_request_hooks(app)
     _setup_database(app)
     _register_blueprints(app)
+    _register_cli_commands(app)
 
     jinja_filters.register_filters(app)
 
@@ -125,6 +128,15 @@ def _register_blueprints(app: Flask) -> None:
         app.register_blueprint(bp)
 
 
+def _register_cli_commands(app: Flask) -> None:
+    """Registers module CLI command groups (eg, `flask habits rebuild-streaks`)."""
+    from app.modules.groceries.cli import groceries_cli
+    from app.modules.habits.cli import habits_cli
+
+    app.cli.add_command(habits_cli)
+    app.cli.add_command(groceries_cli)
+
+
 def _apply_config(app: Flask, config_name: str | None) -> None:
     """
     Copies our config from config_name into app config? (same as current_app?)
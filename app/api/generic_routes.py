@@ -14,9 +14,8 @@ from flask import Response, abort, request
 from flask_login import current_user
 
 from app.api import api_bp
-from app.api.responses import api_response
+from app.api.responses import api_response, validation_failed
 from app.modules.auth.models import UnitSystemEnum
-from app.modules.auth.service import check_item_ownership
 from app.modules.groceries.models import (
     Product,
     ShoppingList,
@@ -30,7 +29,17 @@ from app.modules.time_tracking.models import TimeEntry
 from app.shared.conversions import kg_to_lbs
 from app.shared.database.helpers import safe_delete
 from app.shared.decorators import login_plus_session
-from app.shared.hooks import PATCH_HOOKS
+from app.shared.hooks import DELETE_HOOKS, PATCH_HOOKS
+from app.shared.parsers_ import get_page_params
+from app.shared.repository.base import BaseRepository
+from app.shared.repository.list_query import (
+    FieldFilter,
+    api_columns,
+    compile_filter,
+    parse_fields,
+)
+from app.shared.serialization import serialize_many
+from app.shared.validators import validate_patch_batch
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +67,87 @@ def _get_model_class(module: str, subtype: str) -> type[Any] | None:
     return MODEL_CLASSES.get((module, subtype))
 
 
+# Their `to_api_dict` includes the product's name, which the row's `updated_at` doesn't track
+_ETAG_EXEMPT: frozenset[type[Any]] = frozenset({Transaction, ShoppingListItem})
+
+
+def _item_etag(item: Any) -> str | None:  # noqa: ANN401
+    """
+    Version tag for an item's GET body: id & `updated_at` (bumped by every ORM/Core UPDATE),
+    plus the user's unit system, which converts `weight`. None for `_ETAG_EXEMPT` models.
+    """
+    if type(item) in _ETAG_EXEMPT:
+        return None
+    version = item.updated_at or item.created_at
+    return f"{item.__tablename__}-{item.id}-{version.timestamp():.6f}-{current_user.units.value}"
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    """Tags response; `no-cache` makes browsers revalidate with If-None-Match each time."""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _apply_patch(item: Any, data: dict[str, Any]) -> None:  # noqa: ANN401
+    """Sets each field on item, parsing ISO datetime strings."""
+    for field, value in data.items():
+        new_value = value
+        if isinstance(value, str):
+            with suppress(ValueError):
+                new_value = datetime.fromisoformat(new_value)
+        setattr(item, field, new_value)
+
+
+@api_bp.get("/<module>/<subtype>")
+@login_plus_session
+def items_list(session: Session, module: str, subtype: str) -> tuple[Response, int]:
+    """
+    Keyset-paged list of the user's items, with only the data a widget needs.
+
+    Query: `fields=a,b` (API columns; `id` is always included), repeated
+    `filter=<field>:<op>:<value>` (ops: eq, lt, between, in; list values comma-separated),
+    plus `sort`/`order`/`cursor`/`limit` as for dashboard tables (default: newest id first).
+    Computed extras (eg, `product_name`) aren't columns, so aren't available here.
+    """
+    model_class = _get_model_class(module, subtype)
+    if model_class is None:
+        logger.warning("Unknown model for %s, %s", module, subtype)
+        abort(404, description="Requested resource not found")
+    return list_items(session, model_class)
+
+
+def list_items(session: Session, model_class: type[Any]) -> tuple[Response, int]:
+    """
+    Body of `items_list`, for module routes whose static list rule shadows the generic
+    one (eg, GET /metrics/daily_metrics) to hand `fields`/`filter` requests over to.
+    """
+    sortable = api_columns(model_class)
+    page = get_page_params("id", sortable)
+    errors: dict[str, list[str]] = {}
+    try:
+        fields = parse_fields(model_class, request.args.get("fields"))
+    except ValueError as e:
+        errors["fields"] = [str(e)]
+    filters = []
+    for token in request.args.getlist("filter"):
+        try:
+            filters.append(compile_filter(model_class, FieldFilter.parse(token)))
+        except ValueError as e:  # noqa: PERF203
+            errors.setdefault("filter", []).append(str(e))
+    if errors:
+        return validation_failed(errors), 400
+
+    repo = BaseRepository(session, current_user.id, model_class)
+    rows, next_cursor = repo.get_columns_page(fields, filters, sortable=sortable, **page)
+    return api_response(
+        success=True,
+        message=f"Retrieved {len(rows)} {model_class.__tablename__}",
+        data={"items": serialize_many(model_class, rows), "next_cursor": next_cursor},
+    ), 200
+
+
 @api_bp.route("/<module>/<subtype>/<int:item_id>", methods=["GET", "PATCH", "DELETE"])
 @login_plus_session
 def item(
@@ -68,16 +158,19 @@ def item(
         logger.warning("Unknown model for %s, %s", module, subtype)
         abort(404, description="Requested resource not found")
 
-    item = session.get(model_class, item_id)
+    # User-scoped, so another user's item is indistinguishable from a missing one
+    item = BaseRepository(session, current_user.id, model_class).get_by_id(item_id)
     if not item:
         return api_response(
             success=False, message=f"{model_class.__name__} not found."
         ), 404
 
-    # Ownership check
-    check_item_ownership(item, current_user.id)
-
     if request.method == "GET":
+        # Unchanged since the client's copy: skip serializing entirely
+        etag = _item_etag(item)
+        if etag is not None and request.if_none_match.contains(etag):
+            return _with_etag(Response(status=304), etag), 304
+
         data = item.to_api_dict()
 
         # Convert weight for display
@@ -87,25 +180,21 @@ def item(
         elif "weight" in data:
             data["weight_units"] = "kg"
 
-        return api_response(
+        response = api_response(
             success=True, message=f"Retrieved {item.__tablename__}", data=data
-        ), 200
+        )
+        return (_with_etag(response, etag) if etag is not None else response), 200
 
     if request.method == "PATCH":
         data = request.get_json()
-        for field, value in data.items():
-            new_value = value
-            if isinstance(value, str):
-                with suppress(ValueError):
-                    new_value = datetime.fromisoformat(new_value)
-            setattr(item, field, new_value)
+        _apply_patch(item, data)
         session.flush()
 
         response_data = item.to_api_dict()
 
         hook = PATCH_HOOKS.get(subtype)
         if hook:
-            extra_data = hook(item, data, session, current_user)
+            extra_data = hook([item], data, session, current_user)
             response_data |= extra_data
 
         return api_response(
@@ -115,6 +204,63 @@ def item(
         ), 200
 
     safe_delete(session, item)
+    response_data = item.to_api_dict()
+
+    hook = DELETE_HOOKS.get(subtype)
+    if hook:
+        session.flush()
+        extra_data = hook(item, session, current_user)
+        response_data |= extra_data
+
+    return api_response(
+        success=True, message=f"{model_class.__name__} deleted", data=response_data
+    ), 200
+
+
+@api_bp.patch("/<module>/<subtype>/batch")
+@login_plus_session
+def items_batch(session: Session, module: str, subtype: str) -> tuple[Response, int]:
+    """
+    PATCH many items of one model: `{"items": [{"id": 1, <field>: <value>}, ...]}`.
+
+    Loads every target in one user-scoped query & flushes once; the subtype's PATCH hook runs
+    once for the whole batch. All or nothing: any unknown/foreign id fails the request (404).
+    """
+    model_class = _get_model_class(module, subtype)
+    if model_class is None:
+        logger.warning("Unknown model for %s, %s", module, subtype)
+        abort(404, description="Requested resource not found")
+
+    typed_data, errors = validate_patch_batch(request.get_json(silent=True) or {})
+    if errors:
+        return validation_failed(errors), 400
+    patches: dict[int, dict[str, Any]] = typed_data["items"]
+
+    repo = BaseRepository(session, current_user.id, model_class)
+    items = {item.id: item for item in repo.get_by_ids(patches)}
+    missing = [item_id for item_id in patches if item_id not in items]
+    if missing:
+        return api_response(
+            success=False,
+            message=f"{model_class.__name__} not found.",
+            errors={"ids": missing},
+        ), 404
+
+    merged: dict[str, Any] = {}
+    for item_id, data in patches.items():
+        _apply_patch(items[item_id], data)
+        merged |= data
+    session.flush()
+
+    updated = [items[item_id] for item_id in patches]
+    response_data: dict[str, Any] = {"items": [item.to_api_dict() for item in updated]}
+
+    hook = PATCH_HOOKS.get(subtype)
+    if hook:
+        response_data |= hook(updated, merged, session, current_user)
+
     return api_response(
-        success=True, message=f"{model_class.__name__} deleted", data=item.to_api_dict()
+        success=True,
+        message=f"Updated {len(updated)} {model_class.__name__} items",
+        data=response_data,
     ), 200
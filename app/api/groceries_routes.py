@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import date
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sqlalchemy.orm import Session
 
-from flask import Response, request
+from flask import Response, abort, request
 from flask_login import current_user
 
+import app.shared.datetime_.helpers as dth
 from app.api import api_bp
 from app.api.responses import api_response, validation_failed
-from app.modules.groceries.service import create_groceries_service
-from app.modules.groceries.validators import validate_product, validate_transaction
+from app.modules.groceries.service import (
+    PRICE_ANALYTICS_MAX_YEARS,
+    PRODUCT_SEARCH_MAX_RESULTS,
+    SPENDING_MAX_MONTHS,
+    GroceriesService,
+    create_groceries_service,
+)
+from app.modules.groceries.validators import (
+    validate_product,
+    validate_product_selection,
+    validate_receipt,
+    validate_transaction,
+)
 from app.shared.decorators import login_plus_session
 from app.shared.parsers_ import PRODUCT_SCHEMA, TRANSACTION_SCHEMA, parse_form
 
@@ -43,6 +58,127 @@ def products(session: Session, product_id: int | None = None) -> tuple[Response,
     ), status_code
 
 
+@api_bp.post("/groceries/products/bulk-delete")
+@login_plus_session
+def products_bulk_delete(session: Session) -> tuple[Response, int]:
+    """Soft-delete many products (by `ids` or `filter`) in one round trip."""
+    return _products_bulk(session, GroceriesService.bulk_soft_delete_products)
+
+
+@api_bp.post("/groceries/products/bulk-restore")
+@login_plus_session
+def products_bulk_restore(session: Session) -> tuple[Response, int]:
+    """Restore many soft-deleted products (by `ids` or `filter`) in one round trip."""
+    return _products_bulk(session, GroceriesService.bulk_restore_products)
+
+
+def _products_bulk(
+    session: Session,
+    apply: Callable[[GroceriesService, dict[str, Any]], dict[str, Any]],
+) -> tuple[Response, int]:
+    """Validates the product selection and runs `apply` on it."""
+    typed_data, errors = validate_product_selection(request.get_json(silent=True) or {})
+    if errors:
+        return validation_failed(errors), 400
+
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    result = apply(groceries_service, typed_data)
+
+    return api_response(
+        success=True, message=result["message"], data=result["data"]
+    ), 200
+
+
+@api_bp.get("/groceries/products/barcode/<barcode>")
+@login_plus_session
+def product_by_barcode(session: Session, barcode: str) -> tuple[Response, int]:
+    """Scan lookup, served from the per-user barcode cache when warm."""
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    product_data = groceries_service.lookup_barcode(barcode)
+    if product_data is None:
+        return api_response(success=False, message="Product not found"), 404
+
+    return api_response(
+        success=True, message="Product found", data=product_data
+    ), 200
+
+
+@api_bp.get("/groceries/products/search")
+@login_plus_session
+def product_search(session: Session) -> tuple[Response, int]:
+    """Typeahead for the transaction form: top-N products by name similarity/barcode prefix."""
+    limit = request.args.get("limit", default=10, type=int)
+    if limit is None or not 1 <= limit <= PRODUCT_SEARCH_MAX_RESULTS:
+        abort(400, description=f"Query parameter 'limit' must be an integer from 1 to {PRODUCT_SEARCH_MAX_RESULTS}.")
+
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    matches = groceries_service.search_products(request.args.get("q", ""), limit)
+
+    return api_response(
+        success=True, message=f"Found {len(matches)} products", data=matches
+    ), 200
+
+
+@api_bp.get("/groceries/spending/monthly")
+@login_plus_session
+def monthly_spending(session: Session) -> tuple[Response, int]:
+    """Spending per category per month (from rollups), defaulting to the trailing 12 months."""
+    try:
+        end_month = (
+            date.fromisoformat(f"{request.args['to']}-01")
+            if "to" in request.args
+            else dth.now_in_timezone(current_user.timezone).date().replace(day=1)
+        )
+        if "from" in request.args:
+            start_month = date.fromisoformat(f"{request.args['from']}-01")
+        else:
+            year, month = divmod(end_month.year * 12 + end_month.month - 12, 12)
+            start_month = date(year, month + 1, 1)  # 11 months before end_month
+    except ValueError:
+        abort(400, description="Query parameters 'from' and 'to' must be months (YYYY-MM).")
+    n_months = (end_month.year - start_month.year) * 12 + end_month.month - start_month.month + 1
+    if not 1 <= n_months <= SPENDING_MAX_MONTHS:
+        abort(400, description=f"Range must span 1 to {SPENDING_MAX_MONTHS} months, 'from' first.")
+
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    spending = groceries_service.get_monthly_spending(start_month, end_month)
+
+    return api_response(
+        success=True,
+        message=f"Retrieved spending for {len(spending['categories'])} categories",
+        data=spending,
+    ), 200
+
+
+@api_bp.get("/groceries/products/price-analytics")
+@login_plus_session
+def price_analytics(session: Session) -> tuple[Response, int]:
+    """Price-per-100g stats & monthly series per product, defaulting to the last 5 years."""
+    years = request.args.get("years", default=5, type=int)
+    if years is None or not 1 <= years <= PRICE_ANALYTICS_MAX_YEARS:
+        abort(400, description=f"Query parameter 'years' must be an integer from 1 to {PRICE_ANALYTICS_MAX_YEARS}.")
+    product_id = request.args.get("product_id", type=int)
+
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    analytics = groceries_service.get_price_analytics(years, product_id)
+
+    return api_response(
+        success=True,
+        message=f"Retrieved price analytics for {len(analytics['products'])} products",
+        data=analytics,
+    ), 200
+
+
 @api_bp.post("/groceries/transactions")
 @api_bp.put("/groceries/transactions/<int:transaction_id>")
 @login_plus_session
@@ -100,6 +236,27 @@ def transactions(
     ), status_code
 
 
+@api_bp.post("/groceries/receipts")
+@login_plus_session
+def receipts(session: Session) -> tuple[Response, int]:
+    typed_data, errors = validate_receipt(request.get_json(silent=True) or {})
+    if errors:
+        return validation_failed(errors), 400
+
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    result = groceries_service.ingest_receipt(typed_data["lines"])
+    if not result["success"]:
+        return api_response(
+            success=False, message=result["message"], errors=result["errors"]
+        ), 400
+
+    return api_response(
+        success=True, message=result["message"], data=result["data"]
+    ), 201
+
+
 @api_bp.post("/groceries/shopping-lists/items")
 @login_plus_session
 def add_shoppinglist_item(session: Session) -> tuple[Response, int]:
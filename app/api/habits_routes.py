@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
-from datetime import date
+from datetime import date, timedelta
 
 from flask import Response, abort, request
 from flask_login import current_user
@@ -13,8 +13,13 @@ from flask_login import current_user
 import app.shared.datetime_.helpers as dth
 from app.api import api_bp
 from app.api.responses import api_response, validation_failed
-from app.modules.habits.service import create_habits_service
-from app.modules.habits.validators import validate_habit, validate_leetcode_record
+from app.modules.habits import validation_constants as c
+from app.modules.habits.service import COMPLETION_BUCKETS, create_habits_service
+from app.modules.habits.validators import (
+    validate_completions_batch,
+    validate_habit,
+    validate_leetcode_record,
+)
 from app.shared.decorators import login_plus_session
 from app.shared.parsers_ import HABIT_SCHEMA, LEETCODE_SCHEMA, parse_form
 
@@ -60,9 +65,7 @@ def completions(session: Session, habit_id: int) -> tuple[Response, int]:
 
     if request.method == "POST":
         completed_at = dth.parse_js_instant(request.get_json()["completed_at"])
-        completion = habits_service.completion_repo.create_habit_completion(
-            habit_id, completed_at
-        )
+        completion = habits_service.add_completion(habit, completed_at)
 
         habits_service.session.flush()
         progress = habits_service.calculate_all_habits_percentage_this_week()
@@ -87,7 +90,7 @@ def completions(session: Session, habit_id: int) -> tuple[Response, int]:
         )
 
         if habit_completion:
-            habits_service.completion_repo.delete(habit_completion)
+            habits_service.remove_completion(habit, habit_completion)
             progress = habits_service.calculate_all_habits_percentage_this_week()
             return api_response(
                 success=True,
@@ -99,6 +102,31 @@ def completions(session: Session, habit_id: int) -> tuple[Response, int]:
     raise AssertionError(msg)
 
 
+@api_bp.post("/habits/completions/batch")
+@login_plus_session
+def completions_batch(session: Session) -> tuple[Response, int]:
+    typed_data, errors = validate_completions_batch(request.get_json(silent=True) or {})
+    if errors:
+        return validation_failed(errors), 400
+
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+
+    result = habits_service.add_completions_bulk(typed_data["completions"])
+    if not result["success"]:
+        return api_response(
+            success=False, message=result["message"], errors=result["errors"]
+        ), 404
+
+    progress = habits_service.calculate_all_habits_percentage_this_week()
+    return api_response(
+        success=True,
+        message=result["message"],
+        data=result["data"] | {"progress": progress},
+    ), 201
+
+
 @api_bp.get("/habits/completions/summary")
 @login_plus_session
 def horizontal_barchart(session: Session) -> tuple[Response, int]:
@@ -106,10 +134,22 @@ def horizontal_barchart(session: Session) -> tuple[Response, int]:
     if last_n_days is None:
         abort(400, description="Query parameter 'lastNDays' is required and must be an integer.")
 
-    start_utc, end_utc = dth.last_n_days_range(last_n_days, current_user.timezone)
     habits_service = create_habits_service(
         session, current_user.id, current_user.timezone
     )
+
+    bucket = request.args.get("bucket")
+    if bucket is not None:
+        if bucket not in COMPLETION_BUCKETS:
+            abort(400, description=f"Query parameter 'bucket' must be one of {', '.join(COMPLETION_BUCKETS)}.")
+        summary = habits_service.get_completion_summary_by_bucket(last_n_days, bucket)
+        return api_response(
+            success=True,
+            message=f"Retrieved completion counts per {bucket} for {len(summary['habits'])} habits",
+            data=summary,
+        ), 200
+
+    start_utc, end_utc = dth.last_n_days_range(last_n_days, current_user.timezone)
     aggregate_data = (
         habits_service.completion_repo.get_completion_counts_by_habit_in_window(
             start_utc, end_utc
@@ -125,6 +165,45 @@ def horizontal_barchart(session: Session) -> tuple[Response, int]:
     ), 200
 
 
+@api_bp.get("/habits/completions/heatmap")
+@login_plus_session
+def completions_heatmap(session: Session) -> tuple[Response, int]:
+    """Daily completion counts for a calendar heatmap, defaulting to the trailing year."""
+    try:
+        end_date = (
+            date.fromisoformat(request.args["to"])
+            if "to" in request.args
+            else dth.now_in_timezone(current_user.timezone).date()
+        )
+        start_date = (
+            date.fromisoformat(request.args["from"])
+            if "from" in request.args
+            else end_date - timedelta(days=364)
+        )
+    except ValueError:
+        abort(400, description="Query parameters 'from' and 'to' must be ISO dates (YYYY-MM-DD).")
+    if start_date > end_date:
+        abort(400, description="Query parameter 'from' must not be after 'to'.")
+    habit_id = request.args.get("habit_id", type=int)
+    if habit_id is None and "habit_id" in request.args:
+        return validation_failed({"habit_id": [c.HABIT_ID_INVALID]}), 400
+
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    heatmap = habits_service.get_completion_heatmap(start_date, end_date, habit_id)
+
+    return api_response(
+        success=True,
+        message=f"Retrieved {len(heatmap)} daily completion counts",
+        data={
+            "from": start_date.isoformat(),
+            "to": end_date.isoformat(),
+            "days": heatmap,
+        },
+    ), 200
+
+
 @api_bp.post("/habits/leetcode_records")
 @login_plus_session
 def leetcode_records(session: Session) -> tuple[Response, int]:
@@ -137,14 +216,23 @@ def leetcode_records(session: Session) -> tuple[Response, int]:
         session, current_user.id, current_user.timezone
     )
 
-    record = habits_service.leetcode_repo.create_leetcoderecord(
-        leetcode_id=typed_data["leetcode_id"],
-        title=typed_data.get("title"),
-        difficulty=typed_data["difficulty"],
-        language=typed_data["language"],
-        status=typed_data["status"],
-    )
+    record = habits_service.add_leetcode_record(typed_data)
 
     return api_response(
         success=True, message="LeetCode record added", data=record.to_api_dict()
     ), 201
+
+
+@api_bp.get("/habits/leetcode_records/stats")
+@login_plus_session
+def leetcode_stats(session: Session) -> tuple[Response, int]:
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    stats = habits_service.get_leetcode_stats()
+
+    return api_response(
+        success=True,
+        message=f"Retrieved stats for {stats['total']} LeetCode records",
+        data=stats,
+    ), 200
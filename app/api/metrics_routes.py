@@ -13,11 +13,20 @@ from flask_login import current_user
 
 import app.shared.datetime_.helpers as dth
 from app.api import api_bp
+from app.api.generic_routes import list_items
 from app.api.responses import api_response, validation_failed
+from app.modules.metrics.models import DailyMetrics
 from app.modules.metrics.service import create_metrics_service
 from app.modules.metrics.validators import validate_daily_entry
+from app.modules.metrics.viewmodels import DailyMetricPresenter
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import DAILY_METRICS_SCHEMA, parse_form
+from app.shared.parsers_ import (
+    DAILY_METRICS_SCHEMA,
+    get_page_params,
+    page_kwargs,
+    parse_form,
+)
+from app.shared.serialization import serialize_many
 
 logger = logging.getLogger(__name__)
 
@@ -81,18 +90,36 @@ def daily_metrics_timeseries(session: Session) -> tuple[Response, int]:
 @api_bp.get("/metrics/daily_metrics")
 @login_plus_session
 def daily_metrics_list(session: Session) -> tuple[Response, int]:
+    """
+    One page of entries; pass `next_cursor` back as `cursor` for the next one.
+
+    This static rule shadows the generic list route, so requests using its
+    `fields`/`filter` grammar are handed over to it (`lastNDays` doesn't apply there).
+    """
+    if "fields" in request.args or "filter" in request.args:
+        return list_items(session, DailyMetrics)
+
     last_n_days = request.args.get("lastNDays", 7, type=int)
+    page_params = get_page_params("entry_datetime", DailyMetricPresenter.sort_fields())
 
     metrics_service = create_metrics_service(
         session, current_user.id, current_user.timezone
     )
     start_utc, end_utc = dth.last_n_days_range(last_n_days, current_user.timezone)
-    result = metrics_service.daily_metrics_repo.get_all_daily_metrics_in_window(
-        start_utc, end_utc
+    result, next_cursor = (
+        metrics_service.daily_metrics_repo.get_daily_metrics_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=DailyMetricPresenter.sort_fields(),
+            **page_kwargs(page_params),
+        )
     )
 
     return api_response(
         success=True,
         message=f"Retrieved {len(result)} entries",
-        data=[entry.to_api_dict() for entry in result],
+        data={
+            "items": serialize_many(DailyMetrics, result),
+            "next_cursor": next_cursor,
+        },
     ), 200
@@ -1,6 +1,7 @@
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from flask import Response, jsonify
+from flask import Response, current_app, jsonify, stream_with_context
 
 ## Response wrappers
 
@@ -22,6 +23,31 @@ def api_response(
     )
 
 
+def api_stream_response(
+    batches: Iterable[list[dict[str, Any]]], *, message: Callable[[int], str]
+) -> Response:
+    """
+    Streams a successful `api_response` envelope, encoding `data` one batch at a time.
+
+    Only the current batch is ever held in memory. As the item count isn't known up front,
+    `message` is built from it once `data` is complete, and its key comes after `data`.
+    Errors raised mid-stream can't change the status, and truncate the body instead.
+    """
+    dumps = current_app.json.dumps
+
+    def generate() -> Iterator[str]:
+        yield '{"success":true,"data":['
+        count = 0
+        for batch in batches:
+            if not batch:
+                continue
+            yield ("," if count else "") + dumps(batch)[1:-1]
+            count += len(batch)
+        yield "]," + dumps({"message": message(count), "errors": None})[1:] + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
 def service_response(
     *,
     success: bool,
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from sqlalchemy.orm import Session
 
 import logging
@@ -11,12 +13,17 @@ from flask import Response, abort, request
 from flask_login import current_user
 
 import app.shared.datetime_.helpers as dth
+from app._infra.database import database_connection
 from app.api import api_bp
-from app.api.responses import api_response, validation_failed
+from app.api.responses import api_response, api_stream_response, validation_failed
+from app.modules.auth.service import typed_login_required
+from app.modules.time_tracking.models import TimeEntry
+from app.modules.time_tracking.repository import TimeEntryRepository
 from app.modules.time_tracking.service import create_time_tracking_service
 from app.modules.time_tracking.validators import validate_time_entry
 from app.shared.decorators import login_plus_session
 from app.shared.parsers_ import TIME_ENTRY_SCHEMA, parse_form
+from app.shared.serialization import serialize_many
 
 logger = logging.getLogger(__name__)
 
@@ -51,22 +58,25 @@ def time_entries(session: Session, entry_id: int | None = None) -> tuple[Respons
 
 
 @api_bp.get("/time_tracking/time_entries/summary")
-@login_plus_session
-def time_entries_summary(session: Session) -> tuple[Response, int]:
+@typed_login_required
+def time_entries_summary() -> tuple[Response, int]:
+    """Streamed, so memory stays flat however large `lastNDays` is (see `api_stream_response`)."""
     last_n_days = request.args.get("lastNDays", type=int)
     if last_n_days is None:
         abort(400, description="Query parameter 'lastNDays' is required and must be an integer.")
 
-    time_service = create_time_tracking_service(
-        session, current_user.id, current_user.timezone
-    )
+    user_id = current_user.id
     start_utc, end_utc = dth.last_n_days_range(last_n_days, current_user.timezone)
-    results = time_service.time_entry_repo.get_all_time_entries_in_window(
-        start_utc, end_utc
-    )
 
-    return api_response(
-        success=True,
-        message=f"Retrieved {len(results)} time entries",
-        data=[entry.to_api_dict() for entry in results],
+    def batches() -> Iterator[list[dict[str, Any]]]:
+        # Not a separate session: db_session() is the request's thread-local one. It stays
+        # usable because stream_with_context (see `api_stream_response`) keeps the request
+        # context alive, delaying the teardown's db_session.remove() until the stream ends
+        with database_connection() as session:
+            repo = TimeEntryRepository(session, user_id)
+            for rows in repo.iter_time_entry_rows_in_window(start_utc, end_utc):
+                yield serialize_many(TimeEntry, rows)
+
+    return api_stream_response(
+        batches(), message=lambda count: f"Retrieved {count} time entries"
     ), 200
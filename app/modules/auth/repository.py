@@ -38,3 +38,19 @@ class UsersRepository:
     def get_user_by_user_id(self, user_id: int) -> User | None:
         stmt = select(User).where(User.id == user_id)
         return self.session.execute(stmt).scalar_one_or_none()
+
+    def get_all_users(self) -> list[User]:
+        stmt = select(User).order_by(User.id)
+        return list(self.session.execute(stmt).scalars().all())
+
+    def get_users(self, user_id: int | None = None) -> list[User]:
+        """All users, or just `user_id`'s (if it exists). For per-user maintenance commands."""
+        if user_id is None:
+            return self.get_all_users()
+        user = self.get_user_by_user_id(user_id)
+        return [user] if user else []
+
+    def get_user_ids_after(self, after_id: int, limit: int) -> list[int]:
+        """Keyset-paginated user ids, for jobs that walk all users in batches."""
+        stmt = select(User.id).where(User.id > after_id).order_by(User.id).limit(limit)
+        return list(self.session.execute(stmt).scalars().all())
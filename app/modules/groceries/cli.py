@@ -0,0 +1,34 @@
+"""
+CLI commands for Groceries module.
+
+- `flask groceries rebuild-rollups` : Rebuild monthly spending-by-category rollups
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+import click
+from flask.cli import AppGroup
+
+from app._infra.database import with_db_session
+from app.modules.auth.repository import UsersRepository
+from app.modules.groceries.service import create_groceries_service
+
+groceries_cli = AppGroup("groceries", help="Groceries module maintenance commands.")
+
+
+@groceries_cli.command("rebuild-rollups")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user's rollups.")
+@with_db_session
+def rebuild_rollups(session: Session, user_id: int | None) -> None:
+    """Recompute monthly spending rollups in each user's current timezone."""
+    users = UsersRepository(session).get_users(user_id)
+
+    for user in users:
+        create_groceries_service(session, user.id, user.timezone).rebuild_spending_rollups()
+
+    click.echo(f"Rebuilt spending rollups for {len(users)} users.")
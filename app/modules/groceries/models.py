@@ -1,18 +1,21 @@
 # Handles DB models for grocery module
 import enum
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, ClassVar, Self
+from typing import ClassVar, Self
 
 from sqlalchemy import (
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -26,6 +29,7 @@ from app.modules.groceries.validation_constants import (
     PRICE_SCALE,
     PRODUCT_NAME_MAX_LENGTH,
     SHOPPING_LIST_NAME_MAX_LENGTH,
+    SPENDING_TOTAL_PRECISION,
 )
 from app.shared.serialization import APISerializable
 
@@ -71,6 +75,22 @@ class Product(Base, APISerializable):
         ),
         UniqueConstraint("user_id", "name", name="uq_user_product_name"),
         UniqueConstraint("user_id", "barcode", name="uq_user_product_barcode"),
+        # Scan lookups only ever want live products. Pattern ops so barcode prefix search
+        # (LIKE '123%') can use it too, regardless of the DB's collation
+        Index(
+            "ix_user_product_barcode_active",
+            "user_id",
+            "barcode",
+            postgresql_where=text("deleted_at IS NULL"),
+            postgresql_ops={"barcode": "varchar_pattern_ops"},
+        ),
+        # Typeahead search: similarity ranking & ILIKE '%q%' (needs the pg_trgm extension)
+        Index(
+            "ix_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
     name: Mapped[str] = mapped_column(String(PRODUCT_NAME_MAX_LENGTH), nullable=False)
@@ -112,11 +132,7 @@ class Transaction(Base, APISerializable):
     """Acts as 'instance of buying a given item'."""
 
     __api_exclude__: ClassVar[list[str]] = []
-
-    def to_api_dict(self) -> dict[str, Any]:
-        result = super().to_api_dict()
-        result["product_name"] = self.product.name
-        return result
+    __api_extras__: ClassVar[tuple[str, ...]] = ("product_name",)
 
     __table_args__ = (
         CheckConstraint("price_at_scan >= 0", name="ck_transaction_price_non_negative"),
@@ -155,6 +171,35 @@ class Transaction(Base, APISerializable):
         return f"<Transaction id={self.id} product_id={self.product_id}>"
 
 
+class SpendingMonthlyRollup(Base):
+    """
+    Spending (sum of price * quantity) & items bought per local month per product category, so
+    spending breakdowns read one row per month/category instead of joining every transaction.
+
+    Maintained by GroceriesService on every transaction create/increment/edit/delete. Months use
+    the user's timezone at write time; `flask groceries rebuild-rollups` recomputes from history.
+    """
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "month", "category", name="uq_user_spending_month_category"),
+    )
+
+    month: Mapped[date] = mapped_column(Date, nullable=False)
+
+    category: Mapped[ProductCategoryEnum] = mapped_column(
+        SAEnum(ProductCategoryEnum, name="product_category_enum"), nullable=False
+    )
+
+    total: Mapped[Decimal] = mapped_column(
+        Numeric(SPENDING_TOTAL_PRECISION, PRICE_SCALE), nullable=False, default=0
+    )
+
+    items: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<SpendingMonthlyRollup month={self.month} category={self.category} total={self.total}>"
+
+
 class ShoppingList(Base, APISerializable):
     """Provides entrypoint for working with shoppinglistitems for a given list."""
 
@@ -173,11 +218,7 @@ class ShoppingListItem(Base, APISerializable):
     """Items in the list. Effectively acts as a pointer to the actual product item itself."""
 
     __api_exclude__: ClassVar[list[str]] = []
-
-    def to_api_dict(self) -> dict[str, Any]:
-        result = super().to_api_dict()
-        result["product_name"] = self.product.name
-        return result
+    __api_extras__: ClassVar[tuple[str, ...]] = ("product_name",)
 
     __table_args__ = (
         CheckConstraint(
@@ -202,5 +243,9 @@ class ShoppingListItem(Base, APISerializable):
     shopping_list = relationship("ShoppingList", back_populates="items")
     product = relationship("Product")
 
+    @property
+    def product_name(self) -> str | None:
+        return self.product.name if self.product else None
+
     def __repr__(self) -> str:
         return f"<ShoppingListItem id={self.id} product={self.product.name!r} qty={self.quantity_wanted}>"
@@ -4,15 +4,38 @@ Repository layer for groceries module.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Collection, Sequence
+    from datetime import date, datetime
     from decimal import Decimal
 
+    from sqlalchemy import ColumnElement, Row, Select, SQLColumnExpression
     from sqlalchemy.orm import Session
 
 
+from sqlalchemy import (
+    Date,
+    Float,
+    Integer,
+    Numeric,
+    and_,
+    any_,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    type_coerce,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, insert
 from sqlalchemy.orm import joinedload
 
 from app.modules.groceries.models import (
@@ -20,9 +43,11 @@ from app.modules.groceries.models import (
     ProductCategoryEnum,
     ShoppingList,
     ShoppingListItem,
+    SpendingMonthlyRollup,
     Transaction,
     UnitEnum,
 )
+from app.modules.groceries.validation_constants import PRICE_PRECISION, PRICE_SCALE
 from app.shared.repository.base import BaseRepository
 
 
@@ -71,12 +96,139 @@ class ProductRepository(BaseRepository[Product]):
             stmt = stmt.where(Product.deleted_at.is_(None))
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_products_page_in_window(
+        self, start_utc: datetime, end_utc: datetime, **page: Any  # noqa: ANN401
+    ) -> tuple[list[Product], str | None]:
+        """One sorted page of active products created in the window (see `BaseRepository.get_page`)."""
+        stmt = self._user_select(Product).where(
+            Product.created_at >= start_utc,
+            Product.created_at < end_utc,
+            Product.deleted_at.is_(None),
+        )
+        return self.get_page(stmt, **page)
+
     def get_product_by_barcode(self, barcode: str) -> Product | None:
         stmt = self._user_select(Product).where(
             Product.barcode == barcode, Product.deleted_at.is_(None)
         )
         return self.session.execute(stmt).scalars().first()
 
+    def get_products_matching_any(
+        self,
+        product_ids: Collection[int],
+        barcodes: Collection[str],
+        names: Collection[str],
+    ) -> list[Product]:
+        """
+        Returns the user's products (soft-deleted included) matching any id, barcode or name,
+        in one IN query. Callers filter out soft-deleted rows; they still matter for the
+        name/barcode unique constraints.
+        """
+        stmt = self._user_select(Product).where(
+            or_(
+                Product.id.in_(product_ids),
+                Product.barcode.in_(barcodes),
+                Product.name.in_(names),
+            )
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    def search_products(
+        self, query: str, limit: int
+    ) -> Sequence[Row[tuple[int, str, str, datetime]]]:
+        """
+        Typeahead matches for `query` on name (trigram similarity/substring) or barcode prefix.
+
+        Ranked live-first, then by match score, then by most recent purchase. Returns
+        (id, name, barcode, deleted_at) rows. A blank query returns the most recently bought.
+        """
+        last_bought = (
+            select(func.max(Transaction.created_at))
+            .where(Transaction.product_id == Product.id)
+            .scalar_subquery()
+        )
+        stmt = select(Product.id, Product.name, Product.barcode, Product.deleted_at).where(
+            Product.user_id == self.user_id
+        )
+        order_by: list[ColumnElement[Any]] = [Product.deleted_at.is_not(None)]
+
+        if query:
+            barcode_prefix = Product.barcode.startswith(query, autoescape=True)
+            stmt = stmt.where(
+                or_(
+                    Product.name.op("%")(query),
+                    Product.name.icontains(query, autoescape=True),
+                    barcode_prefix,
+                )
+            )
+            score = func.greatest(
+                func.similarity(Product.name, query), case((barcode_prefix, 1.0), else_=0.0)
+            )
+            order_by.append(score.desc())
+
+        order_by += [last_bought.desc().nulls_last(), Product.name.asc()]
+        return self.session.execute(stmt.order_by(*order_by).limit(limit)).all()
+
+    def soft_delete_products(
+        self,
+        ids: Collection[int] | None = None,
+        *,
+        category: ProductCategoryEnum | None = None,
+        not_bought_since_utc: datetime | None = None,
+    ) -> list[int]:
+        """Soft-delete the selected live products in one UPDATE. Returns the deleted ids."""
+        stmt = (
+            update(Product)
+            .where(
+                Product.deleted_at.is_(None),
+                *self._selection_criteria(ids, category, not_bought_since_utc),
+            )
+            .values(deleted_at=func.now())
+            .returning(Product.id)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    def restore_products(
+        self,
+        ids: Collection[int] | None = None,
+        *,
+        category: ProductCategoryEnum | None = None,
+        not_bought_since_utc: datetime | None = None,
+    ) -> list[int]:
+        """Restore the selected soft-deleted products in one UPDATE. Returns the restored ids."""
+        stmt = (
+            update(Product)
+            .where(
+                Product.deleted_at.is_not(None),
+                *self._selection_criteria(ids, category, not_bought_since_utc),
+            )
+            .values(deleted_at=None)
+            .returning(Product.id)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    def _selection_criteria(
+        self,
+        ids: Collection[int] | None,
+        category: ProductCategoryEnum | None,
+        not_bought_since_utc: datetime | None,
+    ) -> list[ColumnElement[bool]]:
+        """WHERE clauses for a bulk selection: the user's products by id list and/or filter."""
+        criteria = [Product.user_id == self.user_id]
+        if ids is not None:
+            # One array bind (`= ANY(:ids)`) rather than an IN list of thousands of params
+            criteria.append(Product.id == any_(literal(list(ids), ARRAY(Integer))))
+        if category is not None:
+            criteria.append(Product.category == category)
+        if not_bought_since_utc is not None:
+            criteria.append(
+                ~exists().where(
+                    Transaction.product_id == Product.id,
+                    Transaction.created_at >= not_bought_since_utc,
+                )
+            )
+        return criteria
+
     def get_product_by_name(self, name: str) -> Product | None:
         stmt = self._user_select(Product).where(
             Product.name == name, Product.deleted_at.is_(None)
@@ -107,13 +259,57 @@ class TransactionRepository(BaseRepository[Transaction]):
     def get_all_transactions_in_window(
         self, start_utc: datetime, end_utc: datetime
     ) -> list[Transaction]:
-        """"""
-        stmt = self._user_select(Transaction).where(
-            Transaction.created_at >= start_utc,
-            Transaction.created_at < end_utc,
+        """Get transactions created within [start_utc, end_utc) with eager-loaded products."""
+        stmt = (
+            self._user_select(Transaction)
+            .options(joinedload(Transaction.product))
+            .where(
+                Transaction.created_at >= start_utc,
+                Transaction.created_at < end_utc,
+            )
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_table_rows_in_window(
+        self, start_utc: datetime, end_utc: datetime
+    ) -> Sequence[Row[Any]]:
+        """
+        Flat rows for the dashboard transactions table, created within [start_utc, end_utc).
+
+        Selects only the displayed columns plus product name, barcode & net weight in one joined
+        statement. Rows aren't ORM instances, so there's no identity-map or lazy-load cost.
+        """
+        return self.session.execute(self._table_rows_in_window(start_utc, end_utc)).all()
+
+    def get_table_page_in_window(
+        self, start_utc: datetime, end_utc: datetime, **page: Any  # noqa: ANN401
+    ) -> tuple[list[Row[Any]], str | None]:
+        """One sorted page of `get_table_rows_in_window` (see `BaseRepository.get_page`)."""
+        return self.get_page(self._table_rows_in_window(start_utc, end_utc), **page)
+
+    def _sort_expressions(self) -> dict[str, SQLColumnExpression[Any]]:
+        return {"product_name": Product.name, "price_per_100g": self._price_per_100g()}
+
+    def _table_rows_in_window(self, start_utc: datetime, end_utc: datetime) -> Select[Any]:
+        return (
+            select(
+                Transaction.id,
+                Transaction.product_id,
+                Transaction.price_at_scan,
+                Transaction.quantity,
+                Transaction.created_at,
+                Product.name.label("product_name"),
+                Product.barcode,
+                Product.net_weight,
+            )
+            .join(Product, Transaction.product_id == Product.id)
+            .where(
+                Transaction.user_id == self.user_id,
+                Transaction.created_at >= start_utc,
+                Transaction.created_at < end_utc,
+            )
+        )
+
     def get_transaction_in_window(
         self, product_id: int, start_utc: datetime, end_utc: datetime
     ) -> Transaction | None:
@@ -125,6 +321,134 @@ class TransactionRepository(BaseRepository[Transaction]):
         )
         return self.session.execute(stmt).scalars().first()
 
+    def merge_daily_lines(
+        self,
+        lines: list[tuple[int, Decimal, int]],
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> int:
+        """
+        Upsert (product_id, price_at_scan, quantity) lines in one statement: lines matching a
+        transaction in the window with the same product & price add to its quantity, the rest
+        are inserted. Lines must be unique per (product_id, price_at_scan).
+
+        Returns the number of transactions inserted.
+        """
+        if not lines:
+            return 0
+        line_rows = values(
+            column("product_id", Integer),
+            column("price", Numeric(PRICE_PRECISION, PRICE_SCALE)),
+            column("qty", Integer),
+            name="lines",
+        ).data(lines)
+
+        # Oldest matching transaction per (product, price) absorbs the line
+        targets = (
+            select(Transaction.id, line_rows.c.qty)
+            .join(
+                line_rows,
+                and_(
+                    Transaction.product_id == line_rows.c.product_id,
+                    Transaction.price_at_scan == line_rows.c.price,
+                ),
+            )
+            .where(
+                Transaction.user_id == self.user_id,
+                Transaction.created_at >= start_utc,
+                Transaction.created_at < end_utc,
+            )
+            .distinct(Transaction.product_id, Transaction.price_at_scan)
+            .order_by(Transaction.product_id, Transaction.price_at_scan, Transaction.id)
+            .cte("targets")
+        )
+        merged = (
+            update(Transaction)
+            .where(Transaction.id == targets.c.id)
+            # SQL-side updated_at, a Python onupdate can't be prefetched for a nested UPDATE
+            .values(quantity=Transaction.quantity + targets.c.qty, updated_at=func.now())
+            .returning(Transaction.product_id, Transaction.price_at_scan)
+            .cte("merged")
+        )
+        new_lines = select(
+            literal(self.user_id), line_rows.c.product_id, line_rows.c.price, line_rows.c.qty
+        ).where(
+            ~exists().where(
+                merged.c.product_id == line_rows.c.product_id,
+                merged.c.price_at_scan == line_rows.c.price,
+            )
+        )
+        stmt = (
+            insert(Transaction)
+            .from_select(["user_id", "product_id", "price_at_scan", "quantity"], new_lines)
+            .returning(Transaction.id)
+        )
+        return len(self.session.execute(stmt).all())
+
+    def get_price_stats_by_product(
+        self, start_utc: datetime, end_utc: datetime, product_id: int | None = None
+    ) -> list[tuple[int, str, int, Decimal, float, Decimal, Decimal, float | None]]:
+        """
+        Per-product price-per-100g stats in [start_utc, end_utc), in one joined, grouped query.
+
+        Returns (product_id, name, count, min, median, max, latest, trend_per_year) tuples,
+        where trend is the least-squares slope of price-per-100g over time (None if < 2 points).
+        """
+        ppg = self._price_per_100g()
+        years = func.extract("epoch", Transaction.created_at) / (365.25 * 86400)
+        stmt = (
+            select(
+                Product.id,
+                Product.name,
+                func.count(Transaction.id),
+                func.min(ppg),
+                # Typed as the ordering column by default, which would round to its scale
+                type_coerce(func.percentile_cont(0.5).within_group(ppg), Float),
+                func.max(ppg),
+                func.array_agg(aggregate_order_by(ppg, Transaction.created_at.desc()))[1],
+                func.regr_slope(ppg, years),
+            )
+            .select_from(Transaction)
+            .join(Product, Transaction.product_id == Product.id)
+            .where(
+                Transaction.user_id == self.user_id,
+                Transaction.created_at >= start_utc,
+                Transaction.created_at < end_utc,
+            )
+            .group_by(Product.id, Product.name)
+            .order_by(Product.name)
+        )
+        if product_id is not None:
+            stmt = stmt.where(Product.id == product_id)
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def get_monthly_price_per_100g(
+        self, start_utc: datetime, end_utc: datetime, tz_str: str, product_id: int | None = None
+    ) -> list[tuple[int, date, Decimal]]:
+        """Returns (product_id, local_month_start, avg price-per-100g) tuples in [start_utc, end_utc)."""
+        month = cast(
+            func.date_trunc("month", func.timezone(tz_str, Transaction.created_at)), Date
+        ).label("month")
+        stmt = (
+            select(Transaction.product_id, month, func.avg(self._price_per_100g()))
+            .join(Product, Transaction.product_id == Product.id)
+            .where(
+                Transaction.user_id == self.user_id,
+                Transaction.created_at >= start_utc,
+                Transaction.created_at < end_utc,
+            )
+            .group_by(Transaction.product_id, month)
+            .order_by(Transaction.product_id, month)
+        )
+        if product_id is not None:
+            stmt = stmt.where(Transaction.product_id == product_id)
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    @staticmethod
+    def _price_per_100g() -> ColumnElement[Decimal]:
+        """SQL counterpart of `Transaction.price_per_100g` (needs Product joined)."""
+        return Transaction.price_at_scan / func.nullif(Product.net_weight, 0) * 100
+
 
 class ShoppingListRepository(BaseRepository[ShoppingList]):
     def __init__(self, session: Session, user_id: int) -> None:
@@ -155,6 +479,14 @@ class ShoppingListItemRepository(BaseRepository[ShoppingListItem]):
         )
         return self.add(shopping_list_item)
 
+    def delete_items_for_products(self, product_ids: Collection[int]) -> int:
+        """Delete the user's list items pointing at any of `product_ids` in one DELETE."""
+        stmt = delete(ShoppingListItem).where(
+            ShoppingListItem.user_id == self.user_id,
+            ShoppingListItem.product_id == any_(literal(list(product_ids), ARRAY(Integer))),
+        )
+        return self.session.execute(stmt).rowcount  # type: ignore[attr-defined, no-any-return]
+
     def get_shopping_list_item(
         self, shopping_list_id: int, product_id: int
     ) -> ShoppingListItem | None:
@@ -163,3 +495,93 @@ class ShoppingListItemRepository(BaseRepository[ShoppingListItem]):
             ShoppingListItem.product_id == product_id,
         )
         return self.session.execute(stmt).scalars().first()
+
+
+class SpendingMonthlyRollupRepository(BaseRepository[SpendingMonthlyRollup]):
+    def __init__(self, session: Session, user_id: int) -> None:
+        super().__init__(session, user_id, model_cls=SpendingMonthlyRollup)
+
+    def get_monthly_spending(
+        self, start_month: date, end_month: date
+    ) -> list[tuple[date, ProductCategoryEnum, Decimal, int]]:
+        """Returns (month, category, total, items) rows for an inclusive range of month starts."""
+        stmt = (
+            select(
+                SpendingMonthlyRollup.month,
+                SpendingMonthlyRollup.category,
+                SpendingMonthlyRollup.total,
+                SpendingMonthlyRollup.items,
+            )
+            .where(
+                SpendingMonthlyRollup.user_id == self.user_id,
+                SpendingMonthlyRollup.month.between(start_month, end_month),
+            )
+            .order_by(SpendingMonthlyRollup.category, SpendingMonthlyRollup.month)
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def add_spending(
+        self, rows: list[tuple[date, ProductCategoryEnum, Decimal, int]]
+    ) -> None:
+        """
+        Upsert +total/+items for many (month, category, total, items) rows in one statement.
+
+        Deltas may be negative (edits, deletes); rows left with no items are dropped. Callers
+        pass at most one row per (month, category), as Postgres can't upsert a row twice.
+        """
+        if not rows:
+            return
+        stmt = insert(SpendingMonthlyRollup).values(
+            [
+                {
+                    "user_id": self.user_id,
+                    "month": month,
+                    "category": category,
+                    "total": total,
+                    "items": items,
+                }
+                for month, category, total, items in rows
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_spending_month_category",
+            set_={
+                # Subscript: `.items` on a column collection is its dict-like method
+                "total": SpendingMonthlyRollup.total + stmt.excluded.total,
+                "items": SpendingMonthlyRollup.items + stmt.excluded["items"],
+            },
+        )
+        self.session.execute(stmt)
+        if any(items < 0 for *_, items in rows):
+            self.session.execute(
+                delete(SpendingMonthlyRollup).where(
+                    SpendingMonthlyRollup.user_id == self.user_id,
+                    SpendingMonthlyRollup.items <= 0,
+                )
+            )
+
+    def rebuild(self, tz_str: str) -> None:
+        """Replace the user's rollups with sums from transaction history."""
+        month = cast(
+            func.date_trunc("month", func.timezone(tz_str, Transaction.created_at)), Date
+        )
+        sums_stmt = (
+            select(
+                Transaction.user_id,
+                month,
+                Product.category,
+                func.sum(Transaction.price_at_scan * Transaction.quantity),
+                func.sum(Transaction.quantity),
+            )
+            .join(Product, Transaction.product_id == Product.id)
+            .where(Transaction.user_id == self.user_id)
+            .group_by(Transaction.user_id, month, Product.category)
+        )
+        self.session.execute(
+            delete(SpendingMonthlyRollup).where(SpendingMonthlyRollup.user_id == self.user_id)
+        )
+        self.session.execute(
+            insert(SpendingMonthlyRollup).from_select(
+                ["user_id", "month", "category", "total", "items"], sums_stmt
+            )
+        )
@@ -13,10 +13,9 @@ from app.modules.groceries.viewmodels import (
     TransactionPresenter,
     TransactionViewModel,
 )
-from app.shared.collection_utils import sort_by_field
 from app.shared.datetime_.helpers import last_n_days_range
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import get_table_params
+from app.shared.parsers_ import get_table_params, page_kwargs
 
 groceries_bp = Blueprint(
     "groceries", __name__, template_folder="templates", url_prefix="/groceries"
@@ -30,39 +29,38 @@ def dashboard(session: "Session") -> tuple[str, int]:
         session, current_user.id, current_user.timezone
     )
 
-    transactions_params = get_table_params("transactions", "created_at")
+    transactions_params = get_table_params(
+        "transactions", "created_at", TransactionPresenter.sort_fields()
+    )
     start_utc, end_utc = last_n_days_range(
         transactions_params["range"], current_user.timezone
     )
-    transactions = groceries_service.transaction_repo.get_all_transactions_in_window(
-        start_utc, end_utc
-    )
-    transactions = sort_by_field(
-        transactions, transactions_params["sort_by"], transactions_params["order"]
+    transaction_rows, transactions_params["next_cursor"] = (
+        groceries_service.transaction_repo.get_table_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=TransactionPresenter.sort_fields(),
+            **page_kwargs(transactions_params),
+        )
     )
     transactions_for_table = [
-        TransactionViewModel(t, current_user.timezone) for t in transactions
+        TransactionViewModel(row, current_user.timezone) for row in transaction_rows
     ]
 
-    products_params = get_table_params("products", "name")
+    products_params = get_table_params("products", "name", ProductPresenter.sort_fields())
     start_utc, end_utc = last_n_days_range(
         products_params["range"], current_user.timezone
     )
-
-    products_for_dropdown = groceries_service.product_repo.get_all_products(
-        include_soft_deleted=True
+    active_products, products_params["next_cursor"] = (
+        groceries_service.product_repo.get_products_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=ProductPresenter.sort_fields(),
+            **page_kwargs(products_params),
+        )
     )
-    products_for_dropdown = sort_by_field(products_for_dropdown, "name", "asc")
-
-    active_products_for_table = (
-        groceries_service.product_repo.get_all_products_in_window(start_utc, end_utc)
-    )
-    active_products_for_table = sort_by_field(
-        active_products_for_table, products_params["sort_by"], products_params["order"]
-    )
-
     products_for_table = [
-        ProductViewModel(p, current_user.timezone) for p in active_products_for_table
+        ProductViewModel(p, current_user.timezone) for p in active_products
     ]
 
     shopping_list, _ = groceries_service.get_or_create_shoppinglist()
@@ -76,7 +74,6 @@ def dashboard(session: "Session") -> tuple[str, int]:
         "d_transactions_params": transactions_params,
         "l_transaction_headers": TransactionPresenter.build_columns(),
         "l_transactions_for_table": transactions_for_table,
-        "l_products_for_dropdown": products_for_dropdown,
         "d_products_params": products_params,
         "l_product_headers": ProductPresenter.build_columns(),
         "l_products_for_table": products_for_table,
@@ -4,25 +4,44 @@ Service layer for Groceries module.
 
 from __future__ import annotations
 
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
-    from app.modules.groceries.models import Product
+    from app.modules.auth.models import User
+    from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction
 
+import app.shared.datetime_.helpers as dth
 from app.api.responses import service_response
+from app.extensions import cache
 from app.modules.groceries.repository import (
     ProductRepository,
     ShoppingListItemRepository,
     ShoppingListRepository,
+    SpendingMonthlyRollupRepository,
     TransactionRepository,
 )
 from app.shared.datetime_.helpers import today_range_utc
+from app.shared.hooks import register_delete_hook, register_patch_hook
+
+# Barcode -> product cache keys are namespaced by a per-user generation, so any product write
+# invalidates all of that user's entries with one new generation (no need to know old barcodes).
+# Generations are timestamps, never reused, so an evicted generation key can't revive old entries
+BARCODE_CACHE_GEN_KEY = "product_barcode_gen:{user_id}"
+BARCODE_CACHE_KEY = "product_barcode:{user_id}:{gen}:{barcode}"
+BARCODE_CACHE_GEN_TIMEOUT = 24 * 60 * 60  # Outlives entries (default timeout), for hit rate only
+
+PRICE_ANALYTICS_MAX_YEARS = 10
+PRODUCT_SEARCH_MAX_RESULTS = 50
+SPENDING_MAX_MONTHS = 120
 
 
 class GroceriesService:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session: Session,
         user_tz: str,
@@ -30,12 +49,14 @@ class GroceriesService:
         transaction_repo: TransactionRepository,
         shopping_list_repo: ShoppingListRepository,
         shopping_list_item_repo: ShoppingListItemRepository,
+        spending_repo: SpendingMonthlyRollupRepository,
     ) -> None:
         self.session = session
         self.product_repo = product_repo
         self.transaction_repo = transaction_repo
         self.shopping_list_repo = shopping_list_repo
         self.shopping_list_item_repo = shopping_list_item_repo
+        self.spending_repo = spending_repo
         self.user_tz = user_tz
 
     def save_product(self, typed_data: dict[str, Any], product_id: int | None) -> Any:
@@ -44,10 +65,17 @@ class GroceriesService:
             if not product:
                 return service_response(success=False, message="Product not found")
 
+            category_changed = typed_data.get("category", product.category) != product.category
+
             # Update fields
             for field, value in typed_data.items():
                 setattr(product, field, value)
 
+            self.invalidate_barcode_cache()
+            if category_changed:
+                # Moves all of the product's past spending to another category
+                self.session.flush()
+                self.rebuild_spending_rollups()
             return service_response(
                 success=True, message="Product updated", data={"product": product}
             )
@@ -68,6 +96,48 @@ class GroceriesService:
                 success=True, message="Product created", data={"product": product}
             )
 
+    def bulk_soft_delete_products(self, selection: dict[str, Any]) -> dict[str, Any]:
+        """
+        Soft-delete products by id list or filter (see `validate_product_selection()`).
+
+        One UPDATE for the products plus one DELETE for their shopping list items, whatever
+        the selection size.
+        """
+        deleted_ids = self.product_repo.soft_delete_products(
+            **self._selection_kwargs(selection)
+        )
+        items_deleted = 0
+        if deleted_ids:
+            items_deleted = self.shopping_list_item_repo.delete_items_for_products(deleted_ids)
+            self.invalidate_barcode_cache()
+
+        return service_response(
+            success=True,
+            message=f"Deleted {len(deleted_ids)} products",
+            data={"deleted": len(deleted_ids), "shopping_list_items_deleted": items_deleted},
+        )
+
+    def bulk_restore_products(self, selection: dict[str, Any]) -> dict[str, Any]:
+        """Restore soft-deleted products by id list or filter, in one UPDATE."""
+        restored_ids = self.product_repo.restore_products(**self._selection_kwargs(selection))
+        if restored_ids:
+            self.invalidate_barcode_cache()
+
+        return service_response(
+            success=True,
+            message=f"Restored {len(restored_ids)} products",
+            data={"restored": len(restored_ids)},
+        )
+
+    def _selection_kwargs(self, selection: dict[str, Any]) -> dict[str, Any]:
+        """Typed selection -> repo kwargs, with `not_bought_since` as the local day's UTC start."""
+        kwargs = {k: v for k, v in selection.items() if k != "not_bought_since"}
+        if "not_bought_since" in selection:
+            kwargs["not_bought_since_utc"], _ = dth.day_range_utc(
+                selection["not_bought_since"], self.user_tz
+            )
+        return kwargs
+
     def save_transaction(
         self,
         product_id: int,
@@ -82,9 +152,17 @@ class GroceriesService:
             if not transaction:
                 return service_response(success=False, message="Transaction not found")
 
+            old_amount = transaction.price_at_scan * transaction.quantity
+            old_quantity = transaction.quantity
             for field, value in typed_data.items():
                 setattr(transaction, field, value)
 
+            self._record_spending(
+                transaction.product,
+                self._spending_month(transaction.created_at),
+                transaction.price_at_scan * transaction.quantity - old_amount,
+                transaction.quantity - old_quantity,
+            )
             return service_response(
                 success=True,
                 message="Transaction updated",
@@ -111,10 +189,233 @@ class GroceriesService:
             )
             self.session.flush()
 
+        self._record_spending(
+            product,
+            self._spending_month(dth.now_utc()),
+            typed_data["price_at_scan"] * typed_data["quantity"],
+            typed_data["quantity"],
+        )
+
         return service_response(
             success=True, message="Transaction added", data={"transaction": transaction}
         )
 
+    def ingest_receipt(self, lines: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Add a whole receipt of validated lines (see `validate_receipt()`) at once.
+
+        Resolves every product id/barcode in one IN query, creates unknown barcodes' products
+        in one flush, then merges lines into today's transactions (same product & price adds
+        to quantity, like `save_transaction()`) with a single upsert statement.
+        """
+        product_ids = {line["product_id"] for line in lines if line["product_id"]}
+        barcodes = {line["barcode"] for line in lines if line["barcode"]}
+        new_names = {line["product"]["name"] for line in lines if line["product"]}
+        existing = self.product_repo.get_products_matching_any(
+            product_ids, barcodes, new_names
+        )
+        live_by_id = {p.id: p for p in existing if p.deleted_at is None}
+        live_by_barcode = {p.barcode: p for p in live_by_id.values() if p.barcode}
+        taken_barcodes = {p.barcode for p in existing}
+        taken_names = {p.name for p in existing}
+
+        errors: dict[str, list[str]] = {}
+        new_product_data: dict[str, dict[str, Any]] = {}
+        for i, line in enumerate(lines):
+            if line["product_id"]:
+                found = line["product_id"] in live_by_id
+            else:
+                barcode, product_data = line["barcode"], line["product"]
+                found = barcode in live_by_barcode or barcode in new_product_data
+                if not found and product_data:
+                    if barcode in taken_barcodes or product_data["name"] in taken_names:
+                        errors[f"lines[{i}]"] = ["Barcode or product name already in use"]
+                        continue
+                    new_product_data[barcode] = product_data
+                    taken_names.add(product_data["name"])
+                    found = True
+            if not found:
+                errors[f"lines[{i}]"] = ["Product not found"]
+
+        if errors:
+            return service_response(
+                success=False, message="Receipt has unknown products", errors=errors
+            )
+
+        for barcode, product_data in new_product_data.items():
+            live_by_barcode[barcode] = self.product_repo.create_product(**product_data)
+        if new_product_data:
+            self.session.flush()
+
+        resolved = [
+            (
+                live_by_id[line["product_id"]]
+                if line["product_id"]
+                else live_by_barcode[line["barcode"]],
+                line,
+            )
+            for line in lines
+        ]
+
+        # Same product & price on one receipt collapse into one line
+        quantities: dict[tuple[int, Decimal], int] = {}
+        for product, line in resolved:
+            key = (product.id, line["price_at_scan"])
+            quantities[key] = quantities.get(key, 0) + line["quantity"]
+
+        start_utc, end_utc = today_range_utc(self.user_tz)
+        created = self.transaction_repo.merge_daily_lines(
+            [(p_id, price, qty) for (p_id, price), qty in quantities.items()],
+            start_utc,
+            end_utc,
+        )
+
+        self._record_receipt_spending(resolved, self._spending_month(start_utc))
+
+        return service_response(
+            success=True,
+            message=f"Receipt added ({len(lines)} lines)",
+            data={
+                "lines": len(lines),
+                "products_created": len(new_product_data),
+                "transactions_created": created,
+                "transactions_merged": len(quantities) - created,
+            },
+        )
+
+    def get_monthly_spending(self, start_month: date, end_month: date) -> dict[str, Any]:
+        """
+        Spending & items bought per category per local month, columnar, read from the rollups.
+
+        Shape: `{"months": ["YYYY-MM-01", ...], "categories": [...], "totals": [[...]],
+        "items": [[...]]}` where `totals[i][j]` is category i's spending in month j. Months
+        are contiguous (empty ones are 0), and categories without spending are omitted.
+        """
+        n_months = (end_month.year - start_month.year) * 12 + end_month.month - start_month.month + 1
+        months = self._month_starts(end_month, n_months)
+        month_index = {m: i for i, m in enumerate(months)}
+
+        rows = self.spending_repo.get_monthly_spending(months[0], months[-1])
+        categories: list[str] = []
+        totals: list[list[float]] = []
+        items: list[list[int]] = []
+        for month, category, total, item_count in rows:
+            if not categories or categories[-1] != category.value:
+                categories.append(category.value)
+                totals.append([0.0] * len(months))
+                items.append([0] * len(months))
+            totals[-1][month_index[month]] = float(total)
+            items[-1][month_index[month]] = item_count
+
+        return {
+            "months": [m.isoformat() for m in months],
+            "categories": categories,
+            "totals": totals,
+            "items": items,
+        }
+
+    def rebuild_spending_rollups(self) -> None:
+        """
+        Recompute monthly spending rollups from transaction history in the user's timezone.
+
+        Used by the `flask groceries rebuild-rollups` repair command, and whenever edits can
+        move spending between arbitrary months/categories.
+        """
+        self.spending_repo.rebuild(self.user_tz)
+
+    def sync_deleted_transaction(self, transaction: Transaction) -> None:
+        """Take a (just deleted) transaction's spending back out of its month's rollup."""
+        self._record_spending(
+            transaction.product,
+            self._spending_month(transaction.created_at),
+            -(transaction.price_at_scan * transaction.quantity),
+            -transaction.quantity,
+        )
+
+    def _record_receipt_spending(
+        self, resolved: list[tuple[Product, dict[str, Any]]], month: date
+    ) -> None:
+        """Add a receipt's lines to the month's rollups, one upserted row per category."""
+        spending: dict[ProductCategoryEnum, tuple[Decimal, int]] = {}
+        for product, line in resolved:
+            total, items = spending.get(product.category, (Decimal(0), 0))
+            spending[product.category] = (
+                total + line["price_at_scan"] * line["quantity"],
+                items + line["quantity"],
+            )
+        self.spending_repo.add_spending(
+            [(month, category, total, items) for category, (total, items) in spending.items()]
+        )
+
+    def _record_spending(
+        self, product: Product, month: date, total: Decimal, items: int
+    ) -> None:
+        if total or items:
+            self.spending_repo.add_spending([(month, product.category, total, items)])
+
+    def _spending_month(self, dt: datetime) -> date:
+        """First day of `dt`'s month in the user's timezone (the rollups' bucket key)."""
+        return dth.convert_to_timezone(self.user_tz, dt).date().replace(day=1)
+
+    def get_price_analytics(
+        self, years: int, product_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Price-per-100g stats and monthly series per product over the last N years, for charting.
+
+        Shape: `{"months": ["YYYY-MM-01", ...], "products": [{"id", "name", "count", "min",
+        "median", "max", "latest", "trend_per_year", "series": [...]}]}` where `series[j]` is
+        the average price-per-100g in month j (None if not bought that month). Two queries total
+        regardless of history size; products without a net weight are skipped.
+        """
+        today = dth.now_in_timezone(self.user_tz).date()
+        months = self._month_starts(today, years * 12)
+        start_utc, _ = dth.day_range_utc(months[0], self.user_tz)
+        # Bounded above too: future-dated transactions (eg, via PATCH) fall outside `months`
+        next_month = (months[-1] + timedelta(days=31)).replace(day=1)
+        end_utc, _ = dth.day_range_utc(next_month, self.user_tz)
+
+        stats = self.transaction_repo.get_price_stats_by_product(
+            start_utc, end_utc, product_id
+        )
+        monthly = self.transaction_repo.get_monthly_price_per_100g(
+            start_utc, end_utc, self.user_tz, product_id
+        )
+
+        month_index = {m: i for i, m in enumerate(months)}
+        series: dict[int, list[float | None]] = {}
+        for p_id, month, avg_ppg in monthly:
+            if avg_ppg is None:
+                continue
+            series.setdefault(p_id, [None] * len(months))[month_index[month]] = _round(avg_ppg)
+
+        products = [
+            {
+                "id": p_id,
+                "name": name,
+                "count": count,
+                "min": _round(min_ppg),
+                "median": _round(median_ppg),
+                "max": _round(max_ppg),
+                "latest": _round(latest_ppg),
+                "trend_per_year": _round(trend) if trend is not None else None,
+                "series": series[p_id],
+            }
+            for p_id, name, count, min_ppg, median_ppg, max_ppg, latest_ppg, trend in stats
+            if p_id in series
+        ]
+        return {"months": [m.isoformat() for m in months], "products": products}
+
+    @staticmethod
+    def _month_starts(last: date, n_months: int) -> list[date]:
+        """First days of the N months ending with (and including) `last`'s month."""
+        year, month = divmod(last.year * 12 + last.month - 1 - (n_months - 1), 12)
+        starts = []
+        for _ in range(n_months):
+            starts.append(date(year, month + 1, 1))
+            year, month = divmod(year * 12 + month + 1, 12)
+        return starts
+
     def add_item_to_shoppinglist(
         self, product_id: int, quantity_wanted: int
     ) -> dict[str, Any]:
@@ -155,11 +456,60 @@ class GroceriesService:
     ) -> tuple[Product, bool]:
         """Get existing product or create new one. Returns tuple (product, was_created)."""
         barcode = typed_product_data["barcode"]
+        # Needs the ORM row to attach the transaction, so the cached API dict doesn't help
         product = self.product_repo.get_product_by_barcode(barcode)
         if product:
             return product, False
         return self.product_repo.create_product(**typed_product_data), True
 
+    def search_products(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Top-N product matches for the transaction form's typeahead (soft-deleted flagged)."""
+        rows = self.product_repo.search_products(query.strip(), limit)
+        return [
+            {"id": p_id, "name": name, "barcode": barcode, "deleted": deleted_at is not None}
+            for p_id, name, barcode, deleted_at in rows
+        ]
+
+    def lookup_barcode(self, barcode: str) -> dict[str, Any] | None:
+        """
+        Read-through cache for scan lookups: returns the live product's API dict, or None.
+
+        Hits never touch Postgres. Misses aren't cached, since they're usually followed by
+        creating that product.
+        """
+        key = self._barcode_cache_key(barcode)
+        product_data = cache.get(key)
+        if product_data is not None:
+            return product_data  # type: ignore[no-any-return]
+
+        product = self.product_repo.get_product_by_barcode(barcode)
+        if product is None:
+            return None
+        product_data = product.to_api_dict()
+        cache.set(key, product_data)
+        return product_data
+
+    def invalidate_barcode_cache(self) -> None:
+        """Drop all of the user's cached barcode lookups (on product update/soft-delete)."""
+        self._new_barcode_cache_gen()
+
+    def _new_barcode_cache_gen(self) -> int:
+        gen = time.time_ns()
+        gen_key = BARCODE_CACHE_GEN_KEY.format(user_id=self.product_repo.user_id)
+        cache.set(gen_key, gen, timeout=BARCODE_CACHE_GEN_TIMEOUT)
+        return gen
+
+    def _barcode_cache_key(self, barcode: str) -> str:
+        user_id = self.product_repo.user_id
+        # Missing (never set, expired or evicted): start a fresh namespace
+        gen = cache.get(BARCODE_CACHE_GEN_KEY.format(user_id=user_id)) or self._new_barcode_cache_gen()
+        return BARCODE_CACHE_KEY.format(user_id=user_id, gen=gen, barcode=barcode)
+
+
+def _round(value: Decimal | float) -> float:
+    """Price stats come back as Decimal/float from Postgres; 4dp floats for JSON charting."""
+    return round(float(value), 4)
+
 
 def create_groceries_service(
     session: Session, user_id: int, user_tz: str
@@ -172,4 +522,52 @@ def create_groceries_service(
         transaction_repo=TransactionRepository(session, user_id),
         shopping_list_repo=ShoppingListRepository(session, user_id),
         shopping_list_item_repo=ShoppingListItemRepository(session, user_id),
+        spending_repo=SpendingMonthlyRollupRepository(session, user_id),
     )
+
+
+@register_patch_hook("products")
+def products_patch_hook(
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized PATCH routes to drop cached barcode lookups & re-bucket spending."""
+    groceries_service = create_groceries_service(
+        session, current_user.id, current_user.timezone
+    )
+    groceries_service.invalidate_barcode_cache()
+    if "category" in data:
+        groceries_service.rebuild_spending_rollups()
+    return {}
+
+
+@register_delete_hook("products")
+def products_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route (soft-delete) to drop cached barcode lookups."""
+    create_groceries_service(
+        session, current_user.id, current_user.timezone
+    ).invalidate_barcode_cache()
+    return {}
+
+
+@register_patch_hook("transactions")
+def transactions_patch_hook(
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized PATCH routes; an edited timestamp/product can move spending anywhere."""
+    create_groceries_service(
+        session, current_user.id, current_user.timezone
+    ).rebuild_spending_rollups()
+    return {}
+
+
+@register_delete_hook("transactions")
+def transactions_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route to take the transaction out of spending rollups."""
+    create_groceries_service(
+        session, current_user.id, current_user.timezone
+    ).sync_deleted_transaction(item)
+    return {}
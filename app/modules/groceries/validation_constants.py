@@ -55,6 +55,7 @@ UNIT_TYPE_INVALID = invalid("unit_type")
 # Price at scan
 PRICE_PRECISION = 7
 PRICE_SCALE = 2
+SPENDING_TOTAL_PRECISION = 12  # monthly per-category sums of price * quantity
 PRICE_REQUIRED = required("Price")
 PRICE_NEGATIVE = negative("Price")
 PRICE_INVALID = invalid("Price")
@@ -76,3 +77,19 @@ PRODUCT_ID_INVALID = invalid("Product ID")
 
 SHOPPING_LIST_ID_REQUIRED = required("Shopping list ID")
 SHOPPING_LIST_ID_INVALID = invalid("Shopping list ID")
+
+# Receipt (batch transactions)
+RECEIPT_LINES_MAX = 200
+RECEIPT_LINES_REQUIRED = required("Receipt lines")
+RECEIPT_LINES_TOO_MANY = f"Receipt cannot exceed {RECEIPT_LINES_MAX} lines"
+RECEIPT_PRODUCT_REQUIRED = required("Barcode or product_id")
+
+# Bulk product delete/restore
+BULK_PRODUCTS_MAX = 5000
+PRODUCT_SELECTION_FILTERS = ("category", "not_bought_since")
+
+PRODUCT_SELECTION_REQUIRED = required("Either 'ids' or a 'filter'")
+PRODUCT_SELECTION_AMBIGUOUS = "Provide either 'ids' or a 'filter', not both"
+PRODUCT_IDS_TOO_MANY = f"Product IDs cannot exceed {BULK_PRODUCTS_MAX} items"
+PRODUCT_FILTER_INVALID = f"Filter must have at least one of: {', '.join(PRODUCT_SELECTION_FILTERS)}"
+NOT_BOUGHT_SINCE_INVALID = invalid("not_bought_since date")
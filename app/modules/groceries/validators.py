@@ -1,3 +1,5 @@
+from datetime import date
+from decimal import Decimal
 from typing import Any
 
 import regex
@@ -6,6 +8,7 @@ from app.modules.groceries import validation_constants as c
 from app.modules.groceries.models import ProductCategoryEnum, UnitEnum
 from app.shared import validators as v
 from app.shared.decorators import log_validator
+from app.shared.parsers_ import PRODUCT_SCHEMA, TRANSACTION_SCHEMA, parse_form
 
 
 def validate_product_name(product_name: str | None) -> tuple[str | None, list[str]]:
@@ -163,6 +166,149 @@ def validate_transaction(
     return (typed_data, errors)
 
 
+def _stringify(data: dict[str, Any]) -> dict[str, str]:
+    """JSON values -> form-like strings, so the form parsers/validators apply unchanged."""
+    return {k: str(v) for k, v in data.items() if v is not None}
+
+
+def _validate_receipt_line(
+    line: dict[str, Any],
+) -> tuple[dict[str, Any], list[str]]:
+    """One receipt line -> (typed_line, errors)."""
+    errors = []
+    typed_line: dict[str, Any] = {"product_id": None, "barcode": None, "product": None}
+
+    if line.get("product_id") is not None:
+        try:
+            typed_line["product_id"] = int(line["product_id"])
+        except (ValueError, TypeError):
+            errors.append(c.PRODUCT_ID_INVALID)
+    elif line.get("barcode"):
+        barcode, barcode_errors = validate_barcode(str(line["barcode"]).strip())
+        errors.extend(barcode_errors)
+        typed_line["barcode"] = barcode
+    else:
+        errors.append(c.RECEIPT_PRODUCT_REQUIRED)
+
+    typed_txn, txn_errors = validate_transaction(
+        parse_form(_stringify(line), TRANSACTION_SCHEMA)
+    )
+    errors.extend(e for field_errors in txn_errors.values() for e in field_errors)
+    if not txn_errors:
+        # Decimal so same-price lines compare exactly against Numeric(7, 2) prices
+        typed_line["price_at_scan"] = Decimal(str(typed_txn["price_at_scan"])).quantize(
+            Decimal(10) ** -c.PRICE_SCALE
+        )
+        typed_line["quantity"] = typed_txn["quantity"]
+
+    # New product details, used only if the barcode isn't known yet
+    if isinstance(line.get("product"), dict) and typed_line["barcode"]:
+        product_data = _stringify(line["product"]) | {"barcode": typed_line["barcode"]}
+        typed_product, product_errors = validate_product(
+            parse_form(product_data, PRODUCT_SCHEMA)
+        )
+        errors.extend(e for field_errors in product_errors.values() for e in field_errors)
+        typed_line["product"] = typed_product
+
+    return (typed_line, errors)
+
+
+@log_validator
+def validate_receipt(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Validate a receipt: `{"lines": [{barcode | product_id, price_at_scan, quantity, product?}]}`.
+
+    `product` holds new product fields (name, category, net_weight, unit_type, ...) for
+    barcodes that may not exist yet. Returns (typed_data, errors), errors keyed per line index.
+    """
+    lines = data.get("lines")
+    if not lines or not isinstance(lines, list):
+        return ({}, {"lines": [c.RECEIPT_LINES_REQUIRED]})
+    if len(lines) > c.RECEIPT_LINES_MAX:
+        return ({}, {"lines": [c.RECEIPT_LINES_TOO_MANY]})
+
+    typed_lines = []
+    errors = {}
+    for i, line in enumerate(lines):
+        if not isinstance(line, dict):
+            errors[f"lines[{i}]"] = [c.RECEIPT_PRODUCT_REQUIRED]
+            continue
+        typed_line, line_errors = _validate_receipt_line(line)
+        if line_errors:
+            errors[f"lines[{i}]"] = line_errors
+        else:
+            typed_lines.append(typed_line)
+
+    if errors:
+        return ({}, errors)
+    return ({"lines": typed_lines}, {})
+
+
+def _validate_product_ids(ids: Any) -> tuple[dict[str, Any], dict[str, list[str]]]:  # noqa: ANN401
+    if not ids or not isinstance(ids, list):
+        return ({}, {"ids": [c.PRODUCT_SELECTION_REQUIRED]})
+    if len(ids) > c.BULK_PRODUCTS_MAX:
+        return ({}, {"ids": [c.PRODUCT_IDS_TOO_MANY]})
+
+    typed_ids = []
+    for i, product_id in enumerate(ids):
+        typed_id, id_errors = validate_product_id(str(product_id))
+        if id_errors:
+            return ({}, {"ids": [f"Item {i}: {e}" for e in id_errors]})
+        typed_ids.append(typed_id)
+    return ({"ids": typed_ids}, {})
+
+
+def _validate_product_filter(
+    product_filter: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    unknown = set(product_filter) - set(c.PRODUCT_SELECTION_FILTERS)
+    if not product_filter or unknown:
+        return ({}, {"filter": [c.PRODUCT_FILTER_INVALID]})
+
+    typed_data: dict[str, Any] = {}
+    errors: dict[str, list[str]] = {}
+    if "category" in product_filter:
+        category, category_errors = validate_category(product_filter["category"])
+        if category_errors:
+            errors["category"] = category_errors
+        typed_data["category"] = category
+    if "not_bought_since" in product_filter:
+        try:
+            typed_data["not_bought_since"] = date.fromisoformat(
+                str(product_filter["not_bought_since"])
+            )
+        except ValueError:
+            errors["not_bought_since"] = [c.NOT_BOUGHT_SINCE_INVALID]
+    return (typed_data, errors)
+
+
+@log_validator
+def validate_product_selection(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Validate a bulk product selection: `{"ids": [...]}` or `{"filter": {"category",
+    "not_bought_since"}}` (local YYYY-MM-DD; products with no transaction since then).
+
+    Returns (typed_data, errors), with typed_data holding `ids` or the typed filter fields.
+    """
+    ids, product_filter = data.get("ids"), data.get("filter")
+    if ids is None and product_filter is None:
+        return ({}, {"ids": [c.PRODUCT_SELECTION_REQUIRED]})
+    if ids is not None and product_filter is not None:
+        return ({}, {"ids": [c.PRODUCT_SELECTION_AMBIGUOUS]})
+
+    if product_filter is not None:
+        if not isinstance(product_filter, dict):
+            return ({}, {"filter": [c.PRODUCT_FILTER_INVALID]})
+        return _validate_product_filter(product_filter)
+
+    return _validate_product_ids(ids)
+
+
 @log_validator
 def validate_shopping_list(
     data: dict[str, Any],
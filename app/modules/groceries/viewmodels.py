@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from app.modules.groceries.models import Product, Transaction
+    from datetime import datetime
+
+    from sqlalchemy import Row
+
+    from app.modules.groceries.models import Product
 
 
 from app.modules.groceries.models import ProductCategoryEnum as Category
+from app.modules.groceries.models import Transaction
 from app.modules.groceries.models import UnitEnum as UnitType
+from app.shared.datetime_.helpers import convert_to_timezone
 from app.shared.view_mixins import BasePresenter, BaseViewModel
 
 
@@ -32,25 +39,23 @@ class TransactionViewModel(BaseViewModel):
     product_id: int
     product_name: str
     barcode: int
-    price_at_scan: float
+    price_at_scan: Decimal
     quantity: int
-    price_per_100g: float
-
-    def __init__(self, txn: Transaction, tz: str) -> None:
-        fields = {
-            "id",
-            "product_id",
-            "price_at_scan",
-            "quantity",
-            "created_at_local",
-            "price_per_100g",
-            "subtype",
-        }
-        for name in fields:
-            setattr(self, name, getattr(txn, name))
-
-        self.product_name = txn.product.name
-        self.barcode = txn.product.barcode
+    price_per_100g: Decimal
+    created_at: datetime
+
+    def __init__(self, row: Row[Any], tz: str) -> None:
+        """Built from `TransactionRepository.get_table_rows_in_window` rows, not ORM objects."""
+        self.id = row.id
+        self.product_id = row.product_id
+        self.product_name = row.product_name
+        self.barcode = row.barcode
+        self.price_at_scan = row.price_at_scan
+        self.quantity = row.quantity
+        self.price_per_100g = (row.price_at_scan / Decimal(str(row.net_weight))) * 100
+        self.created_at = row.created_at
+        self.created_at_local = convert_to_timezone(tz, row.created_at)
+        self.subtype = Transaction.__tablename__
         self._tz = tz
 
     @property
@@ -145,6 +150,6 @@ class ProductViewModel(BaseViewModel):
 
     @property
     def calories_label(self) -> str:
-        if self.calories_per_100g:
+        if self.calories_per_100g is None:
             return "--"
         return str(round(self.calories_per_100g))
@@ -0,0 +1,77 @@
+"""
+CLI commands for Habits module.
+
+- `flask habits rebuild-streaks` : Rebuild materialized streak state from completion history
+- `flask habits rebuild-rollups` : Rebuild daily completion rollups (and reset weekly ones)
+- `flask habits evaluate-promotions` : Promote EXPERIMENTAL habits meeting their threshold (cron)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+import click
+from flask.cli import AppGroup
+
+from app._infra.database import with_db_session
+from app.modules.auth.repository import UsersRepository
+from app.modules.habits.service import (
+    PROMOTION_USER_BATCH_SIZE,
+    PROMOTION_WINDOW_DAYS,
+    create_habits_service,
+    evaluate_habit_promotions,
+)
+
+habits_cli = AppGroup("habits", help="Habits module maintenance commands.")
+
+
+@habits_cli.command("rebuild-streaks")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user's habits.")
+@with_db_session
+def rebuild_streaks(session: Session, user_id: int | None) -> None:
+    """Recompute each habit's current/longest streak & last completion date from history."""
+    users = UsersRepository(session).get_users(user_id)
+
+    total = 0
+    for user in users:
+        habits_service = create_habits_service(session, user.id, user.timezone)
+        total += habits_service.rebuild_all_streaks()
+
+    click.echo(f"Rebuilt streaks for {total} habits across {len(users)} users.")
+
+
+@habits_cli.command("rebuild-rollups")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user's rollups.")
+@with_db_session
+def rebuild_rollups(session: Session, user_id: int | None) -> None:
+    """Recompute daily completion rollups in each user's current timezone."""
+    users = UsersRepository(session).get_users(user_id)
+
+    for user in users:
+        create_habits_service(session, user.id, user.timezone).rebuild_rollups()
+
+    click.echo(f"Rebuilt completion rollups for {len(users)} users.")
+
+
+@habits_cli.command("evaluate-promotions")
+@click.option(
+    "--window-days", type=click.IntRange(min=1), default=PROMOTION_WINDOW_DAYS, show_default=True,
+    help="Trailing window the completion rate is measured over.",
+)
+@click.option(
+    "--batch-size", type=int, default=PROMOTION_USER_BATCH_SIZE, show_default=True,
+    help="Users evaluated per grouped query.",
+)
+@with_db_session
+def evaluate_promotions(session: Session, window_days: int, batch_size: int) -> None:
+    """Promote EXPERIMENTAL habits whose trailing completion rate meets their threshold."""
+    report = evaluate_habit_promotions(
+        session, window_days=window_days, batch_size=batch_size
+    )
+    click.echo(
+        f"Evaluated {report['evaluated']} habits across {report['users']} users, "
+        f"promoted {report['promoted']} in {report['elapsed_s']}s."
+    )
@@ -3,14 +3,16 @@ Model definitions for Habits module.
 """
 
 import enum
-from datetime import datetime
-from typing import Any, ClassVar, Self
+from datetime import date, datetime
+from typing import ClassVar, Self
 
 from sqlalchemy import (
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -67,13 +69,7 @@ class LanguageEnum(enum.Enum):
 
 class Habit(Base, APISerializable):
     __api_exclude__: ClassVar[list[str]] = []
-
-    def to_api_dict(self) -> dict[str, Any]:
-        result = super().to_api_dict()
-        result["is_promotable"] = (
-            self.status is not None and self.promotion_threshold is not None
-        )
-        return result
+    __api_extras__: ClassVar[tuple[str, ...]] = ("is_promotable",)
 
     __table_args__ = (
         CheckConstraint(
@@ -100,10 +96,25 @@ class Habit(Base, APISerializable):
 
     pillar_id: Mapped[int] = mapped_column(ForeignKey("pillars.id"), nullable=True)
 
+    # Materialized streak state, maintained on completion writes (see HabitsService)
+    # `current_streak` is the length of the run ending on `last_completed_date`, so readers
+    # still apply the STREAK_GRACE_DAYS check against today
+    current_streak: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    longest_streak: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_completed_date: Mapped[date] = mapped_column(Date, nullable=True)
+
     @property
     def established_date_local(self) -> datetime | None:
         return convert_to_timezone(self.user.timezone, self.established_date)
 
+    @property
+    def is_promotable(self) -> bool:
+        return self.status is not None and self.promotion_threshold is not None
+
     user = relationship("User", back_populates="habits")
     tags = relationship("Tag", secondary=habit_tags, back_populates="habits")
     pillar = relationship("Pillar", back_populates="habits")
@@ -121,6 +132,10 @@ class Habit(Base, APISerializable):
 class HabitCompletion(Base, APISerializable):
     """Stores each completion as a new entry, enabling better analytics."""
 
+    __table_args__ = (
+        Index("ix_user_habit_completed", "user_id", "habit_id", "created_at"),
+    )
+
     habit_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("habits.id"), nullable=False
     )
@@ -132,6 +147,58 @@ class HabitCompletion(Base, APISerializable):
         return f"<HabitCompletion id={self.id} habit_id={self.habit_id}>"
 
 
+class HabitWeeklyRollup(Base):
+    """
+    Per-user habit progress for one ISO week, read by the progress bar in one indexed lookup.
+
+    Acts as a read-through cache: rows are created on first read and kept current by
+    HabitsService's completion writes. Deleting a row is always safe, it's simply recomputed.
+    """
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "week_start", name="uq_user_habit_week_start"),
+    )
+
+    # Local-date Monday of the ISO week
+    week_start: Mapped[date] = mapped_column(Date, nullable=False)
+
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Sum of habits' target_frequency as of when the row was (re)computed
+    expected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<HabitWeeklyRollup id={self.id} week_start={self.week_start} {self.completed}/{self.expected}>"
+
+
+class HabitDailyRollup(Base):
+    """
+    Completions per habit per local day, so heatmaps read one compact row per active day
+    instead of scanning habit_completions.
+
+    Maintained by HabitsService on every completion insert/delete. Local dates use the user's
+    timezone at write time; `flask habits rebuild-rollups` recomputes them from history.
+    """
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "habit_id", "local_date", name="uq_user_habit_local_date"
+        ),
+        Index("ix_user_local_date", "user_id", "local_date"),
+    )
+
+    habit_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("habits.id", ondelete="CASCADE"), nullable=False
+    )
+
+    local_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<HabitDailyRollup habit_id={self.habit_id} local_date={self.local_date} count={self.count}>"
+
+
 # NOTE: Unsure about this placement
 class LeetCodeRecord(Base, APISerializable):
     leetcode_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -4,20 +4,36 @@ Repository layer for Habits module.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Collection
+    from datetime import date, datetime
 
+    from sqlalchemy import Subquery
     from sqlalchemy.orm import Session
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Date,
+    Integer,
+    and_,
+    cast,
+    delete,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
+from app.modules.auth.models import User
 from app.modules.habits.models import (
     DifficultyEnum,
     Habit,
     HabitCompletion,
+    HabitDailyRollup,
+    HabitWeeklyRollup,
     LanguageEnum,
     LCStatusEnum,
     LeetCodeRecord,
@@ -64,6 +80,13 @@ class HabitRepository(BaseRepository[Habit]):
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_total_target_frequency(self) -> int:
+        """Returns sum of `target_frequency` across all of the user's habits."""
+        stmt = select(func.coalesce(func.sum(Habit.target_frequency), 0)).where(
+            Habit.user_id == self.user_id
+        )
+        return self.session.execute(stmt).scalar_one()
+
 
 class HabitCompletionRepository(BaseRepository[HabitCompletion]):
     def __init__(self, session: Session, user_id: int) -> None:
@@ -134,6 +157,48 @@ class HabitCompletionRepository(BaseRepository[HabitCompletion]):
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    def count_completions_in_window(self, start_utc: datetime, end_utc: datetime) -> int:
+        """Returns number of completions (across all habits) in datetime range."""
+        stmt = select(func.count(HabitCompletion.id)).where(
+            HabitCompletion.user_id == self.user_id,
+            HabitCompletion.created_at >= start_utc,
+            HabitCompletion.created_at < end_utc,
+        )
+        return self.session.execute(stmt).scalar_one()
+
+    def get_completion_days_in_window(
+        self,
+        habit_ids: Collection[int],
+        start_utc: datetime,
+        end_utc: datetime,
+        tz_str: str,
+    ) -> set[tuple[int, date]]:
+        """Returns the distinct (habit_id, local_date) pairs with completions in datetime range."""
+        local_date = cast(func.timezone(tz_str, HabitCompletion.created_at), Date)
+        stmt = (
+            select(HabitCompletion.habit_id, local_date)
+            .where(
+                HabitCompletion.user_id == self.user_id,
+                HabitCompletion.habit_id.in_(habit_ids),
+                HabitCompletion.created_at >= start_utc,
+                HabitCompletion.created_at < end_utc,
+            )
+            .distinct()
+        )
+        return {(h_id, day) for h_id, day in self.session.execute(stmt).all()}
+
+    def bulk_insert_completions(self, rows: list[tuple[int, datetime]]) -> None:
+        """Insert (habit_id, completed_at) rows as multi-row INSERTs, skipping the ORM."""
+        if not rows:
+            return
+        self.session.execute(
+            insert(HabitCompletion),
+            [
+                {"user_id": self.user_id, "habit_id": h_id, "created_at": completed_at}
+                for h_id, completed_at in rows
+            ],
+        )
+
     def get_completion_counts_by_habit_in_window(
         self, start_utc: datetime, end_utc: datetime
     ) -> list[tuple[str, int]]:
@@ -154,6 +219,300 @@ class HabitCompletionRepository(BaseRepository[HabitCompletion]):
             tuple(row) for row in result
         ]  # unwrap each SQLAlchemy Row into a plain tuple
 
+    def get_completion_counts_by_habit_and_bucket(
+        self, start_utc: datetime, end_utc: datetime, tz_str: str, bucket: str
+    ) -> list[tuple[int, str, date, int]]:
+        """
+        Returns (habit_id, habit_name, bucket_start, count) tuples for completions in datetime
+        range, bucketed by local `bucket` ('day', 'week' (ISO, Monday) or 'month').
+        """
+        bucket_start = cast(
+            func.date_trunc(bucket, func.timezone(tz_str, HabitCompletion.created_at)),
+            Date,
+        ).label("bucket_start")
+        stmt = (
+            select(Habit.id, Habit.name, bucket_start, func.count(HabitCompletion.id))
+            .select_from(HabitCompletion)
+            .join(Habit)
+            .where(
+                Habit.user_id == self.user_id,
+                HabitCompletion.created_at >= start_utc,
+                HabitCompletion.created_at < end_utc,
+            )
+            .group_by(Habit.id, Habit.name, bucket_start)
+            .order_by(Habit.name, Habit.id, bucket_start)
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def get_streak_stats(
+        self, tz_str: str, habit_id: int | None = None
+    ) -> list[tuple[int, date, int, int]]:
+        """
+        Returns a list of (habit_id, last_local_date, current_run, longest_run) tuples, one per
+        habit with completions (or just `habit_id`, if given).
+
+        `current_run` is the run of consecutive local days ending on `last_local_date`, so
+        grace-window logic is left to the service. Single statement regardless of habit count.
+        """
+        runs = self._streak_runs(tz_str, habit_id)
+        stmt = (
+            select(
+                runs.c.habit_id,
+                runs.c.run_end,
+                runs.c.run_length,
+                func.max(runs.c.run_length).over(partition_by=runs.c.habit_id),
+            )
+            .distinct(runs.c.habit_id)
+            .order_by(runs.c.habit_id, runs.c.run_end.desc())
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def get_streak_segments(
+        self, tz_str: str, habit_id: int | None = None
+    ) -> list[tuple[int, date, date, int]]:
+        """
+        Returns run-length encoded streak history as (habit_id, run_start, run_end, run_length)
+        tuples, ordered by habit then date. One row per run rather than per completion.
+        """
+        runs = self._streak_runs(tz_str, habit_id)
+        stmt = select(
+            runs.c.habit_id, runs.c.run_start, runs.c.run_end, runs.c.run_length
+        ).order_by(runs.c.habit_id, runs.c.run_start)
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def _streak_runs(self, tz_str: str, habit_id: int | None = None) -> Subquery:
+        """
+        Gaps-and-islands over distinct local completion dates, one row per run:
+        (habit_id, run_start, run_end, run_length).
+
+        Consecutive dates minus their row_number() share the same "island" anchor date.
+        """
+        local_date = cast(func.timezone(tz_str, HabitCompletion.created_at), Date)
+        days_stmt = (
+            select(HabitCompletion.habit_id, local_date.label("local_date"))
+            .where(HabitCompletion.user_id == self.user_id)
+            .distinct()
+        )
+        if habit_id is not None:
+            days_stmt = days_stmt.where(HabitCompletion.habit_id == habit_id)
+        days = days_stmt.subquery("days")
+        row_num = func.row_number().over(
+            partition_by=days.c.habit_id, order_by=days.c.local_date
+        )
+        islands = select(
+            days.c.habit_id,
+            days.c.local_date,
+            (days.c.local_date - cast(row_num, Integer)).label("island"),
+        ).subquery("islands")
+        return (
+            select(
+                islands.c.habit_id,
+                func.min(islands.c.local_date).label("run_start"),
+                func.max(islands.c.local_date).label("run_end"),
+                func.count().label("run_length"),
+            )
+            .group_by(islands.c.habit_id, islands.c.island)
+            .subquery("runs")
+        )
+
+
+class HabitWeeklyRollupRepository(BaseRepository[HabitWeeklyRollup]):
+    def __init__(self, session: Session, user_id: int) -> None:
+        super().__init__(session, user_id, model_cls=HabitWeeklyRollup)
+
+    def get_week_progress(self, week_start: date) -> tuple[int, int] | None:
+        """Returns (completed, expected) for the week, or None if not rolled up yet."""
+        stmt = select(HabitWeeklyRollup.completed, HabitWeeklyRollup.expected).where(
+            HabitWeeklyRollup.user_id == self.user_id,
+            HabitWeeklyRollup.week_start == week_start,
+        )
+        row = self.session.execute(stmt).first()
+        return (row.completed, row.expected) if row else None
+
+    def insert_week_progress(self, week_start: date, completed: int, expected: int) -> None:
+        """Insert a week's rollup. No-op if a concurrent request already inserted it."""
+        stmt = (
+            insert(HabitWeeklyRollup)
+            .values(
+                user_id=self.user_id,
+                week_start=week_start,
+                completed=completed,
+                expected=expected,
+            )
+            .on_conflict_do_nothing(constraint="uq_user_habit_week_start")
+        )
+        self.session.execute(stmt)
+
+    def increment_completed(self, week_start: date, delta: int) -> None:
+        """Adjust a week's completed count in place. No-op if the week isn't rolled up."""
+        stmt = (
+            update(HabitWeeklyRollup)
+            .where(
+                HabitWeeklyRollup.user_id == self.user_id,
+                HabitWeeklyRollup.week_start == week_start,
+            )
+            .values(completed=HabitWeeklyRollup.completed + delta)
+        )
+        self.session.execute(stmt)
+
+    def delete_weeks_from(self, week_start: date | None = None) -> None:
+        """Drop rollups for `week_start` onwards (all if None), so they're recomputed on next read."""
+        stmt = delete(HabitWeeklyRollup).where(HabitWeeklyRollup.user_id == self.user_id)
+        if week_start is not None:
+            stmt = stmt.where(HabitWeeklyRollup.week_start >= week_start)
+        self.session.execute(stmt)
+
+
+class HabitDailyRollupRepository(BaseRepository[HabitDailyRollup]):
+    def __init__(self, session: Session, user_id: int) -> None:
+        super().__init__(session, user_id, model_cls=HabitDailyRollup)
+
+    def get_daily_counts(
+        self, start_date: date, end_date: date, habit_id: int | None = None
+    ) -> list[tuple[int, date, int]]:
+        """Returns (habit_id, local_date, count) rows for an inclusive local date range."""
+        stmt = (
+            select(
+                HabitDailyRollup.habit_id,
+                HabitDailyRollup.local_date,
+                HabitDailyRollup.count,
+            )
+            .where(
+                HabitDailyRollup.user_id == self.user_id,
+                HabitDailyRollup.local_date.between(start_date, end_date),
+            )
+            .order_by(HabitDailyRollup.local_date, HabitDailyRollup.habit_id)
+        )
+        if habit_id is not None:
+            stmt = stmt.where(HabitDailyRollup.habit_id == habit_id)
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def increment_count(self, habit_id: int, local_date: date) -> None:
+        """Upsert +1 for the habit's local day."""
+        stmt = insert(HabitDailyRollup).values(
+            user_id=self.user_id, habit_id=habit_id, local_date=local_date, count=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_habit_local_date",
+            set_={"count": HabitDailyRollup.count + 1},
+        )
+        self.session.execute(stmt)
+
+    def add_counts(self, rows: list[tuple[int, date, int]]) -> None:
+        """Upsert +n for many (habit_id, local_date, n) rows in one statement."""
+        if not rows:
+            return
+        stmt = insert(HabitDailyRollup).values(
+            [
+                {"user_id": self.user_id, "habit_id": h_id, "local_date": day, "count": n}
+                for h_id, day, n in rows
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_habit_local_date",
+            set_={"count": HabitDailyRollup.count + stmt.excluded.count},
+        )
+        self.session.execute(stmt)
+
+    def decrement_count(self, habit_id: int, local_date: date) -> None:
+        """-1 for the habit's local day, dropping the row once it reaches zero."""
+        match = (
+            HabitDailyRollup.user_id == self.user_id,
+            HabitDailyRollup.habit_id == habit_id,
+            HabitDailyRollup.local_date == local_date,
+        )
+        self.session.execute(
+            update(HabitDailyRollup)
+            .where(*match)
+            .values(count=HabitDailyRollup.count - 1)
+        )
+        self.session.execute(
+            delete(HabitDailyRollup).where(*match, HabitDailyRollup.count <= 0)
+        )
+
+    def rebuild(self, tz_str: str, habit_id: int | None = None) -> None:
+        """Replace rollups (for one habit, or all of the user's) with counts from history."""
+        delete_stmt = delete(HabitDailyRollup).where(
+            HabitDailyRollup.user_id == self.user_id
+        )
+        local_date = cast(func.timezone(tz_str, HabitCompletion.created_at), Date)
+        counts_stmt = (
+            select(
+                HabitCompletion.user_id,
+                HabitCompletion.habit_id,
+                local_date,
+                func.count(),
+            )
+            .where(HabitCompletion.user_id == self.user_id)
+            .group_by(HabitCompletion.user_id, HabitCompletion.habit_id, local_date)
+        )
+        if habit_id is not None:
+            delete_stmt = delete_stmt.where(HabitDailyRollup.habit_id == habit_id)
+            counts_stmt = counts_stmt.where(HabitCompletion.habit_id == habit_id)
+
+        self.session.execute(delete_stmt)
+        self.session.execute(
+            insert(HabitDailyRollup).from_select(
+                ["user_id", "habit_id", "local_date", "count"], counts_stmt
+            )
+        )
+
+
+class HabitPromotionRepository:
+    """Cross-user queries for the promotion evaluator, so not user-scoped like BaseRepository."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_experimental_completion_rates(
+        self, user_ids: Collection[int], window_start_utc: datetime, window_days: int
+    ) -> list[tuple[int, float, float]]:
+        """
+        Returns (habit_id, completion_rate, promotion_threshold) for the given users'
+        EXPERIMENTAL habits, in one grouped query.
+
+        Rate is distinct local completion days since `window_start_utc` over the habit's
+        expected days (target_frequency per week), capped at 1.0.
+        """
+        completed_days = func.count(
+            func.distinct(
+                cast(func.timezone(User.timezone, HabitCompletion.created_at), Date)
+            )
+        )
+        expected_days = func.nullif(Habit.target_frequency * window_days / 7.0, 0)
+        # No expected days (target_frequency 0) rates 0 rather than dividing by zero
+        rate = func.least(func.coalesce(completed_days / expected_days, 0.0), 1.0)
+        stmt = (
+            select(Habit.id, rate, Habit.promotion_threshold)
+            .join(User, User.id == Habit.user_id)
+            .outerjoin(
+                HabitCompletion,
+                and_(
+                    HabitCompletion.habit_id == Habit.id,
+                    HabitCompletion.created_at >= window_start_utc,
+                ),
+            )
+            .where(
+                Habit.user_id.in_(user_ids),
+                Habit.status == StatusEnum.EXPERIMENTAL,
+                Habit.promotion_threshold.is_not(None),
+            )
+            .group_by(Habit.id)
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def promote_habits(self, habit_ids: Collection[int], established_at: datetime) -> int:
+        """Mark EXPERIMENTAL habits as ESTABLISHED in one UPDATE. Returns rows promoted."""
+        if not habit_ids:
+            return 0
+        stmt = (
+            update(Habit)
+            .where(Habit.id.in_(habit_ids), Habit.status == StatusEnum.EXPERIMENTAL)
+            .values(status=StatusEnum.ESTABLISHED, established_date=established_at)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(stmt).rowcount  # type: ignore[attr-defined, no-any-return]
+
 
 class LeetCodeRecordRepository(BaseRepository[LeetCodeRecord]):
     def __init__(self, session: Session, user_id: int) -> None:
@@ -184,3 +543,57 @@ class LeetCodeRecordRepository(BaseRepository[LeetCodeRecord]):
             LeetCodeRecord.created_at >= start_utc, LeetCodeRecord.created_at < end_utc
         )
         return list(self.session.execute(stmt).scalars().all())
+
+    def get_leetcoderecords_page_in_window(
+        self, start_utc: datetime, end_utc: datetime, **page: Any  # noqa: ANN401
+    ) -> tuple[list[LeetCodeRecord], str | None]:
+        """One sorted page of `get_all_leetcoderecords_in_window` (see `BaseRepository.get_page`)."""
+        stmt = self._user_select(LeetCodeRecord).where(
+            LeetCodeRecord.created_at >= start_utc, LeetCodeRecord.created_at < end_utc
+        )
+        return self.get_page(stmt, **page)
+
+    def get_stats_grouping_sets(
+        self, tz_str: str
+    ) -> list[tuple[DifficultyEnum, LanguageEnum, LCStatusEnum, date, int, int, int]]:
+        """
+        Returns rows from one GROUPING SETS query over the user's records:
+        (difficulty, language, status, week_start, total, solved, is_week_row).
+
+        `is_week_row` = 1 marks (local ISO week) rows, where only week_start/solved are set;
+        otherwise the row is a difficulty x language x status count.
+        """
+        week_start = cast(
+            func.date_trunc("week", func.timezone(tz_str, LeetCodeRecord.created_at)),
+            Date,
+        ).label("week_start")
+        stmt = (
+            select(
+                LeetCodeRecord.difficulty,
+                LeetCodeRecord.language,
+                LeetCodeRecord.status,
+                week_start,
+                func.count(),
+                func.count().filter(LeetCodeRecord.status == LCStatusEnum.SOLVED),
+                # Difficulty is only rolled up (GROUPING = 1) in the per-week set
+                func.grouping(LeetCodeRecord.difficulty).label("is_week_row"),
+            )
+            .where(LeetCodeRecord.user_id == self.user_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(
+                        LeetCodeRecord.difficulty,
+                        LeetCodeRecord.language,
+                        LeetCodeRecord.status,
+                    ),
+                    tuple_(week_start),
+                )
+            )
+            .order_by(
+                LeetCodeRecord.difficulty,
+                LeetCodeRecord.language,
+                LeetCodeRecord.status,
+                week_start,
+            )
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
@@ -15,10 +15,9 @@ from app.modules.habits.viewmodels import (
     LCRecordPresenter,
     LCRecordViewModel,
 )
-from app.shared.collection_utils import sort_by_field
 from app.shared.datetime_.helpers import last_n_days_range
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import get_table_params
+from app.shared.parsers_ import get_table_params, page_kwargs
 
 habits_bp = Blueprint(
     "habits", __name__, template_folder="templates", url_prefix="/habits"
@@ -28,7 +27,9 @@ habits_bp = Blueprint(
 @habits_bp.get("/dashboard")
 @login_plus_session
 def dashboard(session: Session) -> tuple[str, int]:
-    records_params = get_table_params("leet_code_records", "created_at")
+    records_params = get_table_params(
+        "leet_code_records", "id", LCRecordPresenter.sort_fields()
+    )
 
     habits_service = create_habits_service(
         session, current_user.id, current_user.timezone
@@ -37,12 +38,15 @@ def dashboard(session: Session) -> tuple[str, int]:
         records_params["range"], current_user.timezone
     )
     habits = habits_service.habit_repo.get_all_habits_and_tags()
-    records = habits_service.leetcode_repo.get_all_leetcoderecords_in_window(
-        start_utc, end_utc
+    records, records_params["next_cursor"] = (
+        habits_service.leetcode_repo.get_leetcoderecords_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=LCRecordPresenter.sort_fields(),
+            **page_kwargs(records_params),
+        )
     )
 
-    records = sort_by_field(records, records_params["sort_by"], records_params["order"])
-
     habits_viewmodels = [HabitViewModel(h, current_user.timezone) for h in habits]
     lcrecords_viewmodels = [
         LCRecordViewModel(r, current_user.timezone) for r in records
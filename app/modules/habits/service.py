@@ -7,38 +7,61 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from datetime import date
+
     from sqlalchemy.orm import Session
 
+    from app.modules.auth.models import User
+    from app.modules.habits.models import Habit, HabitCompletion, LeetCodeRecord
+
 
-from datetime import datetime
+import logging
+import time
+from datetime import datetime, timedelta
 from itertools import pairwise
 from zoneinfo import ZoneInfo
 
 import app.shared.datetime_.helpers as dth
 from app.api.responses import service_response
+from app.extensions import cache
+from app.modules.auth.repository import UsersRepository
 from app.modules.habits.repository import (
     HabitCompletionRepository,
+    HabitDailyRollupRepository,
+    HabitPromotionRepository,
     HabitRepository,
+    HabitWeeklyRollupRepository,
     LeetCodeRecordRepository,
 )
+from app.shared.hooks import register_delete_hook, register_patch_hook
+
+logger = logging.getLogger(__name__)
 
 STREAK_GRACE_DAYS = 2  # Allow yesterday or today to continue streak
+COMPLETION_BUCKETS = ("day", "week", "month")
+PROMOTION_WINDOW_DAYS = 28
+PROMOTION_USER_BATCH_SIZE = 500
+LEETCODE_STATS_CACHE_KEY = "leetcode_stats:{user_id}"
 
 
 class HabitsService:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session: Session,
         user_tz: str,
         habit_repo: HabitRepository,
         completion_repo: HabitCompletionRepository,
         leetcode_repo: LeetCodeRecordRepository,
+        rollup_repo: HabitWeeklyRollupRepository,
+        daily_repo: HabitDailyRollupRepository,
     ) -> None:
         self.session = session
         self.user_tz = user_tz
         self.habit_repo = habit_repo
         self.completion_repo = completion_repo
         self.leetcode_repo = leetcode_repo
+        self.rollup_repo = rollup_repo
+        self.daily_repo = daily_repo
 
     def save_habit(self, typed_data: dict[str, Any], habit_id: int | None) -> Any:
         # UPDATE
@@ -50,6 +73,7 @@ class HabitsService:
             for field, value in typed_data.items():
                 setattr(habit, field, value)
 
+            self.invalidate_week_progress()
             return service_response(
                 success=True, message="Habit updated", data={"habit": habit}
             )
@@ -61,6 +85,7 @@ class HabitsService:
                 promotion_threshold=typed_data.get("promotion_threshold"),
                 target_frequency=typed_data["target_frequency"],
             )
+            self.invalidate_week_progress()
             return service_response(
                 success=True, message="Habit added", data={"habit": habit}
             )
@@ -113,33 +138,373 @@ class HabitsService:
         )
         return completion is not None
 
-    # NOTE: "Percent completion habits this week" - Mon to Sun
-    def calculate_all_habits_percentage_this_week(self) -> dict[str, Any]:
+    def get_habit_summaries(self, habits: list[Habit]) -> dict[int, dict[str, Any]]:
         """
-        Calculate aggregate habit completion progress for the current week.
+        Return `{habit_id: {"completed_today": bool, "streak_count": int}}` for the given habits.
+
+        Batched counterpart to `check_if_completed_today()` + `calculate_habit_streak()`. Reads
+        each habit's materialized streak state, so costs no queries beyond loading the habits.
+        """
+        today_date = dth.now_in_timezone(self.user_tz).date()
+
+        summaries = {}
+        for habit in habits:
+            last_date = habit.last_completed_date
+            streak_alive = (
+                last_date is not None
+                and (today_date - last_date).days < STREAK_GRACE_DAYS
+            )
+            summaries[habit.id] = {
+                "completed_today": last_date == today_date,
+                "streak_count": habit.current_streak if streak_alive else 0,
+            }
+        return summaries
+
+    def get_streak_history(
+        self, habit_id: int | None = None
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Return current/longest streak plus run-length segments, computed in Postgres.
+
+        Shape: `{habit_id: {"current_streak": int, "longest_streak": int, "segments": [(start, end, length), ...]}}`
+        for one habit (`habit_id`) or all of the user's habits with completions. Unlike the
+        stored state on Habit, this is derived straight from history (eg, for history views).
+        """
+        today_date = dth.now_in_timezone(self.user_tz).date()
+        segments = self.completion_repo.get_streak_segments(self.user_tz, habit_id)
+
+        history: dict[int, dict[str, Any]] = {}
+        for h_id, run_start, run_end, run_length in segments:
+            entry = history.setdefault(
+                h_id, {"current_streak": 0, "longest_streak": 0, "segments": []}
+            )
+            entry["segments"].append((run_start, run_end, run_length))
+            entry["longest_streak"] = max(entry["longest_streak"], run_length)
 
-        Computes total number of recorded habit completions from Mon. through today (inclusive), the
-        total expected completions based on each habit's target frequency, and the resulting completion percentage.
+        # Segments are date-ordered, so the last one per habit is the latest run
+        for entry in history.values():
+            _, last_end, last_length = entry["segments"][-1]
+            if (today_date - last_end).days < STREAK_GRACE_DAYS:
+                entry["current_streak"] = last_length
+        return history
+
+    def add_completion(self, habit: Habit, completed_at: datetime) -> HabitCompletion:
         """
-        # Determine current day in the week
-        today = datetime.now(ZoneInfo(self.user_tz))
-        days_into_week = today.weekday() + 1  # offset: incl today as day # 1
+        Record a completion, advancing the habit's stored streak state and its day/week rollups.
 
-        # start_of_week = today - timedelta(days=today.weekday())
-        start_of_week_utc, end_of_today_utc = dth.last_n_days_range(
-            days_into_week, self.user_tz
+        Appending today/tomorrow-of-last is O(1). Backfilling before `last_completed_date` may
+        bridge older runs, so that case falls back to `rebuild_habit_streak()`.
+        """
+        completion = self.completion_repo.create_habit_completion(
+            habit.id, completed_at
         )
+        local_date = dth.convert_to_timezone(self.user_tz, completed_at).date()
+        self.rollup_repo.increment_completed(self._week_start(local_date), 1)
+        self.daily_repo.increment_count(habit.id, local_date)
+        last_date = habit.last_completed_date
+
+        if last_date is not None and local_date < last_date:
+            self.session.flush()
+            self.rebuild_habit_streak(habit)
+            return completion
+
+        if last_date is None or local_date > last_date + timedelta(days=1):
+            habit.current_streak = 1
+        elif local_date == last_date + timedelta(days=1):
+            habit.current_streak += 1
+        # else: same-day duplicate, run unchanged
+
+        habit.last_completed_date = local_date
+        habit.longest_streak = max(habit.longest_streak, habit.current_streak)
+        return completion
+
+    def remove_completion(self, habit: Habit, completion: HabitCompletion) -> None:
+        """
+        Delete a completion, rolling back the habit's stored streak state and its day/week rollups.
+
+        Unchecking the latest day of a run that isn't the longest is O(1), anything else
+        (mid-history deletes, shrinking the longest run) falls back to `rebuild_habit_streak()`.
+        """
+        local_date = dth.convert_to_timezone(self.user_tz, completion.created_at).date()
+        self.completion_repo.delete(completion)
+        self.rollup_repo.increment_completed(self._week_start(local_date), -1)
+        self.daily_repo.decrement_count(habit.id, local_date)
+        self.session.flush()
+
+        # Another completion on the same local day keeps the run intact
+        start_utc, end_utc = dth.day_range_utc(local_date, self.user_tz)
+        if self.completion_repo.get_habit_completion_in_window(
+            habit.id, start_utc, end_utc
+        ):
+            return
+
+        if (
+            local_date == habit.last_completed_date
+            and 1 < habit.current_streak < habit.longest_streak
+        ):
+            habit.current_streak -= 1
+            habit.last_completed_date = local_date - timedelta(days=1)
+            return
+
+        self.rebuild_habit_streak(habit)
 
-        # Fetch completions in that time range
-        total_completions = len(
-            self.completion_repo.get_all_completions_in_window(
-                start_of_week_utc, end_of_today_utc
+    def add_completions_bulk(
+        self, completions: list[tuple[int, datetime]]
+    ) -> dict[str, Any]:
+        """
+        Backfill many (habit_id, completed_at) completions at once.
+
+        Habit ownership is checked in one query, pairs landing on a local day the habit already
+        has a completion for (in the DB or earlier in the batch) are skipped, and the rest go
+        in as multi-row INSERTs. Streaks and rollups are then refreshed once for the batch.
+        """
+        habit_ids = {h_id for h_id, _ in completions}
+        habits = self.habit_repo.get_by_ids(habit_ids)
+        if len(habits) != len(habit_ids):
+            missing = sorted(habit_ids - {h.id for h in habits})
+            return service_response(
+                success=False,
+                message="Habit not found",
+                errors={"habit_id": [f"Unknown habit id(s): {missing}"]},
             )
+
+        local_dates = [
+            dth.convert_to_timezone(self.user_tz, completed_at).date()
+            for _, completed_at in completions
+        ]
+        start_utc, _ = dth.day_range_utc(min(local_dates), self.user_tz)
+        _, end_utc = dth.day_range_utc(max(local_dates), self.user_tz)
+        seen_days = self.completion_repo.get_completion_days_in_window(
+            habit_ids, start_utc, end_utc, self.user_tz
+        )
+
+        new_rows: list[tuple[int, datetime]] = []
+        day_counts: list[tuple[int, date, int]] = []
+        for (h_id, completed_at), local_date in zip(completions, local_dates, strict=True):
+            if (h_id, local_date) in seen_days:
+                continue
+            seen_days.add((h_id, local_date))
+            new_rows.append((h_id, completed_at))
+            day_counts.append((h_id, local_date, 1))
+
+        self.completion_repo.bulk_insert_completions(new_rows)
+        self.daily_repo.add_counts(day_counts)
+        self.invalidate_week_progress(all_weeks=True)
+        self._rebuild_streaks(habits)
+
+        return service_response(
+            success=True,
+            message=f"Added {len(new_rows)} completions",
+            data={
+                "inserted": len(new_rows),
+                "skipped": len(completions) - len(new_rows),
+            },
+        )
+
+    def sync_deleted_completion(self, completion: HabitCompletion) -> None:
+        """
+        Bring stored streak state & rollups in line with a completion that was deleted
+        outside of `remove_completion()` (eg, by the generalized DELETE route).
+        """
+        local_date = dth.convert_to_timezone(self.user_tz, completion.created_at).date()
+        self.rollup_repo.increment_completed(self._week_start(local_date), -1)
+        self.daily_repo.decrement_count(completion.habit_id, local_date)
+
+        habit = self.habit_repo.get_by_id(completion.habit_id)
+        if habit:
+            self.rebuild_habit_streak(habit)
+
+    def rebuild_habit_streak(self, habit: Habit) -> None:
+        """Recompute a single habit's stored streak state from its completion history."""
+        stats = self.completion_repo.get_streak_stats(self.user_tz, habit.id)
+        self._apply_streak_stats(habit, stats[0] if stats else None)
+
+    def rebuild_all_streaks(self) -> int:
+        """
+        Recompute stored streak state for all of the user's habits from completion history.
+
+        Used by the `flask habits rebuild-streaks` repair command (eg, after a timezone change,
+        or if completions were removed outside of `remove_completion()`). Returns habit count.
+        """
+        habits = self.habit_repo.get_all()
+        self._rebuild_streaks(habits)
+        return len(habits)
+
+    def _rebuild_streaks(self, habits: list[Habit]) -> None:
+        """Recompute stored streak state for `habits` from one streak stats query."""
+        stats_by_habit = {
+            row[0]: row for row in self.completion_repo.get_streak_stats(self.user_tz)
+        }
+        for habit in habits:
+            self._apply_streak_stats(habit, stats_by_habit.get(habit.id))
+
+    def rebuild_rollups(self) -> None:
+        """
+        Recompute daily completion rollups from history and drop weekly ones (lazily rebuilt).
+
+        Used by the `flask habits rebuild-rollups` repair command, eg after a timezone change.
+        """
+        self.daily_repo.rebuild(self.user_tz)
+        self.invalidate_week_progress(all_weeks=True)
+
+    def get_completion_heatmap(
+        self, start_date: date, end_date: date, habit_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return `[{"habit_id": int, "date": "YYYY-MM-DD", "count": int}, ...]` for each local day with
+        completions in the inclusive range, read from the daily rollups.
+        """
+        rows = self.daily_repo.get_daily_counts(start_date, end_date, habit_id)
+        return [
+            {"habit_id": h_id, "date": local_date.isoformat(), "count": count}
+            for h_id, local_date, count in rows
+        ]
+
+    def get_completion_summary_by_bucket(
+        self, last_n_days: int, bucket: str
+    ) -> dict[str, Any]:
+        """
+        Completion counts per habit per local day/week/month over the last N days, columnar.
+
+        Shape: `{"habits": [{"id", "name"}], "buckets": ["YYYY-MM-DD", ...], "counts": [[...]]}`
+        where `counts[i][j]` is habit i's count in bucket j. Buckets are contiguous (empty ones
+        count 0), so a year of daily buckets is one int array per habit.
+        """
+        start_utc, end_utc = dth.last_n_days_range(last_n_days, self.user_tz)
+        rows = self.completion_repo.get_completion_counts_by_habit_and_bucket(
+            start_utc, end_utc, self.user_tz, bucket
+        )
+
+        start_date = dth.convert_to_timezone(self.user_tz, start_utc).date()
+        end_date = dth.now_in_timezone(self.user_tz).date()
+        buckets = self._bucket_starts(start_date, end_date, bucket)
+        bucket_index = {b: i for i, b in enumerate(buckets)}
+
+        habits: list[dict[str, Any]] = []
+        counts: list[list[int]] = []
+        for h_id, name, bucket_start, count in rows:
+            if not habits or habits[-1]["id"] != h_id:
+                habits.append({"id": h_id, "name": name})
+                counts.append([0] * len(buckets))
+            counts[-1][bucket_index[bucket_start]] = count
+
+        return {
+            "habits": habits,
+            "buckets": [b.isoformat() for b in buckets],
+            "counts": counts,
+        }
+
+    @staticmethod
+    def _bucket_starts(start_date: date, end_date: date, bucket: str) -> list[date]:
+        """Start dates of each day/week/month bucket overlapping [start_date, end_date]."""
+        if bucket == "week":
+            current = start_date - timedelta(days=start_date.weekday())
+        elif bucket == "month":
+            current = start_date.replace(day=1)
+        else:
+            current = start_date
+
+        starts = []
+        while current <= end_date:
+            starts.append(current)
+            if bucket == "month":
+                current = (current + timedelta(days=32)).replace(day=1)
+            else:
+                current += timedelta(days=7 if bucket == "week" else 1)
+        return starts
+
+    def add_leetcode_record(self, typed_data: dict[str, Any]) -> LeetCodeRecord:
+        record = self.leetcode_repo.create_leetcoderecord(
+            leetcode_id=typed_data["leetcode_id"],
+            title=typed_data.get("title"),
+            difficulty=typed_data["difficulty"],
+            language=typed_data["language"],
+            status=typed_data["status"],
         )
+        self.invalidate_leetcode_stats()
+        return record
+
+    def get_leetcode_stats(self) -> dict[str, Any]:
+        """
+        LeetCode record counts by difficulty x language x status, plus solved per local week.
+
+        Computed in one GROUPING SETS query and cached per user until the next record write
+        (see `invalidate_leetcode_stats()`). The cache's default timeout still applies, which
+        bounds staleness when other workers' caches miss an invalidation.
+        """
+        key = self._leetcode_stats_key()
+        stats = cache.get(key)
+        if stats is not None:
+            return stats  # type: ignore[no-any-return]
+
+        by_category = []
+        solved_per_week = []
+        for difficulty, language, status, week_start, total, solved, is_week_row in (
+            self.leetcode_repo.get_stats_grouping_sets(self.user_tz)
+        ):
+            if is_week_row:
+                if solved:
+                    solved_per_week.append(
+                        {"week": week_start.isoformat(), "solved": solved}
+                    )
+                continue
+            by_category.append(
+                {
+                    "difficulty": difficulty.value,
+                    "language": language.value,
+                    "status": status.value,
+                    "count": total,
+                }
+            )
 
-        # Expected_completions is sum of target_frequency for all
-        habits = self.habit_repo.get_all_habits_and_tags()
-        expected_completions = sum(h.target_frequency or 0 for h in habits)
+        stats = {
+            "total": sum(row["count"] for row in by_category),
+            "by_category": by_category,
+            "solved_per_week": solved_per_week,
+        }
+        cache.set(key, stats)
+        return stats
+
+    def invalidate_leetcode_stats(self) -> None:
+        cache.delete(self._leetcode_stats_key())
+
+    def _leetcode_stats_key(self) -> str:
+        return LEETCODE_STATS_CACHE_KEY.format(user_id=self.leetcode_repo.user_id)
+
+    @staticmethod
+    def _apply_streak_stats(
+        habit: Habit, stats: tuple[int, date, int, int] | None
+    ) -> None:
+        if stats is None:
+            habit.current_streak = 0
+            habit.longest_streak = 0
+            habit.last_completed_date = None  # type: ignore[assignment]
+            return
+
+        _, last_date, current_run, longest_run = stats
+        habit.last_completed_date = last_date
+        habit.current_streak = current_run
+        habit.longest_streak = longest_run
+
+    # NOTE: "Percent completion habits this week" - Mon to Sun
+    def calculate_all_habits_percentage_this_week(self) -> dict[str, Any]:
+        """
+        Calculate aggregate habit completion progress for the current week.
+
+        Returns the number of recorded habit completions in the current (Mon-Sun) week, the
+        total expected completions based on each habit's target frequency, and the resulting
+        completion percentage.
+
+        Served from the week's HabitWeeklyRollup row in one indexed lookup. On a miss, falls back
+        to `_aggregate_week_progress()` and stores the result for subsequent calls.
+        """
+        week_start = self._week_start(dth.now_in_timezone(self.user_tz).date())
+
+        progress = self.rollup_repo.get_week_progress(week_start)
+        if progress is None:
+            progress = self._aggregate_week_progress(week_start)
+            self.rollup_repo.insert_week_progress(week_start, *progress)
+        total_completions, expected_completions = progress
 
         # Calculate completion percentage
         percent_completed = (
@@ -154,6 +519,33 @@ class HabitsService:
             "percent": percent_completed,
         }
 
+    def invalidate_week_progress(self, *, all_weeks: bool = False) -> None:
+        """
+        Drop current (and any later) weekly rollups, eg when target frequencies change.
+
+        `all_weeks` also drops past weeks, for changes that rewrite history (eg, deleting a
+        habit along with its completions).
+        """
+        if all_weeks:
+            self.rollup_repo.delete_weeks_from(None)
+            return
+        today = dth.now_in_timezone(self.user_tz).date()
+        self.rollup_repo.delete_weeks_from(self._week_start(today))
+
+    def _aggregate_week_progress(self, week_start: date) -> tuple[int, int]:
+        """Returns (completed, expected) for the week via two aggregate queries."""
+        start_utc, _ = dth.day_range_utc(week_start, self.user_tz)
+        end_utc, _ = dth.day_range_utc(week_start + timedelta(days=7), self.user_tz)
+
+        completed = self.completion_repo.count_completions_in_window(start_utc, end_utc)
+        expected = self.habit_repo.get_total_target_frequency()
+        return completed, expected
+
+    @staticmethod
+    def _week_start(local_date: date) -> date:
+        """Monday of the ISO week containing `local_date`."""
+        return local_date - timedelta(days=local_date.weekday())
+
 
 def create_habits_service(
     session: Session, user_id: int, user_tz: str
@@ -165,4 +557,123 @@ def create_habits_service(
         habit_repo=HabitRepository(session, user_id),
         completion_repo=HabitCompletionRepository(session, user_id),
         leetcode_repo=LeetCodeRecordRepository(session, user_id),
+        rollup_repo=HabitWeeklyRollupRepository(session, user_id),
+        daily_repo=HabitDailyRollupRepository(session, user_id),
     )
+
+
+def evaluate_habit_promotions(
+    session: Session,
+    *,
+    window_days: int = PROMOTION_WINDOW_DAYS,
+    batch_size: int = PROMOTION_USER_BATCH_SIZE,
+) -> dict[str, Any]:
+    """
+    Promote EXPERIMENTAL habits whose trailing completion rate meets their promotion_threshold.
+
+    Walks all users in id-ordered batches: one grouped rate query plus one set-based UPDATE
+    per batch, regardless of habit count. Meant to be run on a schedule via
+    `flask habits evaluate-promotions`. Returns evaluated/promoted counts & elapsed seconds.
+    """
+    started = time.perf_counter()
+    now = dth.now_utc()
+    window_start_utc = now - timedelta(days=window_days)
+
+    users_repo = UsersRepository(session)
+    promotion_repo = HabitPromotionRepository(session)
+
+    users = evaluated = promoted = 0
+    last_user_id = 0
+    while user_ids := users_repo.get_user_ids_after(last_user_id, batch_size):
+        last_user_id = user_ids[-1]
+        users += len(user_ids)
+
+        rates = promotion_repo.get_experimental_completion_rates(
+            user_ids, window_start_utc, window_days
+        )
+        evaluated += len(rates)
+        promoted += promotion_repo.promote_habits(
+            [h_id for h_id, rate, threshold in rates if rate >= threshold], now
+        )
+
+    report = {
+        "users": users,
+        "evaluated": evaluated,
+        "promoted": promoted,
+        "elapsed_s": round(time.perf_counter() - started, 3),
+    }
+    logger.info("Habit promotion evaluation: %s", report)
+    return report
+
+
+@register_patch_hook("habits")
+def habits_patch_hook(
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized PATCH routes to refresh weekly progress (target frequency)."""
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    habits_service.invalidate_week_progress()
+    return {"progress": habits_service.calculate_all_habits_percentage_this_week()}
+
+
+@register_patch_hook("habit_completions")
+def habit_completions_patch_hook(
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized PATCH routes; an edited timestamp can move a completion anywhere."""
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    for habit in {item.habit_id: item.habit for item in items}.values():
+        habits_service.rebuild_habit_streak(habit)
+        habits_service.daily_repo.rebuild(current_user.timezone, habit.id)
+    habits_service.invalidate_week_progress(all_weeks=True)
+    return {"progress": habits_service.calculate_all_habits_percentage_this_week()}
+
+
+@register_delete_hook("habits")
+def habits_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route; the habit's completions go with it."""
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    habits_service.invalidate_week_progress(all_weeks=True)
+    return {"progress": habits_service.calculate_all_habits_percentage_this_week()}
+
+
+@register_delete_hook("habit_completions")
+def habit_completions_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route to roll back streak state & weekly progress."""
+    habits_service = create_habits_service(
+        session, current_user.id, current_user.timezone
+    )
+    habits_service.sync_deleted_completion(item)
+    return {"progress": habits_service.calculate_all_habits_percentage_this_week()}
+
+
+@register_patch_hook("leet_code_records")
+def leetcode_records_patch_hook(
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized PATCH routes to drop the user's cached LeetCode stats."""
+    create_habits_service(
+        session, current_user.id, current_user.timezone
+    ).invalidate_leetcode_stats()
+    return {}
+
+
+@register_delete_hook("leet_code_records")
+def leetcode_records_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route to drop the user's cached LeetCode stats."""
+    create_habits_service(
+        session, current_user.id, current_user.timezone
+    ).invalidate_leetcode_stats()
+    return {}
@@ -14,6 +14,13 @@ STATUS_INVALID = invalid("Status")
 HABIT_REQUIRED = required("Habit")
 HABIT_ID_INVALID = invalid("Habit ID")
 
+# Bulk completion backfill
+BULK_COMPLETIONS_MAX = 5000
+
+COMPLETIONS_REQUIRED = required("Completions")
+COMPLETIONS_TOO_MANY = f"Completions cannot exceed {BULK_COMPLETIONS_MAX} items"
+COMPLETED_AT_INVALID = invalid("Completion time")
+
 # LeetCode Record
 LC_TITLE_MAX_LENGTH = 200
 LC_TITLE_TOO_LONG = too_long("Title", LC_TITLE_MAX_LENGTH)
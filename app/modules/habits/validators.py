@@ -7,6 +7,7 @@ from app.modules.habits.models import (
     LCStatusEnum,
     StatusEnum,
 )
+from app.shared.datetime_.helpers import parse_js_instant
 from app.shared.decorators import log_validator
 from app.shared.validators import validate_enum
 
@@ -107,6 +108,44 @@ def validate_habit_completion(
     return (typed_data, errors)
 
 
+@log_validator
+def validate_completions_batch(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Validate a bulk completion backfill: `{"completions": [{"habit_id", "completed_at"}, ...]}`.
+
+    Returns (typed_data, errors), with typed_data["completions"] as (habit_id, completed_at UTC)
+    tuples. Errors are reported per item index.
+    """
+    items = data.get("completions")
+    if not items or not isinstance(items, list):
+        return ({}, {"completions": [c.COMPLETIONS_REQUIRED]})
+    if len(items) > c.BULK_COMPLETIONS_MAX:
+        return ({}, {"completions": [c.COMPLETIONS_TOO_MANY]})
+
+    completions = []
+    item_errors = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            item_errors.append(f"Item {i}: {c.HABIT_REQUIRED}")
+            continue
+        habit_data, habit_errors = validate_habit_completion(item)
+        if habit_errors:
+            item_errors.extend(f"Item {i}: {e}" for e in habit_errors["habit_id"])
+            continue
+        try:
+            completed_at = parse_js_instant(str(item.get("completed_at")))
+        except ValueError:
+            item_errors.append(f"Item {i}: {c.COMPLETED_AT_INVALID}")
+            continue
+        completions.append((habit_data["habit_id"], completed_at))
+
+    if item_errors:
+        return ({}, {"completions": item_errors})
+    return ({"completions": completions}, {})
+
+
 def validate_leetcode_id(leetcode_id: str | None) -> tuple[int | None, list[str]]:
     """Required. Valid integer ID."""
     if not leetcode_id:
@@ -61,6 +61,16 @@ class DailyMetricsRepository(BaseRepository[DailyMetrics]):
         result = self.session.execute(stmt).scalars().all()
         return list(result)
 
+    def get_daily_metrics_page_in_window(
+        self, start_utc: datetime, end_utc: datetime, **page: Any  # noqa: ANN401
+    ) -> tuple[list[DailyMetrics], str | None]:
+        """One sorted page of `get_all_daily_metrics_in_window` (see `BaseRepository.get_page`)."""
+        stmt = self._user_select(DailyMetrics).where(
+            DailyMetrics.entry_datetime >= start_utc,
+            DailyMetrics.entry_datetime < end_utc,
+        )
+        return self.get_page(stmt, **page)
+
     def get_daily_metrics_by_type_in_window(
         self, metric_type: str, start_utc: datetime, end_utc: datetime
     ) -> list[Any]:
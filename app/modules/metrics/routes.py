@@ -11,9 +11,8 @@ from flask_login import current_user
 import app.shared.datetime_.helpers as dth
 from app.modules.metrics.service import create_metrics_service
 from app.modules.metrics.viewmodels import DailyMetricPresenter, DailyMetricViewModel
-from app.shared.collection_utils import sort_by_field
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import get_table_params
+from app.shared.parsers_ import get_table_params, page_kwargs
 
 metrics_bp = Blueprint(
     "metrics", __name__, template_folder="templates", url_prefix="/metrics"
@@ -27,19 +26,21 @@ def dashboard(session: Session) -> tuple[str, int]:
         session, current_user.id, current_user.timezone
     )
 
-    daily_metrics_params = get_table_params("daily_metrics", "entry_datetime")
+    daily_metrics_params = get_table_params(
+        "daily_metrics", "entry_datetime", DailyMetricPresenter.sort_fields()
+    )
 
     start_utc, end_utc = dth.last_n_days_range(
         daily_metrics_params["range"], current_user.timezone
     )
-    metric_entries = (
-        daily_metrics_service.daily_metrics_repo.get_all_daily_metrics_in_window(
-            start_utc, end_utc
+    metric_entries, daily_metrics_params["next_cursor"] = (
+        daily_metrics_service.daily_metrics_repo.get_daily_metrics_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=DailyMetricPresenter.sort_fields(),
+            **page_kwargs(daily_metrics_params),
         )
     )
-    metric_entries = sort_by_field(
-        metric_entries, daily_metrics_params["sort_by"], daily_metrics_params["order"]
-    )
     viewmodels = [
         DailyMetricViewModel(e, current_user.timezone) for e in metric_entries
     ]
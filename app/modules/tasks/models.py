@@ -2,13 +2,16 @@
 Database models for the Tasks module.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import ClassVar
 
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
+    Index,
+    Integer,
     String,
     UniqueConstraint,
 )
@@ -45,6 +48,10 @@ class Task(Base, CustomBaseTaskMixin, APISerializable):
             name="ck_frog_priority_mutually_exclusive",
         ),
         UniqueConstraint("user_id", "name", name="uq_user_task_name"),
+        # Due-date windows: home page list (regular tasks), frog lookup, today's progress
+        Index("ix_user_task_is_frog_due_date", "user_id", "is_frog", "due_date"),
+        # Today's progress: undated tasks completed in the window
+        Index("ix_user_task_completed_at", "user_id", "completed_at"),
     )
 
     name: Mapped[str] = mapped_column(String(TASK_NAME_MAX_LENGTH), nullable=False)
@@ -73,3 +80,27 @@ class Task(Base, CustomBaseTaskMixin, APISerializable):
 
     def __repr__(self) -> str:
         return f"<Task id={self.id} name='{self.name}'>"
+
+
+class TaskDailyRollup(Base):
+    """
+    Per-user task progress for one local date, read by the progress bar in one indexed lookup.
+
+    Acts as a read-through cache: rows are created on first read and dropped by task writes
+    (TasksService / the generic PATCH & DELETE hooks). Deleting a row is always safe, it's
+    simply recomputed.
+    """
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "local_date", name="uq_user_task_local_date"),
+    )
+
+    local_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Tasks due that day, plus undated tasks completed that day
+    expected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<TaskDailyRollup id={self.id} local_date={self.local_date} {self.completed}/{self.expected}>"
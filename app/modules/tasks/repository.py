@@ -4,14 +4,18 @@ Repository layer for Tasks module.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from datetime import date, datetime
 
     from sqlalchemy.orm import Session
 
-from app.modules.tasks.models import PriorityEnum, Task
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+
+from app.modules.tasks.models import PriorityEnum, Task, TaskDailyRollup
 from app.shared.repository.base import BaseRepository
 
 
@@ -37,10 +41,28 @@ class TaskRepository(BaseRepository[Task]):
         )
         return self.add(task)
 
-    def get_all_regular_tasks(self) -> list[Task]:
-        stmt = self._user_select(Task).where(~Task.is_frog)
+    def get_regular_tasks_due_in_window_or_undated(
+        self, start_utc: datetime, end_utc: datetime
+    ) -> list[Task]:
+        """Non-frog tasks due in the window, plus undated ones (the home page's task list)."""
+        stmt = (
+            self._user_select(Task)
+            .where(
+                ~Task.is_frog,
+                or_(
+                    and_(Task.due_date >= start_utc, Task.due_date < end_utc),
+                    Task.due_date.is_(None),
+                ),
+            )
+            .order_by(Task.id)
+        )
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_tasks_page(self, **page: Any) -> tuple[list[Task], str | None]:  # noqa: ANN401
+        """One sorted page of all the user's tasks (see `BaseRepository.get_page`), with tags loaded."""
+        stmt = self._user_select(Task).options(selectinload(Task.tags))
+        return self.get_page(stmt, **page)
+
     def get_all_tasks_in_window(
         self, start_utc: datetime, end_utc: datetime
     ) -> list[Task]:
@@ -49,6 +71,26 @@ class TaskRepository(BaseRepository[Task]):
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    def count_progress_in_window(
+        self, start_utc: datetime, end_utc: datetime
+    ) -> tuple[int, int]:
+        """
+        Returns (completed, expected) for the window in one aggregate query: tasks due in it,
+        plus "spontaneous" undated tasks completed in it. Only touches rows in the window.
+        """
+        # Both is_frog values spelled out, so (user_id, is_frog, due_date) can seek on due_date
+        due = and_(
+            Task.is_frog.in_((False, True)), Task.due_date >= start_utc, Task.due_date < end_utc
+        )
+        completed = and_(Task.completed_at >= start_utc, Task.completed_at < end_utc)
+        spontaneous = and_(Task.due_date.is_(None), completed)
+        stmt = select(
+            func.count().filter(completed),
+            func.count(),
+        ).where(Task.user_id == self.user_id, or_(due, spontaneous))
+        num_completed, num_expected = self.session.execute(stmt).one()
+        return num_completed, num_expected
+
     def get_frog_task_in_window(
         self, start_utc: datetime, end_utc: datetime
     ) -> Task | None:
@@ -57,3 +99,37 @@ class TaskRepository(BaseRepository[Task]):
             Task.is_frog, Task.due_date >= start_utc, Task.due_date < end_utc
         )
         return self.session.execute(stmt).scalars().first()
+
+
+class TaskDailyRollupRepository(BaseRepository[TaskDailyRollup]):
+    def __init__(self, session: Session, user_id: int) -> None:
+        super().__init__(session, user_id, model_cls=TaskDailyRollup)
+
+    def get_day_progress(self, local_date: date) -> tuple[int, int] | None:
+        """Returns (completed, expected) for the day, or None if not rolled up yet."""
+        stmt = select(TaskDailyRollup.completed, TaskDailyRollup.expected).where(
+            TaskDailyRollup.user_id == self.user_id,
+            TaskDailyRollup.local_date == local_date,
+        )
+        row = self.session.execute(stmt).first()
+        return (row.completed, row.expected) if row else None
+
+    def insert_day_progress(self, local_date: date, completed: int, expected: int) -> None:
+        """Insert a day's rollup. No-op if a concurrent request already inserted it."""
+        stmt = (
+            insert(TaskDailyRollup)
+            .values(
+                user_id=self.user_id,
+                local_date=local_date,
+                completed=completed,
+                expected=expected,
+            )
+            .on_conflict_do_nothing(constraint="uq_user_task_local_date")
+        )
+        self.session.execute(stmt)
+
+    def delete_all(self) -> None:
+        """Drop all the user's rollups, so they're recomputed on next read."""
+        self.session.execute(
+            delete(TaskDailyRollup).where(TaskDailyRollup.user_id == self.user_id)
+        )
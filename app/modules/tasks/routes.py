@@ -8,9 +8,8 @@ from flask_login import current_user
 
 from app.modules.tasks.service import create_tasks_service
 from app.modules.tasks.viewmodels import TaskPresenter, TaskViewModel
-from app.shared.collection_utils import sort_by_field
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import get_table_params
+from app.shared.parsers_ import get_table_params, page_kwargs
 
 tasks_bp = Blueprint(
     "tasks", __name__, template_folder="templates", url_prefix="/tasks"
@@ -20,13 +19,14 @@ tasks_bp = Blueprint(
 @tasks_bp.get("/dashboard")
 @login_plus_session
 def dashboard(session: "Session") -> tuple[str, int]:
-    tasks_params = get_table_params("tasks", "due_date")
+    tasks_params = get_table_params("tasks", "due_date", TaskPresenter.sort_fields())
 
     tasks_service = create_tasks_service(
         session, current_user.id, current_user.timezone
     )
-    tasks = tasks_service.task_repo.get_all()
-    tasks = sort_by_field(tasks, tasks_params["sort_by"], tasks_params["order"])
+    tasks, tasks_params["next_cursor"] = tasks_service.task_repo.get_tasks_page(
+        sortable=TaskPresenter.sort_fields(), **page_kwargs(tasks_params)
+    )
 
     viewmodel = [TaskViewModel(t, current_user.timezone) for t in tasks]
 
@@ -12,8 +12,8 @@ from zoneinfo import ZoneInfo
 
 import app.shared.datetime_.helpers as dth
 from app.api.responses import service_response
-from app.modules.tasks.repository import TaskRepository
-from app.shared.hooks import register_patch_hook
+from app.modules.tasks.repository import TaskDailyRollupRepository, TaskRepository
+from app.shared.hooks import register_delete_hook, register_patch_hook
 
 
 class TasksService:
@@ -22,9 +22,11 @@ class TasksService:
         session: Session,
         user_tz: str,
         task_repo: TaskRepository,
+        rollup_repo: TaskDailyRollupRepository,
     ) -> None:
         self.session = session
         self.task_repo = task_repo
+        self.rollup_repo = rollup_repo
         self.user_tz = user_tz
 
     def save_task(
@@ -61,6 +63,7 @@ class TasksService:
             for field, value in typed_data.items():
                 setattr(task, field, value)
 
+            self.invalidate_day_progress()
             return service_response(
                 success=True, message="Task updated", data={"task": task}
             )
@@ -72,6 +75,7 @@ class TasksService:
                 due_date=typed_data.get("due_date"),
                 is_frog=typed_data["is_frog"],
             )
+            self.invalidate_day_progress()
             return service_response(
                 success=True, message="Task added", data={"task": task}
             )
@@ -86,29 +90,21 @@ class TasksService:
         return eod_midnight - timedelta(seconds=1)
 
     def calculate_tasks_progress_today(self) -> dict[str, Any]:
-        all_tasks = self.task_repo.get_all()
-
-        # Count completed vs expected for today
-        num_completed = 0
-        num_expected = 0
-
-        for task in all_tasks:
-            due_today = task.due_date and dth.is_same_local_date(
-                task.due_date, self.user_tz
-            )
-            completed_today = task.completed_at and dth.is_same_local_date(
-                task.completed_at, self.user_tz
-            )
-
-            if due_today:
-                num_expected += 1
-                if completed_today:
-                    num_completed += 1
-
-            elif completed_today and task.due_date is None:
-                # "spontaneous" task, completed today without a due date
-                num_completed += 1
-                num_expected += 1
+        """
+        Today's task progress: tasks due today, plus "spontaneous" undated tasks completed
+        today, and how many of those are completed.
+
+        Served from today's TaskDailyRollup row in one indexed lookup. On a miss, falls back to
+        `TaskRepository.count_progress_in_window()` and stores the result for subsequent calls.
+        """
+        today = dth.now_in_timezone(self.user_tz).date()
+
+        progress = self.rollup_repo.get_day_progress(today)
+        if progress is None:
+            start_utc, end_utc = dth.day_range_utc(today, self.user_tz)
+            progress = self.task_repo.count_progress_in_window(start_utc, end_utc)
+            self.rollup_repo.insert_day_progress(today, *progress)
+        num_completed, num_expected = progress
 
         percent_complete = (
             (num_completed / num_expected * 100) if num_expected > 0 else 0
@@ -120,6 +116,10 @@ class TasksService:
             "percent": percent_complete,
         }
 
+    def invalidate_day_progress(self) -> None:
+        """Drop the user's daily rollups after any task write (a due date can move anywhere)."""
+        self.rollup_repo.delete_all()
+
 
 def create_tasks_service(session: Session, user_id: int, user_tz: str) -> TasksService:
     """Factory function to instantiate HabitsService with required repositories."""
@@ -127,16 +127,30 @@ def create_tasks_service(session: Session, user_id: int, user_tz: str) -> TasksS
         session=session,
         user_tz=user_tz,
         task_repo=TaskRepository(session, user_id),
+        rollup_repo=TaskDailyRollupRepository(session, user_id),
     )
 
 
 @register_patch_hook("tasks")
 def tasks_patch_hook(
-    item: Any, data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+    items: list[Any], data: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
 ) -> dict[str, Any]:
-    """Invoked by generalized PATCH route to re-calculate tasks progress upon changes."""
+    """Invoked by generalized PATCH routes to re-calculate tasks progress upon changes (once per batch)."""
     tasks_service = create_tasks_service(
         session, current_user.id, current_user.timezone
     )
+    tasks_service.invalidate_day_progress()
     progress = tasks_service.calculate_tasks_progress_today()
     return {"progress": progress}
+
+
+@register_delete_hook("tasks")
+def tasks_delete_hook(
+    item: Any, session: Session, current_user: User   # noqa: ANN401,ARG001
+) -> dict[str, Any]:
+    """Invoked by generalized DELETE route to take the task out of today's progress."""
+    tasks_service = create_tasks_service(
+        session, current_user.id, current_user.timezone
+    )
+    tasks_service.invalidate_day_progress()
+    return {"progress": tasks_service.calculate_tasks_progress_today()}
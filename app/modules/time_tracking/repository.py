@@ -2,13 +2,18 @@
 Repository layer for time_tracking module.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy import Row
     from sqlalchemy.orm import Session
 
 from datetime import datetime
 
+from sqlalchemy import select
+
 from app.modules.time_tracking.models import TimeEntry
 from app.shared.repository.base import BaseRepository
 
@@ -44,6 +49,31 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    def iter_time_entry_rows_in_window(
+        self, start_utc: datetime, end_utc: datetime
+    ) -> "Iterator[Sequence[Row[Any]]]":
+        """Batches of column rows for `get_all_time_entries_in_window`, for streamed responses."""
+        stmt = (
+            select(*TimeEntry.__table__.columns)
+            .where(
+                TimeEntry.user_id == self.user_id,
+                TimeEntry.started_at >= start_utc,
+                TimeEntry.ended_at < end_utc,
+            )
+            .order_by(TimeEntry.started_at, TimeEntry.id)
+        )
+        return self.iter_batches(stmt)
+
+    def get_time_entries_page_in_window(
+        self, start_utc: datetime, end_utc: datetime, **page: Any  # noqa: ANN401
+    ) -> tuple[list[TimeEntry], str | None]:
+        """One sorted page of `get_all_time_entries_in_window` (see `BaseRepository.get_page`)."""
+        stmt = self._user_select(TimeEntry).where(
+            TimeEntry.started_at >= start_utc,
+            TimeEntry.ended_at < end_utc,
+        )
+        return self.get_page(stmt, **page)
+
     def get_entries_by_category_in_window(
         self,
         category: str,
@@ -9,9 +9,8 @@ from flask_login import current_user
 import app.shared.datetime_.helpers as dth
 from app.modules.time_tracking.service import create_time_tracking_service
 from app.modules.time_tracking.viewmodels import TimeEntryPresenter, TimeEntryViewModel
-from app.shared.collection_utils import sort_by_field
 from app.shared.decorators import login_plus_session
-from app.shared.parsers_ import get_table_params
+from app.shared.parsers_ import get_table_params, page_kwargs
 
 time_tracking_bp = Blueprint(
     "time_tracking", __name__, template_folder="templates", url_prefix="/time_tracking"
@@ -21,7 +20,9 @@ time_tracking_bp = Blueprint(
 @time_tracking_bp.get("/dashboard")
 @login_plus_session
 def dashboard(session: "Session") -> tuple[str, int]:
-    time_entries_params = get_table_params("time_entries", "started_at")
+    time_entries_params = get_table_params(
+        "time_entries", "started_at", TimeEntryPresenter.sort_fields()
+    )
     time_service = create_time_tracking_service(
         session, current_user.id, current_user.timezone
     )
@@ -29,11 +30,13 @@ def dashboard(session: "Session") -> tuple[str, int]:
     start_utc, end_utc = dth.last_n_days_range(
         time_entries_params["range"], current_user.timezone
     )
-    time_entries = time_service.time_entry_repo.get_all_time_entries_in_window(
-        start_utc, end_utc
-    )
-    time_entries = sort_by_field(
-        time_entries, time_entries_params["sort_by"], time_entries_params["order"]
+    time_entries, time_entries_params["next_cursor"] = (
+        time_service.time_entry_repo.get_time_entries_page_in_window(
+            start_utc,
+            end_utc,
+            sortable=TimeEntryPresenter.sort_fields(),
+            **page_kwargs(time_entries_params),
+        )
     )
     viewmodels = [TimeEntryViewModel(e, current_user.timezone) for e in time_entries]
 
@@ -47,12 +47,9 @@ def home() -> tuple[str, int]:
 
         start_utc, end_utc = dth.day_range_utc(today, user_tz)
         today_frog = tasks_service.task_repo.get_frog_task_in_window(start_utc, end_utc)
-        tasks = tasks_service.task_repo.get_all_regular_tasks()
-        filtered_tasks = [
-            t
-            for t in tasks
-            if (t.due_date is None) or dth.is_same_local_date(t.due_date, user_tz)
-        ]
+        filtered_tasks = tasks_service.task_repo.get_regular_tasks_due_in_window_or_undated(
+            start_utc, end_utc
+        )
 
         start_utc, end_utc = dth.today_range_utc(user_tz)
         leetcode_records = (
@@ -61,13 +58,7 @@ def home() -> tuple[str, int]:
             )
         )
 
-        habit_info = {
-            habit.id: {
-                "completed_today": habits_service.check_if_completed_today(habit.id),
-                "streak_count": habits_service.calculate_habit_streak(habit.id),
-            }
-            for habit in habits
-        }
+        habit_info = habits_service.get_habit_summaries(habits)
 
         # Progress bars
         habits_progress = habits_service.calculate_all_habits_percentage_this_week()
@@ -27,6 +27,15 @@ def seed_data_for(session: Session, user: User) -> None:
     else:
         seed_demo_data(session, user.id)
 
+    # Seeded completions bypass HabitsService, so derive streak state & rollups after the fact
+    # Local import: habits.service -> app.api -> auth.service -> here (circular)
+    from app.modules.habits.service import create_habits_service  # noqa: PLC0415
+
+    session.flush()
+    habits_service = create_habits_service(session, user.id, user.timezone)
+    habits_service.rebuild_all_streaks()
+    habits_service.rebuild_rollups()
+
 
 # Minimal dataset for demo users
 def seed_demo_data(session: Session, user_id: int) -> None:
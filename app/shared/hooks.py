@@ -1,7 +1,11 @@
 from collections.abc import Callable
 from typing import Any
 
+# PATCH hooks run once per request, single-item or batch: hook(items, data, session, current_user)
+# `items` are the updated rows; `data` holds every patched field (merged across a batch).
 PATCH_HOOKS: dict[str, Callable[..., Any]] = {}
+# DELETE hooks run per item: hook(item, session, current_user)
+DELETE_HOOKS: dict[str, Callable[..., Any]] = {}
 
 
 def register_patch_hook(
@@ -12,3 +16,13 @@ def register_patch_hook(
         return func
 
     return decorator
+
+
+def register_delete_hook(
+    subtype: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        DELETE_HOOKS[subtype] = func
+        return func
+
+    return decorator
@@ -0,0 +1,95 @@
+"""
+Flask JSON providers for API responses (`jsonify`, `api_response`, `app.json`).
+
+Both providers encode the types our payloads actually carry without preprocessing:
+- Decimal  -> string (exact; same as Flask's default, so clients see no change)
+- datetime/date -> ISO 8601 string (Flask's default would emit an HTTP date)
+- Enum     -> .value
+- SQLAlchemy Row -> object keyed by column label
+
+`OrjsonProvider` is the fast path; `StdJSONProvider` is the stdlib fallback, used when
+`JSON_PROVIDER = "std"` or orjson isn't installed. See `init_json_provider`.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from sqlalchemy import Row
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:  # noqa: ANN401
+    """Encodes what neither encoder handles natively. Raises TypeError otherwise."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class StdJSONProvider(DefaultJSONProvider):
+    """Flask's default provider, with our type handling in place of its `default`."""
+
+    default = staticmethod(_default)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    orjson-backed provider. datetime/date/Enum are encoded natively; Decimal & Row go
+    through `_default`. Non-string dict keys (ints, dates) are stringified like the stdlib.
+
+    Extra `json.dumps` kwargs (eg, `separators` from Flask's session serializer) are
+    accepted and ignored, since orjson output is already compact.
+    """
+
+    OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:  # noqa: ANN401,ARG002
+        return self._dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:  # noqa: ANN401,ARG002
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:  # noqa: ANN401
+        obj = self._prepare_response_obj(args, kwargs)
+        return Response(self._dumps_bytes(obj) + b"\n", mimetype="application/json")
+
+    def _dumps_bytes(self, obj: Any) -> bytes:  # noqa: ANN401
+        option = self.OPTIONS
+        if self._app.debug:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Installs the provider named by `JSON_PROVIDER` ("orjson" or "std")."""
+    choice = app.config.get("JSON_PROVIDER", "orjson")
+    if choice == "orjson" and orjson is None:
+        logger.warning("JSON_PROVIDER is 'orjson' but orjson isn't installed; using stdlib json")
+        choice = "std"
+    if choice not in ("orjson", "std"):
+        msg = f"Unknown JSON_PROVIDER '{choice}'"
+        raise RuntimeError(msg)
+
+    app.json = OrjsonProvider(app) if choice == "orjson" else StdJSONProvider(app)
@@ -10,12 +10,18 @@ Normalizes incoming values:
 Includes small helpers for parsing request args used by API routes.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
-from flask import request
+from flask import abort, request
 
 from app.shared.decorators import log_parser
+from app.shared.repository.base import (
+    PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAX,
+    SORT_ORDERS,
+    decode_cursor,
+)
 
 
 def _stripped(val: str | None) -> str | None:
@@ -112,21 +118,74 @@ TIME_ENTRY_SCHEMA = {
     "ended_at": _passthrough,
 }
 
-def get_table_params(prefix: str, default_sort: str) -> dict[str, Any]:
+def get_page_params(
+    default_sort: str, sortable: Collection[str], prefix: str | None = None
+) -> dict[str, Any]:
+    """
+    Extracts keyset paging parameters (sort, order, cursor, limit) from the query string.
+
+    Unknown sort fields/orders fall back to the defaults, so stale links still render.
+    A cursor that is malformed or was issued for a different sort is rejected with 400.
+
+    Args:
+        default_sort: Field to sort by if missing/not whitelisted; must be in `sortable`
+        sortable: Whitelisted sort fields (see `BasePresenter.sort_fields`)
+        prefix: Table prefix for dashboards with several tables (eg, 'transactions')
+    """
+    if default_sort not in sortable:
+        msg = f"Default sort '{default_sort}' is not in the sortable fields"
+        raise ValueError(msg)
+
+    def arg(name: str) -> str:
+        return f"{prefix}_{name}" if prefix else name
+
+    sort_by = request.args.get(arg("sort"), default_sort)
+    if sort_by not in sortable:
+        sort_by = default_sort
+    order = request.args.get(arg("order"), "desc")
+    if order not in SORT_ORDERS:
+        order = "desc"
+
+    cursor = request.args.get(arg("cursor")) or None
+    if cursor is not None:
+        try:
+            cursor_sort, cursor_order, _, _ = decode_cursor(cursor)
+        except ValueError:
+            abort(400, description="Invalid cursor")
+        if (cursor_sort, cursor_order) != (sort_by, order):
+            abort(400, description="Cursor does not match the requested sort")
+
+    limit = request.args.get(arg("limit"), PAGE_SIZE_DEFAULT, type=int)
+    return {
+        "sort_by": sort_by,
+        "order": order,
+        "cursor": cursor,
+        "limit": max(1, min(limit, PAGE_SIZE_MAX)),
+    }
+
+
+def get_table_params(
+    prefix: str, default_sort: str, sortable: Collection[str]
+) -> dict[str, Any]:
     """
     Extracts table state parameters from request query parameters and
     returns them as a dict.
 
     Args:
-        subtype: The table/entity type (eg., 'habits', 'time_entries')
+        prefix: The table/entity type (eg., 'habits', 'time_entries')
         default_sort: The default field to sort by if not specified in query params
+        sortable: Whitelisted sort fields (see `BasePresenter.sort_fields`)
 
     Returns:
         Dict with 'range' (days to query), 'sort_by' (field to be used as key),
-        and 'order' (asc/desc)
+        'order' (asc/desc), 'cursor' (current page, None for the first) and 'limit'
     """
     return {
         "range": request.args.get(f"{prefix}_range", 7, type=int),
-        "sort_by": request.args.get(f"{prefix}_sort", default_sort),
-        "order": request.args.get(f"{prefix}_order", "desc"),
+        **get_page_params(default_sort, sortable, prefix),
     }
+
+
+def page_kwargs(params: dict[str, Any]) -> dict[str, Any]:
+    """The subset of table/page params accepted by `BaseRepository.get_page`."""
+    return {key: params[key] for key in ("sort_by", "order", "cursor", "limit")}
@@ -1,17 +1,79 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, TypeVar
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from sqlalchemy import Select
+    from collections.abc import Collection, Iterator, Sequence
+
+    from sqlalchemy import ColumnElement, Row, Select, SQLColumnExpression
     from sqlalchemy.orm import Session
 
-from sqlalchemy import func, select
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import inspect as sa_inspect
 
 from app._infra.db_base import Base
+from app.shared.type_defs import OrderedEnum
 
 T = TypeVar("T", bound=Base)
 
+PAGE_SIZE_DEFAULT = 50
+PAGE_SIZE_MAX = 200
+STREAM_BATCH_SIZE = 1000
+SORT_ORDERS = ("asc", "desc")
+
+
+def _encode_value(value: Any) -> Any:  # noqa: ANN401
+    """Tag non-JSON sort values so they decode back to the same Python type."""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if isinstance(value, Enum):
+        return {"e": value.name}
+    return value
+
+
+def _decode_value(value: Any) -> Any:  # noqa: ANN401
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    if "e" in value:
+        # Member name; mapped back to the member against the sort column (see `get_page`)
+        return str(value["e"])
+    return Decimal(value["n"])
+
+
+def encode_cursor(sort_by: str, order: str, value: Any, item_id: int) -> str:  # noqa: ANN401
+    """Opaque keyset cursor: the sort (field, order) it belongs to plus the last row's key."""
+    payload = json.dumps([sort_by, order, _encode_value(value), item_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[str, str, Any, int]:
+    """Inverse of `encode_cursor`. Raises ValueError on anything it didn't produce."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_by, order, value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        value = _decode_value(value)
+    except (TypeError, KeyError, ArithmeticError, ValueError) as e:
+        msg = "Malformed cursor"
+        raise ValueError(msg) from e
+    if not isinstance(sort_by, str) or order not in SORT_ORDERS or not isinstance(item_id, int):
+        msg = "Malformed cursor"
+        raise ValueError(msg)
+    return sort_by, order, value, item_id
+
 
 class BaseRepository(Generic[T]):
     """Base repository for database operations on user-scoped models.
@@ -51,3 +113,152 @@ class BaseRepository(Generic[T]):
             self.model_cls.user_id == self.user_id, self.model_cls.id == item_id
         )
         return self.session.execute(stmt).scalars().first()
+
+    def get_by_ids(self, item_ids: Collection[int]) -> list[T]:
+        """Returns the user's items among `item_ids` in one query (missing/foreign ids are omitted)."""
+        stmt = self._user_select(self.model_cls).where(self.model_cls.id.in_(item_ids))
+        return list(self.session.execute(stmt).scalars().all())
+
+    def iter_batches(
+        self, stmt: Select[Any], batch_size: int | None = None
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """
+        Streams `stmt`'s rows in batches (default `STREAM_BATCH_SIZE`) via a server-side
+        cursor (`yield_per`), so only one batch is held in memory. Must be consumed inside
+        the session's transaction.
+        """
+        result = self.session.execute(
+            stmt.execution_options(yield_per=batch_size or STREAM_BATCH_SIZE)
+        )
+        yield from result.partitions()
+
+    def _sort_expressions(self) -> dict[str, SQLColumnExpression[Any]]:
+        """Sortable fields that aren't plain columns of `model_cls` (joined/computed). Override as needed."""
+        return {}
+
+    def _sort_expression(
+        self, sort_by: str, sortable: Collection[str]
+    ) -> SQLColumnExpression[Any]:
+        """
+        Resolves a whitelisted field to its SQL sort key.
+
+        `OrderedEnum` columns sort by their `sort_order` rank (via CASE) rather than
+        Postgres' declaration order.
+        """
+        extra = self._sort_expressions()
+        column = None if sort_by in extra else sa_inspect(self.model_cls).columns.get(sort_by)
+        if sort_by not in sortable or (sort_by not in extra and column is None):
+            msg = f"Cannot sort {self.model_cls.__name__} by '{sort_by}'"
+            raise ValueError(msg)
+        if column is None:
+            return extra[sort_by]
+
+        enum_cls = column.type.enum_class if isinstance(column.type, SAEnum) else None
+        if enum_cls is not None and issubclass(enum_cls, OrderedEnum):
+            order: list[str] = enum_cls.sort_order  # type: ignore[attr-defined]
+            return case(*((column == enum_cls[name], rank) for rank, name in enumerate(order)))
+        return column
+
+    def get_page(  # noqa: PLR0913
+        self,
+        stmt: Select[Any] | None = None,
+        *,
+        sortable: Collection[str],
+        sort_by: str,
+        order: str = "desc",
+        cursor: str | None = None,
+        limit: int = PAGE_SIZE_DEFAULT,
+    ) -> tuple[list[Any], str | None]:
+        """
+        One keyset page of `stmt` (default: all of the user's `model_cls` rows), sorted in SQL.
+
+        `sortable` is the caller's whitelist (a Presenter's `sort_fields()`). NULLs sort last in
+        either direction, and `id` breaks ties so pages never overlap or skip rows.
+
+        Returns (items, next_cursor); next_cursor is None on the last page. Single-entity
+        statements yield instances, projections yield Rows. Raises ValueError for an unknown
+        sort field or a cursor that doesn't belong to this sort.
+        """
+        if order not in SORT_ORDERS:
+            msg = f"Invalid sort order '{order}'"
+            raise ValueError(msg)
+        if stmt is None:
+            stmt = self._user_select(self.model_cls)
+        sort_expr = self._sort_expression(sort_by, sortable)
+        id_col = self.model_cls.id
+        desc = order == "desc"
+
+        if cursor is not None:
+            cursor_sort, cursor_order, last_value, last_id = decode_cursor(cursor)
+            if (cursor_sort, cursor_order) != (sort_by, order):
+                msg = "Cursor does not match the requested sort"
+                raise ValueError(msg)
+            last_value = self._enum_member(sort_expr, last_value)
+            stmt = stmt.where(self._after(sort_expr, id_col, last_value, last_id, desc=desc))
+
+        descriptions = stmt.column_descriptions
+        unwrap = len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+        stmt = (
+            stmt.add_columns(sort_expr.label("page_sort_key"))
+            .order_by(
+                (sort_expr.desc() if desc else sort_expr.asc()).nulls_last(),
+                id_col.desc() if desc else id_col.asc(),
+            )
+            .limit(limit + 1)
+        )
+        rows = self.session.execute(stmt).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort_by, order, rows[-1][-1], rows[-1][0].id if unwrap else rows[-1].id)
+        items = [row[0] if unwrap else row for row in rows]
+        return items, next_cursor
+
+    def get_columns_page(
+        self,
+        fields: Sequence[str],
+        where: Sequence[ColumnElement[bool]] = (),
+        **page: Any,  # noqa: ANN401
+    ) -> tuple[list[Row[Any]], str | None]:
+        """
+        One `get_page` page of the user's rows, selecting only `fields` (column names of
+        `model_cls`; `id` is always included, for the cursor) and filtered by `where`.
+        Soft-deleted rows are left out.
+        """
+        columns = sa_inspect(self.model_cls).columns
+        names = ["id", *(field for field in fields if field != "id")]
+        stmt = select(*(columns[name] for name in names)).where(
+            self.model_cls.user_id == self.user_id, *where
+        )
+        if "deleted_at" in columns:
+            stmt = stmt.where(columns["deleted_at"].is_(None))
+        return self.get_page(stmt, **page)
+
+    @staticmethod
+    def _enum_member(sort_expr: SQLColumnExpression[Any], value: Any) -> Any:  # noqa: ANN401
+        """Plain enum sort keys travel in cursors by name; look the member back up."""
+        enum_cls = getattr(getattr(sort_expr, "type", None), "enum_class", None)
+        if enum_cls is None or not isinstance(value, str):
+            return value
+        try:
+            return enum_cls[value]
+        except KeyError:
+            msg = "Malformed cursor"
+            raise ValueError(msg) from None
+
+    @staticmethod
+    def _after(
+        sort_expr: SQLColumnExpression[Any],
+        id_col: SQLColumnExpression[Any],
+        last_value: Any,  # noqa: ANN401
+        last_id: int,
+        *,
+        desc: bool,
+    ) -> ColumnElement[bool]:
+        """Keyset predicate for rows after (last_value, last_id) under NULLS LAST ordering."""
+        if last_value is None:
+            return and_(sort_expr.is_(None), id_col < last_id if desc else id_col > last_id)
+        beyond = sort_expr < last_value if desc else sort_expr > last_value
+        tie = and_(sort_expr == last_value, id_col < last_id if desc else id_col > last_id)
+        return or_(beyond, tie, sort_expr.is_(None))
@@ -0,0 +1,153 @@
+"""
+Query-string grammar for generic list endpoints: sparse fieldsets & filters.
+
+Fields and filters are whitelisted to a model's API columns (the columns `to_api_dict`
+exposes). A filter is `<field>:<op>:<value>`, eg `priority:in:HIGH,MEDIUM` or
+`started_at:between:2026-01-01,2026-02-01`; values are parsed per the column's type and
+compiled to SQLAlchemy expressions, so they always reach SQL as bound parameters.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import class_mapper
+
+from app.shared.serialization import EXCLUDE_COLS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Column, ColumnElement
+    from sqlalchemy.orm import Mapper
+
+FILTER_OPS = ("eq", "lt", "between", "in")
+FILTER_IN_MAX = 100
+
+_API_COLUMNS: dict[type, dict[str, Column[Any]]] = {}
+
+
+class FieldFilter(NamedTuple):
+    field: str
+    op: str
+    value: str
+
+    @classmethod
+    def parse(cls, token: str) -> FieldFilter:
+        """Splits `<field>:<op>:<value>` (the value may itself contain colons)."""
+        parts = token.split(":", 2)
+        if len(parts) != 3:  # noqa: PLR2004
+            msg = f"Malformed filter '{token}', expected <field>:<op>:<value>"
+            raise ValueError(msg)
+        return cls(*parts)
+
+
+def api_columns(model_cls: type) -> dict[str, Column[Any]]:
+    """The model's serialized columns by name, in declaration order."""
+    columns = _API_COLUMNS.get(model_cls)
+    if columns is None:
+        mapper: Mapper[Any] = class_mapper(model_cls)
+        exclude = set(EXCLUDE_COLS) | set(getattr(model_cls, "__api_exclude__", ()))
+        columns = {col.name: col for col in mapper.columns if col.name not in exclude}
+        _API_COLUMNS[model_cls] = columns
+    return columns
+
+
+def parse_fields(model_cls: type, raw: str | None) -> list[str]:
+    """Validates a comma-separated `fields=` value; all API columns when missing/empty."""
+    columns = api_columns(model_cls)
+    if not raw:
+        return list(columns)
+    fields = [field.strip() for field in raw.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        msg = f"Unknown fields for {model_cls.__name__}: {', '.join(unknown)}"
+        raise ValueError(msg)
+    return list(dict.fromkeys(fields))
+
+
+def _parse_bool(raw: str) -> bool:
+    if raw not in ("true", "false"):
+        msg = f"'{raw}' is not a boolean (true/false)"
+        raise ValueError(msg)
+    return raw == "true"
+
+
+def _parse_datetime(raw: str) -> datetime:
+    # Naive timestamps are read as UTC, like the rest of the API
+    value = datetime.fromisoformat(raw)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _parse_decimal(raw: str) -> Decimal:
+    try:
+        return Decimal(raw)
+    except InvalidOperation:
+        msg = f"'{raw}' is not a number"
+        raise ValueError(msg) from None
+
+
+# First match wins: Float subclasses Numeric
+_PARSERS: tuple[tuple[type[Any], Callable[[str], Any]], ...] = (
+    (Boolean, _parse_bool),
+    (DateTime, _parse_datetime),
+    (Date, date.fromisoformat),
+    (Integer, int),
+    (Float, float),
+    (Numeric, _parse_decimal),
+)
+
+
+def _coerce(column: Column[Any], raw: str) -> Any:  # noqa: ANN401
+    """Parses a filter value per the column's type. Raises ValueError if it doesn't fit."""
+    col_type = column.type
+    if isinstance(col_type, SAEnum) and col_type.enum_class is not None:
+        try:
+            return col_type.enum_class[raw]
+        except KeyError:
+            msg = f"'{raw}' is not a valid {column.name}"
+            raise ValueError(msg) from None
+    for type_cls, parse in _PARSERS:
+        if isinstance(col_type, type_cls):
+            return parse(raw)
+    return raw
+
+
+def compile_filter(model_cls: type, field_filter: FieldFilter) -> ColumnElement[bool]:
+    """Compiles one filter against `model_cls`. Raises ValueError for anything invalid."""
+    field, op, raw = field_filter
+    column = api_columns(model_cls).get(field)
+    if column is None:
+        msg = f"Cannot filter {model_cls.__name__} by '{field}'"
+        raise ValueError(msg)
+    if op not in FILTER_OPS:
+        msg = f"Unknown filter operator '{op}' (expected one of: {', '.join(FILTER_OPS)})"
+        raise ValueError(msg)
+
+    raw_values = raw.split(",") if op in ("between", "in") else [raw]
+    if op == "between" and len(raw_values) != 2:  # noqa: PLR2004
+        msg = f"'between' on '{field}' takes two comma-separated values"
+        raise ValueError(msg)
+    if op == "in" and len(raw_values) > FILTER_IN_MAX:
+        msg = f"'in' on '{field}' takes at most {FILTER_IN_MAX} values"
+        raise ValueError(msg)
+    try:
+        values = [_coerce(column, value) for value in raw_values]
+    except ValueError as e:
+        msg = f"Invalid value for '{field}': {e}"
+        raise ValueError(msg) from e
+
+    clause: ColumnElement[bool]
+    if op == "eq":
+        clause = column == values[0]
+    elif op == "lt":
+        clause = column < values[0]
+    elif op == "between":
+        clause = column.between(*values)
+    else:
+        clause = column.in_(values)
+    return clause
@@ -1,12 +1,29 @@
-from datetime import datetime
+"""
+JSON serialization for SQLAlchemy models.
+
+Serializers are compiled once per model class (and per row shape, for row tuples) and kept
+in a registry, so per-object work is just attribute reads plus type-specific conversion.
+"""
+
+from collections.abc import Callable, Iterable
 from enum import Enum
-from typing import Any
+from operator import attrgetter, itemgetter, methodcaller
+from typing import Any, ClassVar
 
-from sqlalchemy import inspect
+from sqlalchemy import Date, DateTime, Row
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapper, class_mapper
+from sqlalchemy.types import TypeEngine
 
 # Base exclusions applied to all models
 EXCLUDE_COLS = ["user_id", "updated_at"]
 
+Serializer = Callable[[Any], dict[str, Any]]
+Converter = Callable[[Any], Any]
+
+_SERIALIZERS: dict[type, Serializer] = {}
+_ROW_SERIALIZERS: dict[tuple[type, tuple[str, ...]], Serializer] = {}
+
 
 class APISerializable:
     """
@@ -15,21 +32,24 @@ class APISerializable:
     Usage:
         class Task(Base, APISerializable):
             __api_exclude__ = ['due_date'] # Optional: exclude specific fields per-model
+            __api_extras__ = ('is_overdue',) # Optional: non-column attributes to include
 
             name = Column(String(50))
             ..etc..
     """
 
+    __api_extras__: ClassVar[tuple[str, ...]] = ()
+
     def to_api_dict(self) -> dict[str, Any]:
         """Convert model to JSON-safe dict
 
-        Uses SQLAlchemy introspection to iterate over columns and serialize values.
-        Respects exclusion rules from both `EXCLUDE_COLS` constant and model-specific
-        `__api_exclude__` attribute.
+        Uses the model's compiled serializer (see `get_serializer`), which respects exclusion
+        rules from both `EXCLUDE_COLS` constant and model-specific `__api_exclude__` attribute,
+        then appends any `__api_extras__` attributes.
 
         Special type handling:
         - Enum: Converted to .value
-        - datetime: Converted to ISO format string
+        - datetime/date: Converted to ISO format string
         - Others: Pass through as-is
 
         Returns:
@@ -41,27 +61,107 @@ class APISerializable:
             >>> task.to_api_dict()
             {'id': 1, 'name': 'My Task', 'priority': 'HIGH', ...}
         """
-        mapper = inspect(self.__class__)
-
-        # Build exclusions from global + model-specific excludes
-        exclude = set(EXCLUDE_COLS)
-        if hasattr(self, "__api_exclude__"):
-            exclude.update(self.__api_exclude__)
-
-        result = {}
-        for col in mapper.columns:  # type: ignore[union-attr]
-            if col.name in exclude:
-                continue
-
-            value = getattr(self, col.name)
+        return get_serializer(type(self))(self)
+
+
+def _enum_value(value: Any) -> Any:  # noqa: ANN401
+    # Generic PATCH sets enum columns from raw names, which stay str until the row is reloaded
+    return value.value if isinstance(value, Enum) else value
+
+
+def _converter(col_type: TypeEngine[Any]) -> Converter | None:
+    """Picks the JSON conversion for a column from its declared type (None = pass through)."""
+    if isinstance(col_type, SAEnum) and col_type.enum_class is not None:
+        return _enum_value
+    if isinstance(col_type, (DateTime, Date)):
+        return methodcaller("isoformat")
+    return None
+
+
+def _field_specs(model_cls: type) -> list[tuple[str, Converter | None]]:
+    """(key, converter) per serialized field: non-excluded columns, then `__api_extras__`."""
+    mapper: Mapper[Any] = class_mapper(model_cls)
+    exclude = set(EXCLUDE_COLS) | set(getattr(model_cls, "__api_exclude__", ()))
+    specs = [
+        (col.name, _converter(col.type))
+        for col in mapper.columns
+        if col.name not in exclude
+    ]
+    specs += [(name, None) for name in getattr(model_cls, "__api_extras__", ())]
+    return specs
+
+
+def _build(
+    subtype: str,
+    keys: tuple[str, ...],
+    get_values: Callable[[Any], Any],
+    converters: list[tuple[str, Converter]],
+) -> Serializer:
+    """Closes over precomputed getters so each call is a zip plus a few conversions."""
+    if len(keys) == 1:
+        get_one = get_values
+
+        def get_values(obj: Any) -> tuple[Any, ...]:  # noqa: ANN401
+            return (get_one(obj),)
+
+    def serialize(obj: Any) -> dict[str, Any]:  # noqa: ANN401
+        result = dict(zip(keys, get_values(obj), strict=True))
+        for key, convert in converters:
+            value = result[key]
+            if value is not None:
+                result[key] = convert(value)
+        result["subtype"] = subtype
+        return result
 
-            # Adjustments for specific types
-            if isinstance(value, Enum):
-                result[col.name] = value.value
-            elif isinstance(value, datetime):
-                result[col.name] = value.isoformat()
-            else:
-                result[col.name] = value
+    return serialize
+
+
+def get_serializer(model_cls: type) -> Serializer:
+    """Returns the compiled instance serializer for `model_cls`, compiling it on first use."""
+    serializer = _SERIALIZERS.get(model_cls)
+    if serializer is None:
+        specs = _field_specs(model_cls)
+        keys = tuple(key for key, _ in specs)
+        serializer = _build(
+            model_cls.__tablename__,  # type: ignore[attr-defined]
+            keys,
+            attrgetter(*keys),
+            [(key, convert) for key, convert in specs if convert is not None],
+        )
+        _SERIALIZERS[model_cls] = serializer
+    return serializer
+
+
+def _get_row_serializer(model_cls: type, fields: tuple[str, ...]) -> Serializer:
+    """Serializer for rows with `fields`: reads by index whichever model fields the row carries."""
+    serializer = _ROW_SERIALIZERS.get((model_cls, fields))
+    if serializer is None:
+        specs = [(key, convert) for key, convert in _field_specs(model_cls) if key in fields]
+        keys = tuple(key for key, _ in specs)
+        serializer = _build(
+            model_cls.__tablename__,  # type: ignore[attr-defined]
+            keys,
+            itemgetter(*(fields.index(key) for key in keys)),
+            [(key, convert) for key, convert in specs if convert is not None],
+        )
+        _ROW_SERIALIZERS[(model_cls, fields)] = serializer
+    return serializer
+
+
+def serialize_many(model_cls: type, items: Iterable[Any]) -> list[dict[str, Any]]:
+    """
+    Serializes a batch of `model_cls` instances, or of row tuples from a projection.
 
-        result["subtype"] = self.__tablename__  # type: ignore[attr-defined]
-        return result
+    Rows are matched to the model by label: each column/extra of the model that the row
+    carries is serialized exactly as `to_api_dict` would, others are left out (so project
+    extras such as `product_name` as labelled columns).
+    """
+    items = list(items)
+    if not items:
+        return []
+    first = items[0]
+    if isinstance(first, Row):
+        serializer = _get_row_serializer(model_cls, tuple(first._fields))
+    else:
+        serializer = get_serializer(model_cls)
+    return [serializer(item) for item in items]
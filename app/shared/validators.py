@@ -4,6 +4,8 @@ from typing import Any
 
 import regex
 
+from app.shared.decorators import log_validator
+
 FORMAT_ERROR = "format_error"
 CONSTRAINT_VIOLATION = "constraint_violation"
 PRECISION_EXCEEDED = "precision_exceeded"
@@ -16,6 +18,12 @@ TIME_HHMM_INVALID = "Invalid: Time must be in HH:MM format (00:00 - 23:59)"
 TIME_HHMM_INVALID_RANGE = "Invalid time range (must be in 00:00 - 23:59)"
 TIME_HHMM_REQUIRED = "Time value is required"
 
+PATCH_BATCH_MAX = 500
+PATCH_BATCH_REQUIRED = "Items are required"
+PATCH_BATCH_TOO_MANY = f"Items cannot exceed {PATCH_BATCH_MAX} per batch"
+PATCH_BATCH_ITEM_INVALID = "must be an object with an integer 'id'"
+PATCH_BATCH_ID_DUPLICATE = "duplicates an earlier id"
+
 
 def validate_numeric(
     value: str,
@@ -114,6 +122,39 @@ def validate_enum(
         return (enum_member, [])
 
 
+@log_validator
+def validate_patch_batch(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Validate a generic batch PATCH: `{"items": [{"id": 1, <field>: <value>, ...}, ...]}`.
+
+    Returns (typed_data, errors), with typed_data["items"] mapping id -> fields to set, in
+    request order. Field values aren't checked, as with the single-item PATCH.
+    """
+    items = data.get("items")
+    if not items or not isinstance(items, list):
+        return ({}, {"items": [PATCH_BATCH_REQUIRED]})
+    if len(items) > PATCH_BATCH_MAX:
+        return ({}, {"items": [PATCH_BATCH_TOO_MANY]})
+
+    patches: dict[int, dict[str, Any]] = {}
+    item_errors = []
+    for i, item in enumerate(items):
+        item_id = item.get("id") if isinstance(item, dict) else None
+        # bool is an int subclass; `true` is never a valid id
+        if not isinstance(item_id, int) or isinstance(item_id, bool):
+            item_errors.append(f"Item {i}: {PATCH_BATCH_ITEM_INVALID}")
+        elif item_id in patches:
+            item_errors.append(f"Item {i}: {PATCH_BATCH_ID_DUPLICATE}")
+        else:
+            patches[item_id] = {k: v for k, v in item.items() if k != "id"}
+
+    if item_errors:
+        return ({}, {"items": item_errors})
+    return ({"items": patches}, {})
+
+
 def parse_decimal(value: float | str) -> tuple[bool, Decimal | None]:
     """Parse value to Decimal, rejecting inf/NaN. Returns (ok, decimal_value)."""
     try:
@@ -107,3 +107,10 @@ class BasePresenter:
             }
             for col in cls.VISIBLE_COLUMNS
         ]
+
+    @classmethod
+    def sort_fields(cls) -> frozenset[str]:
+        """Whitelist of fields the table may be sorted by (each column's sort_field, else its key)."""
+        return frozenset(
+            config.get("sort_field") or col for col, config in cls.COLUMN_CONFIG.items()
+        )
@@ -159,6 +159,46 @@ function toggleProductFields(e: Event): void {
 }
 
 
+type ProductMatch = { id: number; name: string; barcode: string | null; deleted: boolean };
+
+let productSearchTimeout: ReturnType<typeof setTimeout> | undefined;
+// Bumped per request, so a slow response can't overwrite results for a newer query
+let productSearchSeq = 0;
+
+/**
+ * Typeahead for the transaction form's product <select>: fetches top matches server-side
+ * (debounced) and swaps them in between the placeholder & "+ Create New Product" options.
+ * @param searchInput The `#product_search` input inside the transaction modal
+ */
+function handleProductSearch(searchInput: HTMLInputElement): void {
+    const select = searchInput.closest('form')?.querySelector<HTMLSelectElement>('#product_id');
+    // Disabled in edit mode, where the select holds only the transaction's own product
+    if (!select || select.disabled) return;
+
+    clearTimeout(productSearchTimeout);
+    productSearchTimeout = setTimeout(async () => {
+        const seq = ++productSearchSeq;
+        const query = encodeURIComponent(searchInput.value.trim());
+        const response = await apiRequest('GET', `/groceries/products/search?q=${query}`);
+        if (seq !== productSearchSeq || select.disabled) return;
+        const matches = (response.data ?? []) as ProductMatch[];
+
+        select.querySelectorAll('option[data-match]').forEach(option => option.remove());
+        const createNewOption = select.querySelector('option[value="__new__"]');
+        matches.forEach(product => {
+            const option = document.createElement('option');
+            option.value = String(product.id);
+            option.textContent = product.deleted ? `${product.name} (deleted)` : product.name;
+            option.dataset['match'] = '';
+            select.insertBefore(option, createNewOption);
+        });
+        if (matches.length > 0 && select.value === '') {
+            select.value = String(matches[0]!.id);
+        }
+    }, 200);
+}
+
+
 export function init() {
     const transactionModal = document.querySelector<HTMLDialogElement>('#transactions-entry-dashboard-modal');
     const priceField = transactionModal?.querySelector<HTMLInputElement>('[name="price_at_scan"]');
@@ -179,10 +219,20 @@ export function init() {
 
             const url = new URL(window.location.href);
             url.searchParams.set(`${table}_range`, range);
+            url.searchParams.delete(`${table}_cursor`);
             window.location.href = url.toString();
         }
     });
 
+    transactionModal.addEventListener('input', (e) => {
+        if (e.target instanceof HTMLInputElement && e.target.matches('#product_search')) {
+            handleProductSearch(e.target);
+        }
+    });
+    // Blank query -> most recently bought products, so the dropdown isn't empty before typing
+    const productSearch = transactionModal.querySelector<HTMLInputElement>('#product_search');
+    if (productSearch) handleProductSearch(productSearch);
+
     document.addEventListener('change', (e) => {
         const target = e.target;
         if (!(target instanceof HTMLElement)) return;
@@ -276,6 +276,7 @@ export async function init() {
 
             const url = new URL(window.location.href);
             url.searchParams.set(`${table}_range`, range);
+            url.searchParams.delete(`${table}_cursor`);
             window.location.href = url.toString();
         }
     });
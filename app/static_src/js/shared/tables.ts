@@ -80,6 +80,28 @@ document.addEventListener('click', (e) => {
         const url = new URL(window.location.href);
         url.searchParams.set(`${subtype}_sort`, `${field}`);
         url.searchParams.set(`${subtype}_order`, sortOrder);
+        url.searchParams.delete(`${subtype}_cursor`);
+        window.location.href = url.toString();
+    }
+});
+
+/**
+ * Handle table pager clicks (keyset paging).
+ * An empty data-cursor returns to the first page.
+ */
+document.addEventListener('click', (e) => {
+    const target = e.target as HTMLElement;
+
+    if (target.matches('.table-page')) {
+        const table = target.dataset['table']!;
+        const cursor = target.dataset['cursor'];
+
+        const url = new URL(window.location.href);
+        if (cursor) {
+            url.searchParams.set(`${table}_cursor`, cursor);
+        } else {
+            url.searchParams.delete(`${table}_cursor`);
+        }
         window.location.href = url.toString();
     }
 });
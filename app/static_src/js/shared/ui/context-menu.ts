@@ -161,6 +161,7 @@ function populateModalFields(modal: HTMLDialogElement, data: Record<string, any>
  * - Populates form inputs based on API response.
  * - For `transactions`, disables the `#product_id` select and 
  *   mirrors its value into `#product_id_hidden` to preserve submission.
+ *   Also disables the `#product_search` typeahead that feeds that select.
  *   The disabled field is tagged with `data-disabled-overriden` and 
  *   must be reverted upon modal close.
  * 
@@ -204,6 +205,12 @@ function handleEdit(menuContext: ContextObject['context']) {
                     productSelectInput.disabled = true;
                     productInputHidden.value = responseData.data.product_id;
                 }
+                // Product is fixed while editing, so searching for another one is too
+                const productSearch = modal.querySelector<HTMLInputElement>('#product_search');
+                if (productSearch) {
+                    productSearch.value = '';
+                    productSearch.disabled = true;
+                }
             }
         }
     });
@@ -110,6 +110,10 @@ function setupModal(modal: FormDialog, button: HTMLButtonElement): void {
             productSelect.innerHTML = productSelect.dataset['originalInnerHTML'];
             delete productSelect.dataset['originalInnerHTML'];
         }
+        const productSearch = modal.querySelector<HTMLInputElement>('#product_search');
+        if (productSearch) {
+            productSearch.disabled = false;
+        }
     });
 }
 
@@ -0,0 +1,77 @@
+"""
+Scan lookup latency at 50k products: barcode query (partial index) vs. warm per-user cache.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_barcode_lookup
+
+Looks up a random sample of existing barcodes, as a burst of scans at checkout would.
+"""
+
+import random
+import time
+
+from sqlalchemy import text
+
+from tests.benchmarks.helpers import bench_session, create_bench_user, print_table
+
+N_PRODUCTS = 50_000
+N_SCANS = 400  # stays under SimpleCache's default 500-entry threshold
+
+
+def seed_products(session, user_id, n):
+    session.execute(
+        text("""
+            INSERT INTO products (user_id, name, category, barcode, net_weight, unit_type)
+            SELECT :uid, 'Product ' || i, 'SNACKS', lpad(i::text, 13, '0'), 100, 'G'
+            FROM generate_series(1, :n) AS i
+        """),
+        {"uid": user_id, "n": n},
+    )
+    # Some soft-deleted rows, which the partial index leaves out
+    session.execute(
+        text("UPDATE products SET deleted_at = now() WHERE user_id = :uid AND id % 10 = 0"),
+        {"uid": user_id},
+    )
+    session.execute(text("ANALYZE products"))
+
+
+def per_scan_us(fn, barcodes):
+    start = time.perf_counter()
+    for barcode in barcodes:
+        fn(barcode)
+    return (time.perf_counter() - start) / len(barcodes) * 1_000_000
+
+
+def main():
+    with bench_session() as session:
+        from app.extensions import cache
+        from app.modules.groceries.service import create_groceries_service
+
+        user = create_bench_user(session)
+        seed_products(session, user.id, N_PRODUCTS)
+        groceries_service = create_groceries_service(session, user.id, user.timezone)
+        cache.clear()
+
+        plan = session.execute(
+            text("EXPLAIN SELECT * FROM products WHERE user_id = :uid AND barcode = :b AND deleted_at IS NULL"),
+            {"uid": user.id, "b": "0000000000001"},
+        ).scalars().all()
+        print(plan[0])
+
+        barcodes = [f"{i:013d}" for i in random.sample(range(1, N_PRODUCTS + 1), N_SCANS)]
+
+        def db_lookup(barcode):
+            session.expunge_all()  # don't let the identity map flatter the query path
+            return groceries_service.product_repo.get_product_by_barcode(barcode)
+
+        rows = [
+            ("query (partial index)", f"{per_scan_us(db_lookup, barcodes):.0f} us"),
+            ("cache, cold (read-through)", f"{per_scan_us(groceries_service.lookup_barcode, barcodes):.0f} us"),
+            ("cache, warm", f"{per_scan_us(groceries_service.lookup_barcode, barcodes):.0f} us"),
+        ]
+        cache.clear()
+
+    print_table([f"lookup @ {N_PRODUCTS:,} products", "per scan"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Streak calculation: Python `pairwise()` scan vs. SQL gaps-and-islands.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_habit_streaks
+
+Worst case for the scan: one unbroken daily streak, so it walks (and loads) every completion.
+"""
+
+from sqlalchemy import text
+
+from app.modules.habits.models import Habit
+from tests.benchmarks.helpers import (
+    bench_session,
+    best_of,
+    create_bench_user,
+    print_table,
+)
+
+SIZES = [10_000, 100_000]
+
+
+def seed_daily_completions(session, user_id, habit_id, n):
+    session.execute(
+        text("""
+            INSERT INTO habit_completions (user_id, habit_id, created_at)
+            SELECT :uid, :hid, now() - make_interval(days => d)
+            FROM generate_series(0, :n - 1) AS d
+        """),
+        {"uid": user_id, "hid": habit_id, "n": n},
+    )
+    session.execute(text("ANALYZE habit_completions"))
+
+
+def main():
+    rows = []
+    with bench_session() as session:
+        from app.modules.habits.service import create_habits_service
+
+        user = create_bench_user(session)
+        habits_service = create_habits_service(session, user.id, user.timezone)
+
+        for n in SIZES:
+            habit = Habit(name=f"Bench {n}", user_id=user.id, target_frequency=7)
+            session.add(habit)
+            session.flush()
+            seed_daily_completions(session, user.id, habit.id, n)
+
+            def pairwise_scan(habit_id=habit.id):
+                session.expunge_all()  # don't let the identity map flatter the ORM path
+                return habits_service.calculate_habit_streak(habit_id)
+
+            def sql_engine(habit_id=habit.id):
+                return habits_service.get_streak_history(habit_id)
+
+            assert pairwise_scan() == sql_engine()[habit.id]["current_streak"] == n
+
+            t_scan = best_of(pairwise_scan, repeat=3)
+            t_sql = best_of(sql_engine, repeat=3)
+            rows.append(
+                (f"{n:,}", f"{t_scan * 1000:.1f} ms", f"{t_sql * 1000:.1f} ms", f"{t_scan / t_sql:.1f}x")
+            )
+
+    print_table(["completions", "pairwise() scan", "SQL gaps-and-islands", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
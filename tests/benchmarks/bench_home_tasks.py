@@ -0,0 +1,113 @@
+"""
+Home page task queries at 50k tasks: load-everything + Python date filtering vs. SQL windows.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_home_tasks
+
+Seeds a long history (one regular task due every ~30 minutes for ~3 years, a few due today, a
+few undated), then times the home page's task list and today's progress bar both ways, and
+prints the plans of the windowed queries.
+"""
+
+from sqlalchemy import event, select, text
+
+import app.shared.datetime_.helpers as dth
+from app.modules.tasks.models import Task
+from tests.benchmarks.helpers import best_of, bench_session, create_bench_user, print_table
+
+N_TASKS = 50_000
+TZ = "America/Chicago"
+
+
+def seed(session, user_id):
+    session.execute(
+        text("""
+            INSERT INTO tasks (user_id, name, priority, is_frog, is_done, due_date, completed_at)
+            SELECT :uid, 'Task ' || i, 'LOW', false, true,
+                   -- i % 100 = 0: undated; i % 1000 = 1: due today; else spread over the past
+                   CASE WHEN i % 100 = 0 THEN NULL
+                        WHEN i % 1000 = 1 THEN now()
+                        ELSE now() - make_interval(mins => 30 * i) END,
+                   now() - make_interval(mins => 30 * i)
+            FROM generate_series(1, :n) AS i
+        """),
+        {"uid": user_id, "n": N_TASKS},
+    )
+    session.execute(text("ANALYZE tasks"))
+
+
+def main():
+    with bench_session() as session:
+        from app.modules.tasks.service import create_tasks_service
+
+        user = create_bench_user(session)
+        seed(session, user.id)
+        tasks_service = create_tasks_service(session, user.id, TZ)
+        repo = tasks_service.task_repo
+        start_utc, end_utc = dth.day_range_utc(dth.now_in_timezone(TZ).date(), TZ)
+
+        def list_python():
+            session.expunge_all()
+            tasks = session.scalars(select(Task).where(Task.user_id == user.id, ~Task.is_frog)).all()
+            return [t for t in tasks if t.due_date is None or dth.is_same_local_date(t.due_date, TZ)]
+
+        def list_sql():
+            session.expunge_all()
+            return repo.get_regular_tasks_due_in_window_or_undated(start_utc, end_utc)
+
+        def progress_python():
+            session.expunge_all()
+            completed = expected = 0
+            for task in session.scalars(select(Task).where(Task.user_id == user.id)):
+                due_today = task.due_date and dth.is_same_local_date(task.due_date, TZ)
+                completed_today = task.completed_at and dth.is_same_local_date(task.completed_at, TZ)
+                if due_today or (completed_today and task.due_date is None):
+                    expected += 1
+                    completed += bool(completed_today)
+            return completed, expected
+
+        def progress_sql():
+            return repo.count_progress_in_window(start_utc, end_utc)
+
+        def progress_rollup():
+            return tasks_service.calculate_tasks_progress_today()
+
+        assert {t.id for t in list_python()} == {t.id for t in list_sql()}
+        assert progress_python() == progress_sql()
+        n_listed = len(list_sql())
+
+        rows = []
+        for name, python_fn, sql_fns in (
+            ("task list", list_python, [("windowed query", list_sql)]),
+            (
+                "progress",
+                progress_python,
+                [("aggregate", progress_sql), ("daily rollup row", progress_rollup)],
+            ),
+        ):
+            baseline = best_of(python_fn)
+            rows.append((name, "load all + Python filter", f"{baseline * 1000:.1f}", "1.0x"))
+            for method, fn in sql_fns:
+                seconds = best_of(fn)
+                rows.append((name, method, f"{seconds * 1000:.2f}", f"{baseline / seconds:.0f}x"))
+
+        print(f"Home page tasks, {N_TASKS} tasks ({n_listed} shown), best of 5\n")
+        print_table(["query", "method", "ms", "speedup"], rows)
+
+        # Plans of the exact statements the repository sends
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            statements.append((statement, parameters))
+
+        connection = session.connection()
+        event.listen(connection, "before_cursor_execute", capture)
+        list_sql()
+        progress_sql()
+        event.remove(connection, "before_cursor_execute", capture)
+        for title, (statement, parameters) in zip(("list", "progress"), statements, strict=True):
+            print(f"\nPlan of the {title} query:")
+            for (line,) in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters):
+                print(f"  {line}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+JSON encoding cost of 5k-item list responses: Flask's default provider vs. ours.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_json_provider
+
+Payloads mirror the list endpoints: `time_entries_summary` / `daily_metrics` lists
+(serialized dicts), and the transactions table projection (Rows carrying Decimals), which
+Flask's default provider can't encode without converting each Row first.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import select
+
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+from app.modules.metrics.models import DailyMetrics
+from app.modules.time_tracking.models import TimeEntry
+from app.shared.json_provider import OrjsonProvider, StdJSONProvider
+from app.shared.serialization import serialize_many
+from tests.benchmarks.helpers import best_of, bench_session, create_bench_user, print_table
+
+N_ITEMS = 5_000
+
+
+def seed(session, user_id):
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    products = [
+        Product(
+            user_id=user_id, name=f"Product {i}", category=ProductCategoryEnum.SNACKS,
+            net_weight=Decimal("250"), unit_type=UnitEnum.G, barcode=f"{i:013d}",
+        )
+        for i in range(50)
+    ]
+    session.add_all(products)
+    session.flush()
+    session.add_all(
+        Transaction(
+            user_id=user_id, product_id=products[i % 50].id, price_at_scan=Decimal("2.49"),
+            quantity=1 + i % 3, created_at=start + timedelta(minutes=i),
+        )
+        for i in range(N_ITEMS)
+    )
+    session.add_all(
+        TimeEntry(
+            user_id=user_id, category=f"Category {i % 8}", description=f"Entry {i}",
+            started_at=start + timedelta(hours=i), ended_at=start + timedelta(hours=i, minutes=45),
+            duration_minutes=45,
+        )
+        for i in range(N_ITEMS)
+    )
+    session.add_all(
+        DailyMetrics(
+            user_id=user_id, entry_datetime=start + timedelta(days=i), steps=8000 + i,
+            weight=70.5, calories=2100,
+        )
+        for i in range(N_ITEMS)
+    )
+    session.flush()
+
+
+def main():
+    with bench_session() as session:
+        from flask import current_app
+
+        app = current_app._get_current_object()
+        user = create_bench_user(session)
+        seed(session, user.id)
+
+        time_entries = serialize_many(
+            TimeEntry, session.scalars(select(TimeEntry).where(TimeEntry.user_id == user.id))
+        )
+        metrics = serialize_many(
+            DailyMetrics,
+            session.scalars(select(DailyMetrics).where(DailyMetrics.user_id == user.id)),
+        )
+        transaction_rows = session.execute(
+            select(
+                Transaction.id, Transaction.price_at_scan, Transaction.quantity,
+                Transaction.created_at, Product.name.label("product_name"), Product.net_weight,
+            )
+            .join(Product)
+            .where(Transaction.user_id == user.id)
+        ).all()
+
+        providers = [
+            ("flask default", DefaultJSONProvider(app)),
+            ("std fallback", StdJSONProvider(app)),
+            ("orjson", OrjsonProvider(app)),
+        ]
+        payloads = [
+            ("time entries", lambda _p: time_entries),
+            ("daily metrics", lambda _p: metrics),
+            # Flask's default can't encode Rows; it pays for converting them first
+            (
+                "transaction rows",
+                lambda p: (
+                    [row._asdict() for row in transaction_rows]
+                    if type(p) is DefaultJSONProvider
+                    else transaction_rows
+                ),
+            ),
+        ]
+
+        table = []
+        for payload_name, build in payloads:
+            baseline = None
+            for provider_name, provider in providers:
+                seconds = best_of(
+                    lambda provider=provider, build=build: provider.response(
+                        {"success": True, "data": build(provider)}
+                    )
+                )
+                baseline = baseline or seconds
+                table.append(
+                    (payload_name, provider_name, f"{seconds * 1000:.1f}", f"{baseline / seconds:.1f}x")
+                )
+
+        print(f"api_response-style JSON for {N_ITEMS} items (best of 5)\n")
+        print_table(["payload", "provider", "ms", "speedup"], table)
+
+
+if __name__ == "__main__":
+    main()
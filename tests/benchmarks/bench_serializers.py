@@ -0,0 +1,110 @@
+"""
+Serialization cost for list endpoints: per-object introspection vs. compiled serializers.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_serializers
+
+Serializes N time entries (as `time_entries_summary` does) three ways: the original
+`inspect()`-per-object loop, the compiled per-model serializer, and `serialize_many()` over
+row tuples from a column projection.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+
+from sqlalchemy import inspect, select
+
+from app.modules.time_tracking.models import TimeEntry
+from app.shared.serialization import EXCLUDE_COLS, serialize_many
+from tests.benchmarks.helpers import best_of, bench_session, create_bench_user, print_table
+
+N_ENTRIES = 5_000
+
+
+def introspecting_to_api_dict(obj):
+    """The pre-registry implementation: mapper lookup, exclude set & isinstance per column."""
+    mapper = inspect(obj.__class__)
+    exclude = set(EXCLUDE_COLS)
+    if hasattr(obj, "__api_exclude__"):
+        exclude.update(obj.__api_exclude__)
+    result = {}
+    for col in mapper.columns:
+        if col.name in exclude:
+            continue
+        value = getattr(obj, col.name)
+        if isinstance(value, Enum):
+            result[col.name] = value.value
+        elif isinstance(value, (datetime, date)):
+            result[col.name] = value.isoformat()
+        else:
+            result[col.name] = value
+    result["subtype"] = obj.__tablename__
+    return result
+
+
+def main():
+    with bench_session() as session:
+        user = create_bench_user(session)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        session.add_all(
+            TimeEntry(
+                user_id=user.id,
+                category=f"Category {i % 8}",
+                description=None if i % 3 else f"Entry {i}",
+                started_at=start + timedelta(hours=i),
+                ended_at=start + timedelta(hours=i, minutes=45),
+                duration_minutes=45,
+            )
+            for i in range(N_ENTRIES)
+        )
+        session.flush()
+        session.expire_all()
+
+        entities_stmt = select(TimeEntry).where(TimeEntry.user_id == user.id)
+        rows_stmt = select(*TimeEntry.__table__.columns).where(TimeEntry.user_id == user.id)
+        entries = session.scalars(entities_stmt).all()
+        rows = session.execute(rows_stmt).all()
+        assert serialize_many(TimeEntry, rows) == [introspecting_to_api_dict(e) for e in entries]
+
+        timings = [
+            (
+                "introspection per object",
+                best_of(lambda: [introspecting_to_api_dict(e) for e in entries]),
+            ),
+            ("compiled, instances", best_of(lambda: serialize_many(TimeEntry, entries))),
+            ("compiled, row tuples", best_of(lambda: serialize_many(TimeEntry, rows))),
+        ]
+
+        def load_and_serialize_entities():
+            session.expunge_all()
+            return [introspecting_to_api_dict(e) for e in session.scalars(entities_stmt)]
+
+        end_to_end = [
+            ("ORM load + introspection", best_of(load_and_serialize_entities)),
+            (
+                "row load + serialize_many",
+                best_of(lambda: serialize_many(TimeEntry, session.execute(rows_stmt).all())),
+            ),
+        ]
+
+        for title, results in (
+            (f"Serializing {N_ENTRIES} loaded time entries", timings),
+            (f"Querying + serializing {N_ENTRIES} time entries", end_to_end),
+        ):
+            print(f"{title} (best of 5)\n")
+            print_table(
+                ["method", "total ms", "us/row", "speedup"],
+                [
+                    (
+                        name,
+                        f"{seconds * 1000:.1f}",
+                        f"{seconds / N_ENTRIES * 1_000_000:.2f}",
+                        f"{results[0][1] / seconds:.1f}x",
+                    )
+                    for name, seconds in results
+                ],
+            )
+            print()
+
+
+if __name__ == "__main__":
+    main()
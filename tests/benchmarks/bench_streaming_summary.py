@@ -0,0 +1,97 @@
+"""
+Peak memory of `time_entries_summary`: one full list + JSON string vs. the streamed response.
+
+    APP_ENV=testing python -m tests.benchmarks.bench_streaming_summary
+
+Seeds hourly time entries (5 years is the export-sized case) and measures, with tracemalloc,
+the old path (load all, `serialize_many`, `api_response`) against draining the body of
+`api_stream_response` over `iter_time_entry_rows_in_window`.
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import insert
+
+from app.api.responses import api_response, api_stream_response
+from app.modules.time_tracking.models import TimeEntry
+from app.modules.time_tracking.repository import TimeEntryRepository
+from app.shared.serialization import serialize_many
+from tests.benchmarks.helpers import bench_session, create_bench_user, print_table
+
+YEARS = (1, 5)
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(session, user_id, n_entries):
+    session.execute(
+        insert(TimeEntry),
+        [
+            {
+                "user_id": user_id, "category": f"Category {i % 8}", "description": f"Entry {i}",
+                "started_at": START + timedelta(hours=i),
+                "ended_at": START + timedelta(hours=i, minutes=45),
+                "duration_minutes": 45,
+            }
+            for i in range(n_entries)
+        ],
+    )
+    session.flush()
+
+
+def measure(fn):
+    """(peak MiB, seconds, response bytes) of one run."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    n_bytes = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, seconds, n_bytes
+
+
+def main():
+    with bench_session() as session:
+        app = current_app._get_current_object()
+        user = create_bench_user(session)
+        repo = TimeEntryRepository(session, user.id)
+        seed(session, user.id, 24 * 365 * max(YEARS))
+
+        table = []
+        for years in YEARS:
+            window_end = START + timedelta(days=365 * years)
+
+            def full_list(window_end=window_end):
+                session.expunge_all()
+                results = repo.get_all_time_entries_in_window(START, window_end)
+                response = api_response(
+                    success=True,
+                    message=f"Retrieved {len(results)} time entries",
+                    data=serialize_many(TimeEntry, results),
+                )
+                return len(response.get_data())
+
+            def streamed(window_end=window_end):
+                session.expunge_all()
+                batches = (
+                    serialize_many(TimeEntry, rows)
+                    for rows in repo.iter_time_entry_rows_in_window(START, window_end)
+                )
+                response = api_stream_response(batches, message=lambda n: f"Retrieved {n} time entries")
+                return sum(len(chunk) for chunk in response.response)
+
+            for name, fn in (("full list", full_list), ("streamed", streamed)):
+                with app.test_request_context():
+                    peak, seconds, n_bytes = measure(fn)
+                table.append(
+                    (f"{years}y", name, f"{n_bytes / 2**20:.1f}", f"{peak:.1f}", f"{seconds * 1000:.0f}")
+                )
+
+        print("time_entries_summary, hourly entries (single run each)\n")
+        print_table(["window", "mode", "body MiB", "peak MiB", "ms"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Shared scaffolding for the benchmark scripts in this folder.
+
+Benchmarks are plain scripts (not collected by pytest), run against the testing DB:
+    APP_ENV=testing python -m tests.benchmarks.<bench_module>
+
+Everything is written inside one transaction that's rolled back at the end.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Generator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app import create_app
+from app._infra.database import db_session
+from app.modules.auth.models import User
+
+
+@contextmanager
+def bench_session() -> Generator[Session, None, None]:
+    """Yields a session inside an app context, rolling back everything on exit."""
+    app = create_app("testing")
+    with app.app_context():
+        session = db_session()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            db_session.remove()
+
+
+def create_bench_user(session: Session, username: str = "bench_user") -> User:
+    user = User(username=username, name="Bench", role="USER")
+    user.hash_password("password123")
+    session.add(user)
+    session.flush()
+    return user
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Best wall-clock time (seconds) of `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths, strict=True)))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths, strict=True)))
@@ -2,12 +2,15 @@
 Houses fixtures & test config, automatically loaded by pytest.
 """
 
+from contextlib import contextmanager
+
 import pytest
 from flask_login import login_user
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from app import create_app
 from app._infra.database import db_session
+from app.extensions import cache
 from app.modules.auth.models import User
 from app.shared.database.helpers import delete_all_db_data
 
@@ -17,10 +20,16 @@ class AuthActions():
         self.client = client
     
     def login(self, username, password):
+        # GET first so before_request puts a csrf_token in the session for our POST
+        self.client.get('/login')
+        with self.client.session_transaction() as sess:
+            csrf_token = sess['csrf_token']
+
         # This sets a session cookie (telling Flask-Login we're logged in)
         return self.client.post('/login', data={ 
             'username': username, 
-            'password': password
+            'password': password,
+            'csrf_token': csrf_token,
         })
 
 # Drafting authenticated_client fixture
@@ -62,6 +71,39 @@ def logged_in_user(app): # add clear_tables as dependency to ensure it runs befo
         
     return user
 
+
+@pytest.fixture
+def csrf_headers(authenticated_client):
+    # For JSON POST/PATCH/DELETE requests through authenticated_client
+    with authenticated_client.session_transaction() as sess:
+        return {'X-CSRFToken': sess['csrf_token']}
+
+
+@pytest.fixture
+def user_id(logged_in_user):
+    # Grab id up front, authenticated_client's login request detaches logged_in_user
+    return logged_in_user.id
+
+
+# Counts statements sent through the session's engine, for N+1 / query-count tests
+@pytest.fixture
+def count_queries():
+    @contextmanager
+    def _count_queries():
+        engine = db_session.get_bind()
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count_queries
+
 # Fixture to clear all table data between tests
 # Necessary now that tests and app share the same session via monkeypatching
 @pytest.fixture(autouse=True)
@@ -74,6 +116,7 @@ def clear_tables(app):
 
     delete_all_db_data(db_session, reset_sequences=True, include_users=True)
     db_session.commit()
+    cache.clear()  # ids restart with the sequences, so per-user cache keys would collide
     #yield
 
 # monkeypatches db_session() to use our test session
@@ -0,0 +1,94 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from sqlalchemy import inspect, select
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+from app.modules.habits.models import Habit, LeetCodeRecord, StatusEnum
+from app.modules.metrics.models import DailyMetrics
+from app.modules.tasks.models import PriorityEnum, Task
+from app.modules.time_tracking.models import TimeEntry
+from app.shared.serialization import EXCLUDE_COLS, get_serializer, serialize_many
+
+
+def reference_dict(obj):
+    """The original per-object introspection, which compiled serializers must match."""
+    exclude = set(EXCLUDE_COLS) | set(getattr(obj, "__api_exclude__", ()))
+    result = {}
+    for col in inspect(obj.__class__).columns:
+        if col.name in exclude:
+            continue
+        value = getattr(obj, col.name)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        result[col.name] = value
+    for name in obj.__api_extras__:
+        result[name] = getattr(obj, name)
+    result["subtype"] = obj.__tablename__
+    return result
+
+
+NOW = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Task(id=1, user_id=1, name="Task", priority=PriorityEnum.HIGH, is_frog=False, due_date=NOW),
+        Task(id=2, user_id=1, name="Frog", priority=None, is_frog=True, due_date=None),
+        Habit(id=3, user_id=1, name="Read", status=StatusEnum.EXPERIMENTAL, promotion_threshold=0.8,
+              target_frequency=3, last_completed_date=date(2026, 2, 28)),
+        Habit(id=4, user_id=1, name="Run", status=None, promotion_threshold=None, target_frequency=1),
+        DailyMetrics(id=5, user_id=1, entry_datetime=NOW, steps=1000, weight=None),
+        TimeEntry(id=6, user_id=1, category="Work", started_at=NOW, ended_at=NOW, description=None),
+        Product(id=7, user_id=1, name="Milk", category=ProductCategoryEnum.DAIRY_EGGS,
+                net_weight=Decimal("1000"), unit_type=UnitEnum.ML, barcode="123"),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_compiled_serializer_matches_introspection(obj):
+    assert obj.to_api_dict() == reference_dict(obj)
+    assert get_serializer(type(obj)) is get_serializer(type(obj))
+
+
+def test_extras_are_included():
+    habit = Habit(status=StatusEnum.EXPERIMENTAL, promotion_threshold=0.5, target_frequency=1)
+    assert habit.to_api_dict()["is_promotable"] is True
+    assert "user_id" not in habit.to_api_dict()
+
+
+def test_serialize_many_rows_match_instances(user_id):
+    product = Product(
+        user_id=user_id, name="Oats", category=ProductCategoryEnum.GRAINS,
+        net_weight=Decimal("500"), unit_type=UnitEnum.G, barcode="4000000000001",
+    )
+    db_session.add(product)
+    db_session.flush()
+    db_session.add_all(
+        Transaction(user_id=user_id, product_id=product.id, price_at_scan=Decimal("1.99"), quantity=i + 1)
+        for i in range(3)
+    )
+    db_session.add(
+        LeetCodeRecord(user_id=user_id, leetcode_id=1, title="Two Sum", difficulty="EASY",
+                       language="PYTHON", status="SOLVED")
+    )
+    db_session.commit()
+
+    transactions = db_session.scalars(select(Transaction).order_by(Transaction.id)).all()
+    rows = db_session.execute(
+        select(*Transaction.__table__.columns, Product.name.label("product_name"))
+        .join(Product)
+        .order_by(Transaction.id)
+    ).all()
+    assert serialize_many(Transaction, rows) == serialize_many(Transaction, transactions)
+    assert serialize_many(Transaction, rows) == [t.to_api_dict() for t in transactions]
+
+    records = db_session.scalars(select(LeetCodeRecord)).all()
+    record_rows = db_session.execute(select(*LeetCodeRecord.__table__.columns)).all()
+    assert serialize_many(LeetCodeRecord, record_rows) == [r.to_api_dict() for r in records]
+    assert serialize_many(LeetCodeRecord, []) == []
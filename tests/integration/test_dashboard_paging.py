@@ -0,0 +1,247 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+from app.modules.groceries.viewmodels import ProductPresenter, TransactionPresenter
+from app.modules.habits.viewmodels import LCRecordPresenter
+from app.modules.metrics.viewmodels import DailyMetricPresenter
+from app.modules.tasks.models import PriorityEnum, Task
+from app.modules.tasks.viewmodels import TaskPresenter
+from app.modules.time_tracking.viewmodels import TimeEntryPresenter
+from app.shared.repository.base import encode_cursor
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def task_repo(user_id):
+    from app.modules.tasks.repository import TaskRepository
+
+    return TaskRepository(db_session(), user_id)
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+def add_tasks(user_id):
+    """Two tasks per priority, plus two frog tasks (priority NULL)."""
+    now = datetime.now(timezone.utc)
+    tasks = [
+        Task(user_id=user_id, name=f"{priority.name} {i}", priority=priority, is_frog=False)
+        for priority in (PriorityEnum.LOW, PriorityEnum.HIGH, PriorityEnum.MEDIUM)
+        for i in range(2)
+    ]
+    tasks += [
+        Task(user_id=user_id, name=f"Frog {i}", priority=None, is_frog=True, due_date=now)
+        for i in range(2)
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+
+
+def all_pages(fetch, limit, **page):
+    items, cursor, pages = [], None, 0
+    while True:
+        page_items, cursor = fetch(cursor=cursor, limit=limit, **page)
+        items += page_items
+        pages += 1
+        if cursor is None:
+            return items, pages
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_enum_sort_follows_sort_order_with_nulls_last(task_repo, user_id, order):
+    add_tasks(user_id)
+
+    tasks, pages = all_pages(
+        task_repo.get_tasks_page, 3, sortable=TaskPresenter.sort_fields(), sort_by="priority", order=order
+    )
+
+    assert pages == 3
+    assert len({t.id for t in tasks}) == 8
+    ranked = ["HIGH", "MEDIUM", "LOW"] if order == "asc" else ["LOW", "MEDIUM", "HIGH"]
+    assert [t.priority.name if t.priority else None for t in tasks] == [
+        p for p in ranked for _ in range(2)
+    ] + [None, None]
+
+
+def test_joined_and_computed_sort_fields_page_without_gaps(groceries_service, user_id):
+    products = [
+        Product(
+            user_id=user_id, name=f"Product {i}", category=ProductCategoryEnum.SNACKS,
+            net_weight=Decimal(100 * (i + 1)) if i else Decimal(0), unit_type=UnitEnum.G,
+            barcode=f"{i:013d}", calories_per_100g=None,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(products)
+    db_session.flush()
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        Transaction(
+            user_id=user_id, product_id=products[i % 5].id, price_at_scan=Decimal("2.00"),
+            quantity=1, created_at=now - timedelta(minutes=i),
+        )
+        for i in range(20)
+    )
+    db_session.commit()
+    start_utc, end_utc = now - timedelta(days=1), now + timedelta(minutes=1)
+    repo = groceries_service.transaction_repo
+
+    rows, _ = all_pages(
+        lambda **page: repo.get_table_page_in_window(start_utc, end_utc, **page), 3,
+        sortable=TransactionPresenter.sort_fields(), sort_by="product_name", order="asc",
+    )
+    assert len({r.id for r in rows}) == 20
+    assert [r.product_name for r in rows] == sorted(r.product_name for r in rows)
+
+    rows, _ = all_pages(
+        lambda **page: repo.get_table_page_in_window(start_utc, end_utc, **page), 3,
+        sortable=TransactionPresenter.sort_fields(), sort_by="price_per_100g", order="desc",
+    )
+    assert len({r.id for r in rows}) == 20
+    # net_weight 0 -> NULL price-per-100g, which stays last even when descending
+    assert [r.product_name for r in rows[-4:]] == ["Product 0"] * 4
+    assert rows[0].product_name == "Product 1"
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_plain_enum_sort_pages_across_cursors(groceries_service, user_id, order):
+    categories = [
+        ProductCategoryEnum.SNACKS, ProductCategoryEnum.FRUITS, ProductCategoryEnum.SNACKS,
+        ProductCategoryEnum.DAIRY_EGGS, ProductCategoryEnum.FRUITS,
+    ]
+    db_session.add_all(
+        Product(
+            user_id=user_id, name=f"Product {i}", category=category, net_weight=Decimal(100),
+            unit_type=UnitEnum.G, barcode=f"{i:013d}", calories_per_100g=None,
+        )
+        for i, category in enumerate(categories)
+    )
+    db_session.commit()
+    now = datetime.now(timezone.utc)
+
+    products, pages = all_pages(
+        lambda **page: groceries_service.product_repo.get_products_page_in_window(
+            now - timedelta(days=1), now + timedelta(minutes=1), **page
+        ),
+        2, sortable=ProductPresenter.sort_fields(), sort_by="category", order=order,
+    )
+
+    assert pages == 3
+    assert len({p.id for p in products}) == 5
+    # Plain enums sort in Postgres declaration order
+    declared = list(ProductCategoryEnum)
+    assert [p.category for p in products] == sorted(
+        categories, key=declared.index, reverse=order == "desc"
+    )
+
+
+@pytest.mark.parametrize(
+    ("repo_path", "presenter"),
+    [
+        ("app.modules.tasks.repository:TaskRepository", TaskPresenter),
+        ("app.modules.groceries.repository:ProductRepository", ProductPresenter),
+        ("app.modules.groceries.repository:TransactionRepository", TransactionPresenter),
+        ("app.modules.habits.repository:LeetCodeRecordRepository", LCRecordPresenter),
+        ("app.modules.metrics.repository:DailyMetricsRepository", DailyMetricPresenter),
+        ("app.modules.time_tracking.repository:TimeEntryRepository", TimeEntryPresenter),
+    ],
+)
+def test_every_presenter_sort_field_resolves(user_id, repo_path, presenter):
+    import importlib
+
+    module, cls = repo_path.split(":")
+    repo = getattr(importlib.import_module(module), cls)(db_session(), user_id)
+    for field in presenter.sort_fields():
+        repo._sort_expression(field, presenter.sort_fields())
+
+
+def test_unlisted_sort_and_foreign_cursor_are_rejected(task_repo):
+    with pytest.raises(ValueError, match="Cannot sort"):
+        task_repo.get_tasks_page(sortable=TaskPresenter.sort_fields(), sort_by="user_id")
+    with pytest.raises(ValueError, match="does not match"):
+        task_repo.get_tasks_page(
+            sortable=TaskPresenter.sort_fields(),
+            sort_by="name",
+            cursor=encode_cursor("due_date", "desc", None, 1),
+        )
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/groceries/dashboard",
+        "/habits/dashboard",
+        "/metrics/dashboard",
+        "/tasks/dashboard",
+        "/time_tracking/dashboard",
+    ],
+)
+def test_dashboard_renders_with_default_params(app, authenticated_client, url):
+    with app.app_context():
+        response = authenticated_client.get(url)
+    assert response.status_code == 200
+
+
+def test_default_sort_must_be_sortable(app):
+    from app.shared.parsers_ import get_page_params
+
+    with app.test_request_context("/"), pytest.raises(ValueError, match="created_at"):
+        get_page_params("created_at", LCRecordPresenter.sort_fields())
+
+
+def test_tasks_dashboard_renders_one_page(app, user_id, authenticated_client):
+    add_tasks(user_id)
+
+    with app.app_context():
+        first = authenticated_client.get("/tasks/dashboard?tasks_sort=priority&tasks_order=asc&tasks_limit=5")
+    assert first.status_code == 200
+    assert first.data.count(b'class="table-row"') == 5
+    assert b'class="table-page' in first.data
+
+    cursor = first.data.split(b'data-cursor="')[1].split(b'"')[0].decode()
+    with app.app_context():
+        second = authenticated_client.get(
+            f"/tasks/dashboard?tasks_sort=priority&tasks_order=asc&tasks_limit=5&tasks_cursor={cursor}"
+        )
+    assert second.status_code == 200
+    assert second.data.count(b'class="table-row"') == 3
+
+    with app.app_context():
+        mismatched = authenticated_client.get(f"/tasks/dashboard?tasks_sort=name&tasks_cursor={cursor}")
+    with app.app_context():
+        garbage = authenticated_client.get("/tasks/dashboard?tasks_cursor=not-a-cursor")
+    assert mismatched.status_code == 400
+    assert garbage.status_code == 400
+
+
+def test_daily_metrics_list_endpoint_pages(app, user_id, authenticated_client):
+    from app.modules.metrics.models import DailyMetrics
+
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        DailyMetrics(user_id=user_id, entry_datetime=now - timedelta(days=i), steps=1000 * i)
+        for i in range(5)
+    )
+    db_session.commit()
+
+    with app.app_context():
+        first = authenticated_client.get("/api/metrics/daily_metrics?sort=steps&order=asc&limit=3")
+    data = first.get_json()["data"]
+    assert [e["steps"] for e in data["items"]] == [0, 1000, 2000]
+
+    with app.app_context():
+        second = authenticated_client.get(
+            f"/api/metrics/daily_metrics?sort=steps&order=asc&limit=3&cursor={data['next_cursor']}"
+        )
+    data = second.get_json()["data"]
+    assert [e["steps"] for e in data["items"]] == [3000, 4000]
+    assert data["next_cursor"] is None
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import select
+
+from app._infra.database import db_session
+from app.modules.auth.models import User
+from app.modules.habits.models import Habit, HabitCompletion
+from app.modules.tasks.models import PriorityEnum, Task
+from app.shared.hooks import PATCH_HOOKS
+
+URL = "/api/tasks/tasks/batch"
+TZ = "America/Chicago"  # User.timezone server default
+
+
+def add_tasks(user_id, n):
+    tasks = [
+        Task(user_id=user_id, name=f"Task {i}", priority=PriorityEnum.LOW, is_frog=False)
+        for i in range(n)
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+    return [t.id for t in tasks]
+
+
+def priorities():
+    db_session.expire_all()
+    return [t.priority for t in db_session.scalars(select(Task).order_by(Task.id))]
+
+
+@pytest.fixture
+def hook_calls(monkeypatch):
+    calls = []
+    hook = PATCH_HOOKS["tasks"]
+
+    def counting_hook(items, data, session, current_user):
+        calls.append((len(items), set(data)))
+        return hook(items, data, session, current_user)
+
+    monkeypatch.setitem(PATCH_HOOKS, "tasks", counting_hook)
+    return calls
+
+
+def test_batch_patch_runs_hook_once(
+    app, user_id, authenticated_client, csrf_headers, hook_calls, count_queries
+):
+    ids = add_tasks(user_id, 4)
+    completed_at = datetime.now(timezone.utc).isoformat()
+    patches = [
+        {"id": ids[2], "priority": "HIGH"},
+        {"id": ids[0], "priority": "MEDIUM", "completed_at": completed_at},
+    ]
+
+    with app.app_context(), count_queries() as statements:
+        response = authenticated_client.patch(URL, json={"items": patches}, headers=csrf_headers)
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert [item["id"] for item in data["items"]] == [ids[2], ids[0]]
+    assert data["progress"] == {"completed": 1, "total": 1, "percent": 100.0}
+    assert hook_calls == [(2, {"priority", "completed_at"})]
+    assert sum("tasks.id IN" in s for s in statements) == 1
+    assert priorities() == [PriorityEnum.MEDIUM, PriorityEnum.LOW, PriorityEnum.HIGH, PriorityEnum.LOW]
+
+
+def test_batch_patch_is_all_or_nothing(app, user_id, authenticated_client, csrf_headers):
+    other = User(username="other_user", name="Other")
+    other.hash_password("password123")
+    db_session.add(other)
+    db_session.flush()
+    theirs = add_tasks(other.id, 1)
+    ids = add_tasks(user_id, 1)
+    patches = [{"id": ids[0], "priority": "HIGH"}, {"id": theirs[0], "priority": "HIGH"}, {"id": 0}]
+
+    with app.app_context():
+        response = authenticated_client.patch(URL, json={"items": patches}, headers=csrf_headers)
+
+    assert response.status_code == 404
+    assert response.get_json()["errors"] == {"ids": [theirs[0], 0]}
+    assert priorities() == [PriorityEnum.LOW, PriorityEnum.LOW]
+
+
+@pytest.mark.parametrize(
+    ("body", "error"),
+    [
+        ({}, "Items are required"),
+        ({"items": [{"priority": "HIGH"}]}, "Item 0: must be an object with an integer 'id'"),
+        ({"items": [{"id": True}]}, "Item 0: must be an object with an integer 'id'"),
+        ({"items": [{"id": 1}, {"id": 1}]}, "Item 1: duplicates an earlier id"),
+    ],
+)
+def test_batch_patch_validation(app, user_id, authenticated_client, csrf_headers, body, error):
+    with app.app_context():
+        response = authenticated_client.patch(URL, json=body, headers=csrf_headers)
+    assert response.status_code == 400
+    assert response.get_json()["errors"] == {"items": [error]}
+
+
+def test_batch_patch_unknown_model(app, user_id, authenticated_client, csrf_headers):
+    with app.app_context():
+        response = authenticated_client.patch(
+            "/api/tasks/nope/batch", json={"items": [{"id": 1}]}, headers=csrf_headers
+        )
+    assert response.status_code == 404
+
+
+def test_completion_batch_rebuilds_each_habit(app, user_id, authenticated_client, csrf_headers):
+    now = datetime.now(timezone.utc)
+    habits = [Habit(user_id=user_id, name=name, target_frequency=7) for name in ("Run", "Read")]
+    db_session.add_all(habits)
+    db_session.flush()
+    completions = [
+        HabitCompletion(user_id=user_id, habit_id=h.id, created_at=now - timedelta(days=3))
+        for h in habits
+    ]
+    db_session.add_all(completions)
+    db_session.commit()
+    patches = [{"id": c.id, "created_at": now.isoformat()} for c in completions]
+
+    with app.app_context():
+        response = authenticated_client.patch(
+            "/api/habits/habit_completions/batch", json={"items": patches}, headers=csrf_headers
+        )
+
+    assert response.status_code == 200
+    db_session.expire_all()
+    for habit in db_session.scalars(select(Habit)):
+        assert habit.last_completed_date == now.astimezone(ZoneInfo(TZ)).date()
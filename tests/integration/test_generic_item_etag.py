@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from app._infra.database import db_session
+from app.modules.auth.models import User
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+from app.modules.tasks.models import PriorityEnum, Task
+
+
+def add_task(user_id, name="Task"):
+    task = Task(user_id=user_id, name=name, priority=PriorityEnum.LOW, is_frog=False)
+    db_session.add(task)
+    db_session.commit()
+    return task.id
+
+
+def test_get_returns_etag_and_honours_if_none_match(
+    app, user_id, authenticated_client, count_queries, monkeypatch
+):
+    url = f"/api/tasks/tasks/{add_task(user_id)}"
+    with app.app_context():
+        response = authenticated_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.cache_control.no_cache
+    assert response.cache_control.private
+
+    def fail(self):
+        raise AssertionError("304 must not serialize")
+
+    monkeypatch.setattr(Task, "to_api_dict", fail)
+    with app.app_context(), count_queries() as statements:
+        response = authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+    assert sum("FROM tasks" in s for s in statements) == 1
+
+
+def test_patch_changes_etag(app, user_id, authenticated_client, csrf_headers):
+    url = f"/api/tasks/tasks/{add_task(user_id)}"
+    with app.app_context():
+        etag = authenticated_client.get(url).headers["ETag"]
+    with app.app_context():
+        authenticated_client.patch(url, json={"priority": "HIGH"}, headers=csrf_headers)
+    with app.app_context():
+        response = authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.get_json()["data"]["priority"] == "HIGH"
+
+
+def test_other_users_item_is_not_found(app, user_id, authenticated_client, count_queries):
+    other = User(username="other_user", name="Other")
+    other.hash_password("password123")
+    db_session.add(other)
+    db_session.flush()
+    url = f"/api/tasks/tasks/{add_task(other.id, name='Theirs')}"
+
+    with app.app_context(), count_queries() as statements:
+        response = authenticated_client.get(url)
+    assert response.status_code == 404
+    [select_task] = [s for s in statements if "FROM tasks" in s]
+    assert "tasks.user_id" in select_task
+
+
+def test_items_with_joined_extras_are_not_tagged(app, user_id, authenticated_client):
+    product = Product(
+        user_id=user_id, name="Oats", category=ProductCategoryEnum.GRAINS,
+        net_weight=Decimal("500"), unit_type=UnitEnum.G, barcode="1",
+    )
+    db_session.add(product)
+    db_session.flush()
+    transaction = Transaction(user_id=user_id, product_id=product.id, price_at_scan=Decimal("1.99"), quantity=1)
+    db_session.add(transaction)
+    db_session.commit()
+
+    with app.app_context():
+        response = authenticated_client.get(f"/api/groceries/transactions/{transaction.id}")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.get_json()["data"]["product_name"] == "Oats"
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import (
+    Product,
+    ProductCategoryEnum,
+    ShoppingListItem,
+    Transaction,
+    UnitEnum,
+)
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+def add_products(user_id, n, category=ProductCategoryEnum.SNACKS, prefix="Product"):
+    products = [
+        Product(
+            user_id=user_id, name=f"{prefix} {i}", barcode=None, category=category,
+            net_weight=Decimal("100"), unit_type=UnitEnum.G, calories_per_100g=None,
+        )
+        for i in range(n)
+    ]
+    db_session.add_all(products)
+    db_session.flush()
+    return products
+
+
+def live_names():
+    return sorted(
+        p.name for p in db_session.query(Product).filter(Product.deleted_at.is_(None))
+    )
+
+
+def test_bulk_delete_by_ids_is_two_statements(groceries_service, user_id, count_queries):
+    products = add_products(user_id, 300)
+    shopping_list, _ = groceries_service.get_or_create_shoppinglist()
+    db_session.flush()
+    for p in products[:3]:
+        groceries_service.shopping_list_item_repo.create_shopping_list_item(
+            shopping_list.id, p.id, 1
+        )
+    db_session.flush()
+
+    with count_queries() as statements:
+        result = groceries_service.bulk_soft_delete_products(
+            {"ids": [p.id for p in products[:250]]}
+        )
+    assert result["data"] == {"deleted": 250, "shopping_list_items_deleted": 3}
+    # product UPDATE + list item DELETE (+ barcode cache generation, no SQL)
+    assert len(statements) == 2
+    assert db_session.query(ShoppingListItem).count() == 0
+    assert len(live_names()) == 50
+
+    again = groceries_service.bulk_soft_delete_products({"ids": [products[0].id]})
+    assert again["data"]["deleted"] == 0  # already deleted
+
+
+def test_bulk_delete_by_filter_and_restore(groceries_service, user_id):
+    stale = add_products(user_id, 2, prefix="Stale")
+    fresh = add_products(user_id, 1, prefix="Fresh")
+    add_products(user_id, 1, category=ProductCategoryEnum.DAIRY_EGGS, prefix="Milk")
+    long_ago = datetime.now(timezone.utc) - timedelta(days=200)
+    db_session.add_all([
+        Transaction(user_id=user_id, product_id=stale[0].id, price_at_scan=Decimal("1.00"),
+                    quantity=1, created_at=long_ago),
+        Transaction(user_id=user_id, product_id=fresh[0].id, price_at_scan=Decimal("1.00"),
+                    quantity=1),
+    ])
+    db_session.flush()
+
+    since = (datetime.now(timezone.utc) - timedelta(days=30)).date()
+    result = groceries_service.bulk_soft_delete_products(
+        {"category": ProductCategoryEnum.SNACKS, "not_bought_since": since}
+    )
+    assert result["data"]["deleted"] == 2
+    assert live_names() == ["Fresh 0", "Milk 0"]
+
+    restored = groceries_service.bulk_restore_products({"category": ProductCategoryEnum.SNACKS})
+    assert restored["data"] == {"restored": 2}
+    assert len(live_names()) == 4
+
+
+def test_other_users_products_untouched(groceries_service, user_id):
+    from app.modules.auth.models import User
+
+    other = User(username="other_user", name="Other")
+    other.hash_password("password123")
+    db_session.add(other)
+    db_session.flush()
+    theirs = add_products(other.id, 1, prefix="Theirs")
+
+    result = groceries_service.bulk_soft_delete_products({"ids": [theirs[0].id]})
+    assert result["data"]["deleted"] == 0
+    assert live_names() == ["Theirs 0"]
+
+
+def test_bulk_endpoints(app, user_id, authenticated_client, csrf_headers):
+    products = add_products(user_id, 3)
+    ids = [p.id for p in products]
+    db_session.commit()
+
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/groceries/products/bulk-delete", json={"ids": ids}, headers=csrf_headers
+        )
+        assert response.status_code == 200
+        assert response.get_json()["data"]["deleted"] == 3
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/groceries/products/bulk-restore",
+            json={"filter": {"category": "SNACKS"}},
+            headers=csrf_headers,
+        )
+        assert response.get_json()["data"] == {"restored": 3}
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/groceries/products/bulk-delete",
+            json={"ids": ids, "filter": {"category": "SNACKS"}},
+            headers=csrf_headers,
+        )
+        assert response.status_code == 400
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/groceries/products/bulk-delete", json={"filter": {}}, headers=csrf_headers
+        )
+        assert response.status_code == 400
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from statistics import median
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import ProductCategoryEnum, Transaction, UnitEnum
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+def add_product(groceries_service, name, net_weight):
+    product = groceries_service.product_repo.create_product(
+        name=name,
+        category=ProductCategoryEnum.SNACKS,
+        net_weight=Decimal(net_weight),
+        unit_type=UnitEnum.G,
+        barcode=f"{abs(hash(name)) % 10**13:013d}",
+        calories_per_100g=None,
+    )
+    db_session.flush()
+    return product
+
+
+def add_history(user_id, product, prices_by_days_ago):
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        Transaction(
+            user_id=user_id, product_id=product.id, price_at_scan=Decimal(price),
+            quantity=1, created_at=now - timedelta(days=days_ago),
+        )
+        for days_ago, price in prices_by_days_ago
+    )
+    db_session.flush()
+
+
+def test_stats_match_per_transaction_price_per_100g(groceries_service, user_id):
+    oats = add_product(groceries_service, "Oats", "500")
+    # Weekly purchases over ~4.8 years, price falling 1c per week (latest is 1.00)
+    history = [(days_ago, f"{1 + i / 100:.2f}") for i, days_ago in enumerate(range(0, 1750, 7))]
+    add_history(user_id, oats, history)
+
+    result = groceries_service.get_price_analytics(years=5)
+
+    ppg = [t.price_per_100g for t in db_session.query(Transaction)]
+    [stats] = result["products"]
+    assert stats["count"] == len(ppg)
+    assert stats["min"] == pytest.approx(float(min(ppg)))
+    assert stats["max"] == pytest.approx(float(max(ppg)))
+    assert stats["median"] == pytest.approx(float(median(ppg)))
+    assert stats["latest"] == pytest.approx(0.2)  # 1.00 / 500g * 100
+    assert stats["trend_per_year"] == pytest.approx(-0.104, rel=0.01)  # -1c/week per 500g
+
+    assert len(result["months"]) == 60
+    assert len(stats["series"]) == 60
+    assert stats["series"][-1] is not None
+
+
+def test_window_and_product_filter(groceries_service, user_id):
+    oats = add_product(groceries_service, "Oats", "500")
+    rice = add_product(groceries_service, "Rice", "1000")
+    add_history(user_id, oats, [(10, "2.00"), (800, "1.00")])
+    add_history(user_id, rice, [(5, "3.00")])
+
+    one_year = groceries_service.get_price_analytics(years=1)
+    assert [p["name"] for p in one_year["products"]] == ["Oats", "Rice"]
+    assert one_year["products"][0]["count"] == 1
+    assert one_year["products"][0]["trend_per_year"] is None  # single point, no slope
+
+    only_rice = groceries_service.get_price_analytics(years=5, product_id=rice.id)
+    assert [p["name"] for p in only_rice["products"]] == ["Rice"]
+    assert only_rice["products"][0]["median"] == pytest.approx(0.3)
+
+
+def test_future_dated_transactions_are_ignored(groceries_service, user_id):
+    oats = add_product(groceries_service, "Oats", "500")
+    add_history(user_id, oats, [(0, "1.00"), (-60, "9.00")])
+
+    [stats] = groceries_service.get_price_analytics(years=1)["products"]
+
+    assert stats["count"] == 1
+    assert stats["max"] == pytest.approx(0.2)
+
+
+def test_query_count_independent_of_history(groceries_service, user_id, count_queries):
+    for n in range(5):
+        product = add_product(groceries_service, f"Product {n}", "250")
+        add_history(user_id, product, [(d, "1.50") for d in range(0, 1750, 3)])
+
+    with count_queries() as statements:
+        result = groceries_service.get_price_analytics(years=5)
+    assert len(result["products"]) == 5
+    assert len(statements) == 2  # stats + monthly series
+
+
+def test_endpoint_rejects_bad_years(app, user_id, authenticated_client):
+    url = "/api/groceries/products/price-analytics"
+    with app.app_context():
+        assert authenticated_client.get(f"{url}?years=0").status_code == 400
+    with app.app_context():
+        response = authenticated_client.get(url)
+    assert response.status_code == 200
+    assert len(response.get_json()["data"]["months"]) == 60
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def pg_trgm():
+    installed = db_session.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    if not installed:
+        pytest.skip("pg_trgm extension is not installed in the test database")
+
+
+requires_pg_trgm = pytest.mark.usefixtures("pg_trgm")
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+@pytest.fixture
+def products(user_id):
+    names_and_barcodes = [
+        ("Rolled Oats", "4001234567890"),
+        ("Oat Milk", "4001234500000"),
+        ("Steel Cut Oats", "5000000000001"),
+        ("Greek Yogurt", "4009999999999"),
+        ("Basmati Rice", None),
+    ]
+    products = {
+        name: Product(
+            user_id=user_id, name=name, barcode=barcode, category=ProductCategoryEnum.GRAINS,
+            net_weight=Decimal("500"), unit_type=UnitEnum.G, calories_per_100g=None,
+        )
+        for name, barcode in names_and_barcodes
+    }
+    db_session.add_all(products.values())
+    db_session.flush()
+    return products
+
+
+def buy(user_id, product, days_ago):
+    db_session.add(Transaction(
+        user_id=user_id, product_id=product.id, price_at_scan=Decimal("1.00"), quantity=1,
+        created_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    ))
+    db_session.flush()
+
+
+def names(matches):
+    return [m["name"] for m in matches]
+
+
+@requires_pg_trgm
+def test_name_substring_matches(groceries_service, products):
+    matches = groceries_service.search_products("oat", limit=10)
+
+    assert set(names(matches)) == {"Rolled Oats", "Steel Cut Oats", "Oat Milk"}
+
+
+@requires_pg_trgm
+def test_fuzzy_match_without_substring(groceries_service, products):
+    # Not a substring of "Greek Yogurt", but shares most trigrams with it
+    assert names(groceries_service.search_products("yogurts", limit=10)) == ["Greek Yogurt"]
+
+
+@requires_pg_trgm
+def test_barcode_prefix_ranks_first(groceries_service, products, user_id):
+    prefix = "400123"
+    # Matches on name only, so it must rank below both barcode-prefix hits
+    db_session.add(Product(
+        user_id=user_id, name=f"Snack {prefix}", barcode=None, category=ProductCategoryEnum.GRAINS,
+        net_weight=Decimal("50"), unit_type=UnitEnum.G,
+    ))
+    db_session.flush()
+
+    matches = groceries_service.search_products(prefix, limit=10)
+
+    assert set(names(matches)) == {"Rolled Oats", "Oat Milk", f"Snack {prefix}"}
+    assert matches[0]["barcode"].startswith(prefix)
+    assert matches[1]["barcode"].startswith(prefix)
+    assert names(matches)[-1] == f"Snack {prefix}"
+
+
+@requires_pg_trgm
+def test_recency_breaks_ties_and_soft_deleted_last(groceries_service, products, user_id):
+    buy(user_id, products["Rolled Oats"], days_ago=30)
+    buy(user_id, products["Steel Cut Oats"], days_ago=1)
+    products["Oat Milk"].deleted_at = datetime.now(timezone.utc)
+    db_session.flush()
+
+    matches = groceries_service.search_products("", limit=3)
+
+    assert names(matches)[:2] == ["Steel Cut Oats", "Rolled Oats"]
+    deleted = groceries_service.search_products("oat milk", limit=10)
+    assert deleted[-1] == {"id": products["Oat Milk"].id, "name": "Oat Milk",
+                           "barcode": "4001234500000", "deleted": True}
+
+
+def test_limit(groceries_service, products):
+    assert len(groceries_service.search_products("", limit=2)) == 2
+
+
+def test_endpoint_validates_limit(app, user_id, authenticated_client):
+    with app.app_context():
+        response = authenticated_client.get("/api/groceries/products/search?q=oat&limit=500")
+    assert response.status_code == 400
@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+def add_products(groceries_service, n):
+    for i in range(n):
+        groceries_service.product_repo.create_product(
+            name=f"Product {i}",
+            category=ProductCategoryEnum.SNACKS,
+            net_weight=Decimal("100"),
+            unit_type=UnitEnum.G,
+            barcode=f"{i:013d}",
+            calories_per_100g=None,
+        )
+    db_session.flush()
+    return groceries_service.product_repo.get_all_products()
+
+
+def line(price, quantity=1, **product_ref):
+    return {"price_at_scan": Decimal(price), "quantity": quantity, "product": None,
+            "product_id": None, "barcode": None} | product_ref
+
+
+def test_receipt_merges_same_day_same_price(groceries_service):
+    products = add_products(groceries_service, 2)
+    by_barcode = {p.barcode: p for p in products}
+    groceries_service.save_transaction(
+        by_barcode["0000000000000"].id, {"price_at_scan": 1.99, "quantity": 1}
+    )
+
+    result = groceries_service.ingest_receipt([
+        line("1.99", 2, barcode="0000000000000"),  # merges into the existing transaction
+        line("2.49", 1, barcode="0000000000000"),  # different price -> new transaction
+        line("3.00", 1, product_id=by_barcode["0000000000001"].id),
+        line("3.00", 2, barcode="0000000000001"),  # same product & price on receipt
+        line("5.00", 1, barcode="9999999999999", product={
+            "name": "New", "category": ProductCategoryEnum.DAIRY_EGGS,
+            "net_weight": 1.0, "unit_type": UnitEnum.KG, "barcode": "9999999999999",
+            "calories_per_100g": None,
+        }),
+    ])
+    db_session.flush()
+
+    assert result["data"] == {
+        "lines": 5, "products_created": 1, "transactions_created": 3, "transactions_merged": 1,
+    }
+    quantities = sorted(
+        (t.product.name, t.price_at_scan, t.quantity) for t in db_session.query(Transaction)
+    )
+    assert quantities == [
+        ("New", Decimal("5.00"), 1),
+        ("Product 0", Decimal("1.99"), 3),
+        ("Product 0", Decimal("2.49"), 1),
+        ("Product 1", Decimal("3.00"), 3),
+    ]
+
+
+def test_receipt_statement_count_independent_of_lines(groceries_service, count_queries):
+    products = add_products(groceries_service, 40)
+    lines = [line("1.00", barcode=p.barcode) for p in products]
+
+    with count_queries() as statements:
+        groceries_service.ingest_receipt(lines)
+    assert len(statements) == 3  # product lookup + transaction upsert + spending rollup upsert
+
+
+def test_unknown_barcode_rejects_whole_receipt(groceries_service):
+    (product,) = add_products(groceries_service, 1)
+    result = groceries_service.ingest_receipt(
+        [line("1.00", barcode=product.barcode), line("1.00", barcode="12345678")]
+    )
+    db_session.flush()
+
+    assert result["errors"] == {"lines[1]": ["Product not found"]}
+    assert db_session.query(Transaction).count() == 0
+
+
+def test_receipt_endpoint(app, user_id, authenticated_client, csrf_headers):
+    payload = {"lines": [
+        {"barcode": "12345678", "price_at_scan": "2.50", "quantity": 2, "product": {
+            "name": "Milk", "category": "dairy_eggs", "net_weight": 1, "unit_type": "l",
+        }},
+        {"barcode": "12345678", "price_at_scan": 2.5, "quantity": 1},
+    ]}
+    with app.app_context():
+        response = authenticated_client.post("/api/groceries/receipts", json=payload, headers=csrf_headers)
+
+    assert response.status_code == 201, response.get_json()
+    assert response.get_json()["data"]["transactions_created"] == 1
+    assert db_session.query(Product).one().name == "Milk"
@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+@pytest.fixture
+def products(user_id):
+    products = [
+        Product(
+            user_id=user_id, name=name, barcode=barcode, category=category,
+            net_weight=Decimal("500"), unit_type=UnitEnum.G, calories_per_100g=None,
+        )
+        for name, barcode, category in (
+            ("Oats", "40000001", ProductCategoryEnum.GRAINS),
+            ("Milk", "40000002", ProductCategoryEnum.DAIRY_EGGS),
+        )
+    ]
+    db_session.add_all(products)
+    db_session.flush()
+    return products
+
+
+def this_month():
+    return datetime.now(ZoneInfo(TZ)).date().replace(day=1)
+
+
+def rollup_rows(groceries_service):
+    db_session.flush()
+    return groceries_service.spending_repo.get_monthly_spending(
+        this_month() - timedelta(days=400), this_month()
+    )
+
+
+def add_old_transaction(user_id, product, days_ago, price="4.00", quantity=1):
+    transaction = Transaction(
+        user_id=user_id, product_id=product.id, price_at_scan=Decimal(price), quantity=quantity,
+        created_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+    db_session.add(transaction)
+    db_session.flush()
+    return transaction
+
+
+def test_incremental_rollups_match_rebuild(groceries_service, products):
+    oats, milk = products
+    groceries_service.save_transaction(oats.id, {"price_at_scan": Decimal("2.50"), "quantity": 2})
+    groceries_service.save_transaction(oats.id, {"price_at_scan": Decimal("2.50"), "quantity": 1})
+    result = groceries_service.save_transaction(
+        milk.id, {"price_at_scan": Decimal("1.20"), "quantity": 1}
+    )
+    groceries_service.save_transaction(
+        milk.id, {"price_at_scan": Decimal("1.30"), "quantity": 4},
+        transaction_id=result["data"]["transaction"].id,
+    )
+    groceries_service.ingest_receipt([
+        {"product_id": oats.id, "barcode": None, "product": None,
+         "price_at_scan": Decimal("3.00"), "quantity": 1},
+        {"product_id": milk.id, "barcode": None, "product": None,
+         "price_at_scan": Decimal("1.30"), "quantity": 2},
+    ])
+
+    incremental = rollup_rows(groceries_service)
+    groceries_service.rebuild_spending_rollups()
+    assert incremental == rollup_rows(groceries_service)
+    assert incremental == [
+        (this_month(), ProductCategoryEnum.GRAINS, Decimal("10.50"), 4),
+        (this_month(), ProductCategoryEnum.DAIRY_EGGS, Decimal("7.80"), 6),
+    ]
+
+
+def test_deleting_last_transaction_drops_rollup_row(groceries_service, products, user_id):
+    oats, _ = products
+    transaction = add_old_transaction(user_id, oats, days_ago=70)
+    groceries_service.rebuild_spending_rollups()
+    assert len(rollup_rows(groceries_service)) == 1
+
+    db_session.delete(transaction)
+    db_session.flush()
+    groceries_service.sync_deleted_transaction(transaction)
+    assert rollup_rows(groceries_service) == []
+
+
+def test_category_change_moves_past_spending(groceries_service, products, user_id):
+    oats, _ = products
+    add_old_transaction(user_id, oats, days_ago=70)
+    groceries_service.rebuild_spending_rollups()
+
+    groceries_service.save_product({"category": ProductCategoryEnum.SNACKS}, oats.id)
+
+    assert [row[1] for row in rollup_rows(groceries_service)] == [ProductCategoryEnum.SNACKS]
+
+
+def test_monthly_spending_is_columnar_and_one_query(groceries_service, products, user_id, count_queries):
+    oats, milk = products
+    add_old_transaction(user_id, oats, days_ago=0, price="2.00", quantity=3)
+    add_old_transaction(user_id, milk, days_ago=0, price="1.00")
+    groceries_service.rebuild_spending_rollups()
+
+    start = this_month().replace(year=this_month().year - 10)
+    with count_queries() as statements:
+        spending = groceries_service.get_monthly_spending(start, this_month())
+    assert len(statements) == 1
+
+    assert len(spending["months"]) == 121
+    assert spending["months"][-1] == this_month().isoformat()
+    grains = spending["categories"].index("GRAINS")
+    assert spending["totals"][grains][-1] == 6.0
+    assert spending["items"][grains][-1] == 3
+    assert spending["totals"][grains][0] == 0.0
+
+
+def test_endpoint_hooks_keep_rollups_in_sync(
+    app, user_id, authenticated_client, csrf_headers, groceries_service, products
+):
+    oats, _ = products
+    old = add_old_transaction(user_id, oats, days_ago=70, price="4.00", quantity=2)
+    recent = add_old_transaction(user_id, oats, days_ago=0, price="1.00")
+    old_id, recent_id = old.id, recent.id
+    groceries_service.rebuild_spending_rollups()
+    db_session.commit()
+
+    with app.app_context():
+        response = authenticated_client.patch(
+            f"/api/groceries/transactions/{recent_id}", json={"quantity": 5}, headers=csrf_headers
+        )
+        assert response.status_code == 200
+    with app.app_context():
+        response = authenticated_client.delete(
+            f"/api/groceries/transactions/{old_id}", headers=csrf_headers
+        )
+        assert response.status_code == 200
+    with app.app_context():
+        response = authenticated_client.get("/api/groceries/spending/monthly")
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert len(data["months"]) == 12
+    assert data["categories"] == ["GRAINS"]
+    assert sum(data["totals"][0]) == 5.0
+    assert sum(data["items"][0]) == 5
+
+
+def test_endpoint_rejects_bad_range(app, user_id, authenticated_client):
+    url = "/api/groceries/spending/monthly"
+    with app.app_context():
+        assert authenticated_client.get(f"{url}?from=2026-13").status_code == 400
+    with app.app_context():
+        assert authenticated_client.get(f"{url}?from=2026-05&to=2026-01").status_code == 400
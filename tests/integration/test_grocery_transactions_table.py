@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.groceries.models import Product, ProductCategoryEnum, Transaction, UnitEnum
+from app.modules.groceries.viewmodels import TransactionViewModel
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+def add_transactions(user_id, n, n_products=50, first_product=0):
+    products = [
+        Product(
+            user_id=user_id,
+            name=f"Product {i}",
+            category=ProductCategoryEnum.SNACKS,
+            net_weight=Decimal("250"),
+            unit_type=UnitEnum.G,
+            barcode=f"{i:013d}",
+            calories_per_100g=None,
+        )
+        for i in range(first_product, first_product + n_products)
+    ]
+    db_session.add_all(products)
+    db_session.flush()
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        Transaction(
+            user_id=user_id, product_id=products[i % n_products].id, price_at_scan=Decimal("2.50"),
+            quantity=1 + i % 3, created_at=now - timedelta(minutes=i),
+        )
+        for i in range(n)
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+
+def test_table_rows_build_view_models_in_one_query(groceries_service, user_id, count_queries):
+    add_transactions(user_id, 1000)
+    start_utc = datetime.now(timezone.utc) - timedelta(days=7)
+    end_utc = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+    with count_queries() as statements:
+        rows = groceries_service.transaction_repo.get_table_rows_in_window(start_utc, end_utc)
+        view_models = [TransactionViewModel(row, TZ) for row in rows]
+        labels = [(vm.product_name, vm.price_label, vm.price_per_100g_label) for vm in view_models]
+    assert len(statements) == 1
+    assert len(labels) == 1000
+    assert ("Product 1", "$5.00 (2x)", "$1.00") in labels
+
+
+def test_view_model_matches_orm_transaction(groceries_service, user_id):
+    add_transactions(user_id, 3, n_products=3)
+    start_utc = datetime.now(timezone.utc) - timedelta(days=1)
+    end_utc = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+    rows = groceries_service.transaction_repo.get_table_rows_in_window(start_utc, end_utc)
+    for row in rows:
+        vm = TransactionViewModel(row, TZ)
+        txn = db_session.get(Transaction, row.id)
+        assert vm.product_name == txn.product_name
+        assert vm.price_per_100g == txn.price_per_100g
+        assert vm.created_at_local == txn.created_at_local
+
+
+def dashboard_query_count(app, client, count_queries):
+    with app.app_context(), count_queries() as statements:
+        response = client.get("/groceries/dashboard")
+    assert response.status_code == 200
+    return len(statements)
+
+
+def test_dashboard_query_count_independent_of_transactions(
+    app, user_id, authenticated_client, count_queries
+):
+    add_transactions(user_id, 10, n_products=10)
+    baseline = dashboard_query_count(app, authenticated_client, count_queries)
+
+    add_transactions(user_id, 990, n_products=50, first_product=10)
+
+    assert dashboard_query_count(app, authenticated_client, count_queries) == baseline
@@ -0,0 +1,76 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+@pytest.fixture
+def habits_service(user_id):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), user_id, TZ)
+
+
+def create_habits(habits_service, n):
+    for i in range(n):
+        habits_service.save_habit({"name": f"Habit {i}", "target_frequency": 7}, habit_id=None)
+    db_session.flush()
+    return habits_service.habit_repo.get_all()
+
+
+def local_noon(days_ago):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(12), tzinfo=ZoneInfo(TZ))
+
+
+def test_bulk_backfill_year_in_handful_of_statements(habits_service, count_queries):
+    habits = create_habits(habits_service, 10)
+    pairs = [(h.id, local_noon(d)) for h in habits for d in range(365)]
+
+    with count_queries() as statements:
+        result = habits_service.add_completions_bulk(pairs)
+        db_session.flush()
+
+    assert result["data"] == {"inserted": 3650, "skipped": 0}
+    assert len(statements) <= 15
+    assert all(h.current_streak == 365 for h in habits)
+
+
+def test_bulk_backfill_skips_existing_and_repeated_days(habits_service):
+    (habit,) = create_habits(habits_service, 1)
+    habits_service.add_completion(habit, local_noon(1))
+
+    result = habits_service.add_completions_bulk(
+        [(habit.id, local_noon(d)) for d in (0, 0, 1, 2)]
+    )
+    assert result["data"] == {"inserted": 2, "skipped": 2}
+
+    db_session.flush()
+    today = local_noon(0).date()
+    counts = habits_service.daily_repo.get_daily_counts(today - timedelta(days=2), today)
+    assert [count for _, _, count in counts] == [1, 1, 1]
+    assert habit.current_streak == 3
+
+
+def test_bulk_backfill_rejects_foreign_habits(app, user_id, authenticated_client, csrf_headers):
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/habits/completions/batch",
+            headers=csrf_headers,
+            json={"completions": [{"habit_id": 999, "completed_at": "2026-01-01T12:00:00Z"}]},
+        )
+    assert response.status_code == 404
+
+
+def test_bulk_backfill_validates_items(app, user_id, authenticated_client, csrf_headers):
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/habits/completions/batch",
+            headers=csrf_headers,
+            json={"completions": [{"habit_id": 1, "completed_at": "yesterday"}]},
+        )
+    assert response.status_code == 400
@@ -0,0 +1,54 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+@pytest.fixture
+def habits_service(user_id):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), user_id, TZ)
+
+
+def local_noon(days_ago):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(12), tzinfo=ZoneInfo(TZ))
+
+
+@pytest.mark.parametrize("bucket", ["day", "week", "month"])
+def test_bucketed_summary_matches_python_grouping(habits_service, bucket):
+    for name in ("Run", "Read"):
+        habits_service.save_habit({"name": name, "target_frequency": 7}, habit_id=None)
+    db_session.flush()
+    habits = {h.name: h for h in habits_service.habit_repo.get_all()}
+    days_ago = {"Read": (0, 0, 1, 8, 40, 200), "Run": (2, 35)}
+    for name, offsets in days_ago.items():
+        for d in offsets:
+            habits_service.add_completion(habits[name], local_noon(d))
+    db_session.flush()
+
+    summary = habits_service.get_completion_summary_by_bucket(90, bucket)
+
+    assert [h["name"] for h in summary["habits"]] == ["Read", "Run"]
+    for habit, row in zip(summary["habits"], summary["counts"], strict=True):
+        assert len(row) == len(summary["buckets"])
+        expected = {}
+        for d in days_ago[habit["name"]]:
+            if d < 90:
+                key = habits_service._bucket_starts(
+                    local_noon(d).date(), local_noon(d).date(), bucket
+                )[0].isoformat()
+                expected[key] = expected.get(key, 0) + 1
+        actual = {b: c for b, c in zip(summary["buckets"], row, strict=True) if c}
+        assert actual == expected
+
+
+def test_summary_rejects_unknown_bucket(app, authenticated_client):
+    with app.app_context():
+        response = authenticated_client.get("/api/habits/completions/summary?lastNDays=7&bucket=year")
+    assert response.status_code == 400
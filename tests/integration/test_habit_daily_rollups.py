@@ -0,0 +1,85 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+@pytest.fixture
+def habits_service(user_id):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), user_id, TZ)
+
+
+@pytest.fixture
+def habits(habits_service):
+    for name in ("Read", "Run"):
+        habits_service.save_habit({"name": name, "target_frequency": 7}, habit_id=None)
+    db_session.flush()
+    return habits_service.habit_repo.get_all()
+
+
+def local_noon(days_ago):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(12), tzinfo=ZoneInfo(TZ))
+
+
+def rollup_rows(habits_service):
+    db_session.flush()
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return habits_service.daily_repo.get_daily_counts(today - timedelta(days=30), today)
+
+
+def test_incremental_rollups_match_rebuild(habits_service, habits):
+    read, run = habits
+    completions = [
+        habits_service.add_completion(habit, local_noon(days_ago))
+        for habit, days_ago in ((read, 0), (read, 0), (read, 3), (run, 3), (run, 10))
+    ]
+    habits_service.remove_completion(read, completions[0])
+    habits_service.remove_completion(run, completions[4])
+
+    incremental = rollup_rows(habits_service)
+    habits_service.rebuild_rollups()
+    assert incremental == rollup_rows(habits_service)
+    assert len(incremental) == 3  # read today (1), read & run 3 days ago
+
+
+def test_heatmap_endpoint(app, user_id, authenticated_client, habits_service, habits):
+    read, run = habits
+    for days_ago in (0, 1, 1):
+        habits_service.add_completion(read, local_noon(days_ago))
+    habits_service.add_completion(run, local_noon(400))  # outside default trailing year
+    read_id = read.id
+    db_session.commit()
+
+    with app.app_context():
+        response = authenticated_client.get("/api/habits/completions/heatmap")
+    days = response.get_json()["data"]["days"]
+    assert response.status_code == 200
+    assert [(d["habit_id"], d["count"]) for d in days] == [(read_id, 2), (read_id, 1)]
+
+    from_date = local_noon(500).date().isoformat()
+    with app.app_context():
+        response = authenticated_client.get(
+            f"/api/habits/completions/heatmap?from={from_date}&habit_id={read_id}"
+        )
+    assert len(response.get_json()["data"]["days"]) == 2
+
+
+@pytest.mark.parametrize("query", ["from=yesterday", "from=2026-02-01&to=2026-01-01"])
+def test_heatmap_rejects_bad_ranges(app, authenticated_client, query):
+    with app.app_context():
+        response = authenticated_client.get(f"/api/habits/completions/heatmap?{query}")
+    assert response.status_code == 400
+
+
+def test_heatmap_rejects_non_integer_habit_id(app, authenticated_client):
+    with app.app_context():
+        response = authenticated_client.get("/api/habits/completions/heatmap?habit_id=abc")
+    assert response.status_code == 400
+    assert "habit_id" in response.get_json()["errors"]
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.auth.models import User
+from app.modules.habits.models import Habit, HabitCompletion, StatusEnum
+
+
+def add_user_with_habit(username, status, target_frequency, days_completed, threshold=0.8):
+    user = User(username=username, name=username, role="USER")
+    user.hash_password("password123")
+    habit = Habit(
+        name="Meditate",
+        user=user,
+        status=status,
+        promotion_threshold=threshold,
+        target_frequency=target_frequency,
+    )
+    now = datetime.now(timezone.utc)
+    for d in range(days_completed):
+        # Two completions on the same day only count once
+        for _ in range(2):
+            db_session.add(
+                HabitCompletion(habit=habit, user=user, created_at=now - timedelta(days=d))
+            )
+    db_session.add(habit)
+    return habit
+
+
+@pytest.mark.parametrize("batch_size", [1, 500])
+def test_promotes_experimental_habits_meeting_threshold(batch_size):
+    from app.modules.habits.service import evaluate_habit_promotions
+
+    daily = add_user_with_habit("daily", StatusEnum.EXPERIMENTAL, 7, days_completed=28)
+    spotty = add_user_with_habit("spotty", StatusEnum.EXPERIMENTAL, 7, days_completed=10)
+    weekly = add_user_with_habit("weekly", StatusEnum.EXPERIMENTAL, 2, days_completed=7)
+    established = add_user_with_habit("est", StatusEnum.ESTABLISHED, 7, days_completed=28)
+    db_session.flush()
+
+    report = evaluate_habit_promotions(db_session(), batch_size=batch_size)
+    db_session.expire_all()
+
+    assert (report["users"], report["evaluated"], report["promoted"]) == (4, 3, 2)
+    assert daily.status == weekly.status == StatusEnum.ESTABLISHED
+    assert daily.established_date is not None
+    assert spotty.status == StatusEnum.EXPERIMENTAL
+    assert established.established_date is None
+
+
+def test_rates_are_one_query_per_user_batch(count_queries):
+    from app.modules.habits.service import evaluate_habit_promotions
+
+    for i in range(6):
+        add_user_with_habit(f"user_{i}", StatusEnum.EXPERIMENTAL, 7, days_completed=3)
+    db_session.flush()
+
+    with count_queries() as statements:
+        evaluate_habit_promotions(db_session(), batch_size=3)
+
+    # Per batch: user ids + grouped rates (nothing to promote), then the empty final batch
+    assert len(statements) == 2 * 2 + 1
+
+
+def test_zero_target_frequency_rates_zero():
+    from app.modules.habits.service import evaluate_habit_promotions
+
+    habit = add_user_with_habit("never", StatusEnum.EXPERIMENTAL, 0, days_completed=3)
+    db_session.flush()
+
+    report = evaluate_habit_promotions(db_session())
+    db_session.expire_all()
+
+    assert (report["evaluated"], report["promoted"]) == (1, 0)
+    assert habit.status == StatusEnum.EXPERIMENTAL
@@ -0,0 +1,111 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.habits.models import Habit
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def habits_service(logged_in_user):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), logged_in_user.id, TZ)
+
+
+@pytest.fixture
+def habit(habits_service):
+    habit = habits_service.habit_repo.create_habit(
+        name="Read", status=None, promotion_threshold=None, target_frequency=7
+    )
+    db_session.flush()
+    db_session.refresh(habit)
+    return habit
+
+
+def local_noon(days_ago):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(12), tzinfo=ZoneInfo(TZ))
+
+
+def stored_state(habit):
+    return habit.current_streak, habit.longest_streak, habit.last_completed_date
+
+
+def rebuilt_state(habits_service, habit):
+    db_session.flush()
+    snapshot = stored_state(habit)
+    habits_service.rebuild_habit_streak(habit)
+    return snapshot, stored_state(habit)
+
+
+def test_add_completion_extends_and_resets_runs(habits_service, habit):
+    for days_ago in (6, 5, 4, 1, 0):
+        habits_service.add_completion(habit, local_noon(days_ago))
+
+    assert habit.current_streak == 2
+    assert habit.longest_streak == 3
+    assert habit.last_completed_date == local_noon(0).date()
+
+
+@pytest.mark.parametrize("days_ago", [3, 2, 0])
+def test_incremental_state_matches_rebuild_after_add(habits_service, habit, days_ago):
+    for d in (6, 5, 4, 1):
+        habits_service.add_completion(habit, local_noon(d))
+
+    habits_service.add_completion(habit, local_noon(days_ago))  # backfill bridging, or append
+
+    incremental, rebuilt = rebuilt_state(habits_service, habit)
+    assert incremental == rebuilt
+
+
+@pytest.mark.parametrize("remove_days_ago", [0, 1, 5, 8])
+def test_incremental_state_matches_rebuild_after_remove(habits_service, habit, remove_days_ago):
+    completions = {
+        d: habits_service.add_completion(habit, local_noon(d))
+        for d in (8, 7, 6, 5, 4, 3, 1, 0)
+    }
+    db_session.flush()
+
+    habits_service.remove_completion(habit, completions[remove_days_ago])
+
+    incremental, rebuilt = rebuilt_state(habits_service, habit)
+    assert incremental == rebuilt
+
+
+def test_stored_streak_matches_pairwise_calculation(habits_service, habit):
+    for d in (9, 8, 2, 1, 0):
+        habits_service.add_completion(habit, local_noon(d))
+    db_session.flush()
+
+    summaries = habits_service.get_habit_summaries([habit])
+    assert summaries[habit.id]["streak_count"] == habits_service.calculate_habit_streak(habit.id)
+    assert summaries[habit.id]["completed_today"] is True
+
+
+def test_rebuild_all_streaks_resets_habits_without_completions(habits_service, habit):
+    habit.current_streak, habit.longest_streak = 4, 9
+    db_session.add(Habit(name="Empty", user_id=habit.user_id, target_frequency=1, current_streak=2))
+    db_session.flush()
+
+    assert habits_service.rebuild_all_streaks() == 2
+    for h in habits_service.habit_repo.get_all():
+        assert stored_state(h) == (0, 0, None)
+
+
+def test_streak_history_segments(habits_service, habit):
+    for d in (9, 8, 7, 4, 1, 0):
+        habits_service.add_completion(habit, local_noon(d))
+    habits_service.add_completion(habit, local_noon(0))  # same-day duplicate
+    db_session.flush()
+
+    history = habits_service.get_streak_history(habit.id)[habit.id]
+
+    assert history["current_streak"] == 2
+    assert history["longest_streak"] == 3
+    assert [length for _, _, length in history["segments"]] == [3, 1, 2]
+    assert history["segments"][0][0] == local_noon(9).date()
+    assert history["segments"][-1][1] == local_noon(0).date()
@@ -0,0 +1,68 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app._infra.database import db_session
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def habits_service(logged_in_user):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), logged_in_user.id, TZ)
+
+
+@pytest.fixture
+def habit(habits_service):
+    habits_service.save_habit(
+        {"name": "Read", "target_frequency": 5}, habit_id=None
+    )
+    db_session.flush()
+    return habits_service.habit_repo.get_all()[0]
+
+
+def local_noon(days_ago):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(12), tzinfo=ZoneInfo(TZ))
+
+
+def aggregate_progress(habits_service):
+    db_session.flush()
+    today = datetime.now(ZoneInfo(TZ)).date()
+    week_start = today - timedelta(days=today.weekday())
+    return habits_service._aggregate_week_progress(week_start)
+
+
+def test_rollup_tracks_adds_and_removes(habits_service, habit):
+    habits_service.calculate_all_habits_percentage_this_week()  # prime rollup row
+
+    today_completion = habits_service.add_completion(habit, local_noon(0))
+    habits_service.add_completion(habit, local_noon(0))
+    habits_service.add_completion(habit, local_noon(7))  # previous week
+    progress = habits_service.calculate_all_habits_percentage_this_week()
+    assert (progress["completed"], progress["total"]) == aggregate_progress(habits_service)
+    assert progress == {"completed": 2, "total": 5, "percent": 40.0}
+
+    habits_service.remove_completion(habit, today_completion)
+    progress = habits_service.calculate_all_habits_percentage_this_week()
+    assert (progress["completed"], progress["total"]) == aggregate_progress(habits_service)
+
+
+def test_target_frequency_change_refreshes_expected(habits_service, habit):
+    assert habits_service.calculate_all_habits_percentage_this_week()["total"] == 5
+
+    habits_service.save_habit({"target_frequency": 3}, habit_id=habit.id)
+    assert habits_service.calculate_all_habits_percentage_this_week()["total"] == 3
+
+
+def test_progress_read_is_single_lookup(habits_service, habit, count_queries):
+    habits_service.add_completion(habit, local_noon(0))
+    habits_service.calculate_all_habits_percentage_this_week()
+    db_session.flush()
+
+    with count_queries() as statements:
+        habits_service.calculate_all_habits_percentage_this_week()
+    assert len(statements) == 1
@@ -0,0 +1,97 @@
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import app.shared.datetime_.helpers as dth
+from app._infra.database import db_session
+from app.modules.habits.models import Habit, HabitCompletion
+from app.modules.tasks.models import PriorityEnum, Task
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+def add_habits_with_completions(user_id, n_habits, n_days=5, prefix="Habit"):
+    now = datetime.now(timezone.utc)
+    for i in range(n_habits):
+        habit = Habit(name=f"{prefix} {i}", user_id=user_id, target_frequency=3)
+        db_session.add(habit)
+        for d in range(n_days):
+            db_session.add(
+                HabitCompletion(habit=habit, user_id=user_id, created_at=now - timedelta(days=d))
+            )
+    db_session.commit()
+
+
+def home_query_count(app, client, count_queries):
+    # Fresh app context per request, so flask_login's cached user (on `g`) isn't reused detached
+    with app.app_context(), count_queries() as statements:
+        response = client.get("/")
+    assert response.status_code == 200
+    return len(statements)
+
+
+def test_home_query_count_independent_of_habit_count(app, user_id, authenticated_client, count_queries):
+    add_habits_with_completions(user_id, 1)
+    home_query_count(app, authenticated_client, count_queries)  # warm weekly progress rollup
+    baseline = home_query_count(app, authenticated_client, count_queries)
+
+    add_habits_with_completions(user_id, 40, prefix="Extra")
+
+    assert home_query_count(app, authenticated_client, count_queries) == baseline
+
+
+
+def add_tasks_around_today(user_id, n_past=0):
+    today = datetime.now(ZoneInfo(TZ)).date()
+
+    def local(days, hour):
+        return datetime.combine(today + timedelta(days=days), time(hour), tzinfo=ZoneInfo(TZ))
+
+    tasks = [
+        Task(name="Due today", due_date=local(0, 23), priority=PriorityEnum.LOW),
+        Task(name="Just after midnight", due_date=local(0, 0), priority=PriorityEnum.LOW),
+        Task(name="Undated", due_date=None, priority=PriorityEnum.HIGH),
+        Task(name="Tomorrow", due_date=local(1, 0), priority=PriorityEnum.LOW),
+        Task(name="Frog", due_date=local(0, 12), is_frog=True),
+    ]
+    tasks += [
+        Task(name=f"Past {i}", due_date=local(-1 - i, 12), priority=PriorityEnum.LOW)
+        for i in range(n_past)
+    ]
+    for task in tasks:
+        task.user_id = user_id
+        task.is_frog = bool(task.is_frog)
+    db_session.add_all(tasks)
+    db_session.commit()
+
+
+def test_due_today_or_undated_matches_python_filter(user_id):
+    from app.modules.tasks.repository import TaskRepository
+
+    add_tasks_around_today(user_id, n_past=3)
+    repo = TaskRepository(db_session(), user_id)
+    start_utc, end_utc = dth.day_range_utc(datetime.now(ZoneInfo(TZ)).date(), TZ)
+
+    expected = [
+        t for t in repo.get_all()
+        if not t.is_frog and (t.due_date is None or dth.is_same_local_date(t.due_date, TZ))
+    ]
+    tasks = repo.get_regular_tasks_due_in_window_or_undated(start_utc, end_utc)
+    assert {t.name for t in tasks} == {"Due today", "Just after midnight", "Undated"}
+    assert sorted(tasks, key=lambda t: t.id) == sorted(expected, key=lambda t: t.id)
+
+
+def test_home_lists_only_todays_tasks(app, user_id, authenticated_client, count_queries):
+    add_tasks_around_today(user_id, n_past=200)
+    with app.app_context(), count_queries() as statements:
+        response = authenticated_client.get("/")
+    html = response.get_data(as_text=True)
+    assert "Due today" in html
+    assert "Undated" in html
+    assert "Past 0" not in html
+    assert "Tomorrow" not in html
+    # One windowed query for the list, rather than loading every regular task
+    task_lists = [s for s in statements if "NOT tasks.is_frog" in s]
+    assert len(task_lists) == 1
+    assert "tasks.due_date IS NULL" in task_lists[0]
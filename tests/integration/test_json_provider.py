@@ -0,0 +1,87 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from sqlalchemy import literal, select
+
+from app._infra.database import db_session
+from app.modules.tasks.models import PriorityEnum
+from app.shared.json_provider import OrjsonProvider, StdJSONProvider, init_json_provider
+
+PAYLOAD_EXPECTED = {
+    "price": "2.50",
+    "at": "2026-03-01T12:30:00.250000+00:00",
+    "day": "2026-03-01",
+    "priority": "HIGH",
+    "by_id": {"1": "one"},
+}
+
+
+def payload():
+    return {
+        "price": Decimal("2.50"),
+        "at": datetime(2026, 3, 1, 12, 30, 0, 250000, tzinfo=timezone.utc),
+        "day": date(2026, 3, 1),
+        "priority": PriorityEnum.HIGH,
+        "by_id": {1: "one"},
+    }
+
+
+@pytest.fixture(params=["orjson", "std"])
+def bare_app(request):
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = request.param
+    init_json_provider(app)
+    return app
+
+
+@pytest.fixture
+def provider(bare_app):
+    return bare_app.json
+
+
+def test_config_selects_provider():
+    for choice, cls in (("orjson", OrjsonProvider), ("std", StdJSONProvider)):
+        app = Flask(__name__)
+        app.config["JSON_PROVIDER"] = choice
+        init_json_provider(app)
+        assert type(app.json) is cls
+
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = "yaml"
+    with pytest.raises(RuntimeError, match="Unknown JSON_PROVIDER"):
+        init_json_provider(app)
+
+
+def test_native_types_round_trip(provider):
+    assert json.loads(provider.dumps(payload())) == PAYLOAD_EXPECTED
+    assert provider.loads(provider.dumps(payload())) == PAYLOAD_EXPECTED
+
+
+def test_rows_encode_as_objects(provider):
+    row = db_session.execute(
+        select(literal(1).label("id"), literal(Decimal("1.25")).label("price"))
+    ).one()
+    assert json.loads(provider.dumps([row])) == [{"id": 1, "price": "1.25"}]
+
+
+def test_unknown_types_still_raise(provider):
+    with pytest.raises(TypeError):
+        provider.dumps({"x": object()})
+
+
+def test_response_is_json(bare_app, provider):
+    with bare_app.app_context():
+        response = provider.response(payload())
+    assert response.mimetype == "application/json"
+    assert response.get_json() == PAYLOAD_EXPECTED
+
+
+def test_app_uses_configured_provider(app, authenticated_client):
+    assert isinstance(app.json, OrjsonProvider)
+    # Session cookies go through app.json too; logging in must keep working
+    with app.app_context():
+        response = authenticated_client.get("/api/profile/me")
+    assert response.status_code == 200
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.habits.models import DifficultyEnum, LanguageEnum, LCStatusEnum
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def habits_service(user_id):
+    from app.modules.habits.service import create_habits_service
+
+    return create_habits_service(db_session(), user_id, TZ)
+
+
+def add_record(habits_service, difficulty, language, status, weeks_ago=0):
+    record = habits_service.add_leetcode_record(
+        {
+            "leetcode_id": 1,
+            "difficulty": difficulty,
+            "language": language,
+            "status": status,
+        }
+    )
+    record.created_at = datetime.now(timezone.utc) - timedelta(weeks=weeks_ago)
+    db_session.flush()
+    return record
+
+
+def test_stats_group_categories_and_solved_weeks(habits_service):
+    E, M = DifficultyEnum.EASY, DifficultyEnum.MEDIUM
+    PY, JS = LanguageEnum.PYTHON, LanguageEnum.JS
+    SOLVED, ATTEMPTED = LCStatusEnum.SOLVED, LCStatusEnum.ATTEMPTED
+    add_record(habits_service, E, PY, SOLVED)
+    add_record(habits_service, E, PY, SOLVED, weeks_ago=1)
+    add_record(habits_service, E, PY, ATTEMPTED)
+    add_record(habits_service, M, JS, SOLVED, weeks_ago=3)
+
+    stats = habits_service.get_leetcode_stats()
+
+    assert stats["total"] == 4
+    counts = {(r["difficulty"], r["language"], r["status"]): r["count"] for r in stats["by_category"]}
+    assert counts == {
+        ("EASY", "PYTHON", "SOLVED"): 2,
+        ("EASY", "PYTHON", "ATTEMPTED"): 1,
+        ("MEDIUM", "JS", "SOLVED"): 1,
+    }
+    assert [w["solved"] for w in stats["solved_per_week"]] == [1, 1, 1]
+
+
+def test_stats_cached_until_next_write(habits_service, count_queries):
+    add_record(habits_service, DifficultyEnum.HARD, LanguageEnum.CPP, LCStatusEnum.SOLVED)
+    habits_service.get_leetcode_stats()
+
+    with count_queries() as statements:
+        assert habits_service.get_leetcode_stats()["total"] == 1
+    assert statements == []
+
+    add_record(habits_service, DifficultyEnum.HARD, LanguageEnum.CPP, LCStatusEnum.SOLVED)
+    assert habits_service.get_leetcode_stats()["total"] == 2
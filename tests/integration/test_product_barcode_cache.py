@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+
+from app._infra.database import db_session
+from app.extensions import cache
+from app.modules.groceries.models import ProductCategoryEnum, UnitEnum
+
+TZ = "America/Chicago"
+
+
+@pytest.fixture
+def groceries_service(user_id):
+    from app.modules.groceries.service import create_groceries_service
+
+    return create_groceries_service(db_session(), user_id, TZ)
+
+
+@pytest.fixture
+def product(groceries_service):
+    result = groceries_service.save_product(
+        {
+            "name": "Oats",
+            "category": ProductCategoryEnum.GRAINS,
+            "net_weight": Decimal("500"),
+            "unit_type": UnitEnum.G,
+            "barcode": "4001234567890",
+        },
+        product_id=None,
+    )
+    return result["data"]["product"]
+
+
+def test_warm_lookup_skips_database(groceries_service, product, count_queries):
+    assert groceries_service.lookup_barcode("4001234567890")["id"] == product.id
+
+    with count_queries() as statements:
+        assert groceries_service.lookup_barcode("4001234567890")["name"] == "Oats"
+    assert statements == []
+
+
+def test_update_invalidates_cached_lookup(groceries_service, product):
+    groceries_service.lookup_barcode("4001234567890")
+
+    groceries_service.save_product({"barcode": "999"}, product_id=product.id)
+    db_session.flush()
+
+    assert groceries_service.lookup_barcode("4001234567890") is None
+    assert groceries_service.lookup_barcode("999")["id"] == product.id
+
+
+def test_soft_delete_invalidates_cached_lookup(
+    app, user_id, authenticated_client, csrf_headers, groceries_service, product
+):
+    product_id = product.id
+    db_session.commit()
+    url = "/api/groceries/products/barcode/4001234567890"
+
+    with app.app_context():
+        assert authenticated_client.get(url).status_code == 200
+    with app.app_context():
+        response = authenticated_client.delete(
+            f"/api/groceries/products/{product_id}", headers=csrf_headers
+        )
+        assert response.status_code == 200
+    with app.app_context():
+        assert authenticated_client.get(url).status_code == 404
+
+
+def test_invalidation_survives_cache_eviction(groceries_service, product, monkeypatch):
+    monkeypatch.setattr(cache.cache, "_threshold", 5)
+    groceries_service.lookup_barcode("4001234567890")
+    groceries_service.save_product({"barcode": "999"}, product_id=product.id)
+    db_session.flush()
+
+    # Push the cache past its threshold so SimpleCache prunes entries
+    for i in range(5):
+        cache.set(f"filler:{i}", i)
+
+    assert groceries_service.lookup_barcode("4001234567890") is None
@@ -0,0 +1,56 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app._infra.database import db_session
+from app.modules.time_tracking.models import TimeEntry
+
+URL = "/api/time_tracking/time_entries/summary"
+
+
+def add_time_entries(user_id):
+    start = datetime.now(timezone.utc) - timedelta(days=3)
+    entries = [
+        TimeEntry(
+            user_id=user_id, category="Work", description=f"Entry {i}",
+            started_at=start + timedelta(hours=i), ended_at=start + timedelta(hours=i, minutes=30),
+            duration_minutes=30,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(entries)
+    db_session.commit()
+    return [e.to_api_dict() for e in entries]
+
+
+@pytest.mark.parametrize("batch_size", [2, 5, 1000])
+def test_summary_streams_full_envelope(app, user_id, authenticated_client, monkeypatch, batch_size):
+    time_entries = add_time_entries(user_id)
+    monkeypatch.setattr("app.shared.repository.base.STREAM_BATCH_SIZE", batch_size)
+    with app.app_context():
+        response = authenticated_client.get(f"{URL}?lastNDays=7")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/json"
+    assert json.loads(response.get_data()) == {
+        "success": True,
+        "message": "Retrieved 5 time entries",
+        "data": time_entries,
+        "errors": None,
+    }
+
+
+def test_summary_streams_empty_window(app, authenticated_client):
+    with app.app_context():
+        response = authenticated_client.get(f"{URL}?lastNDays=7")
+    assert json.loads(response.get_data()) == {
+        "success": True, "message": "Retrieved 0 time entries", "data": [], "errors": None,
+    }
+
+
+def test_summary_requires_last_n_days(app, authenticated_client):
+    with app.app_context():
+        response = authenticated_client.get(URL)
+    assert response.status_code == 400
@@ -0,0 +1,107 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import select
+
+import app.shared.datetime_.helpers as dth
+from app._infra.database import db_session
+from app.modules.tasks.models import PriorityEnum, Task, TaskDailyRollup
+
+TZ = "America/Chicago"  # User.timezone server default
+
+
+@pytest.fixture
+def tasks_service(user_id):
+    from app.modules.tasks.service import create_tasks_service
+
+    return create_tasks_service(db_session(), user_id, TZ)
+
+
+def local(days_ago, hour=12):
+    today = datetime.now(ZoneInfo(TZ)).date()
+    return datetime.combine(today - timedelta(days=days_ago), time(hour), tzinfo=ZoneInfo(TZ))
+
+
+def add_tasks(user_id):
+    """(due_date, completed_at) combinations around today's local-date boundaries."""
+    cases = [
+        (local(0, 23), None),  # due today, open
+        (local(0, 23), local(0, 0)),  # due today, done just after local midnight
+        (local(0, 23), local(1)),  # due today, done yesterday
+        (local(1), local(0)),  # overdue, done today: not today's
+        (local(-1), None),  # due tomorrow
+        (None, local(0)),  # spontaneous
+        (None, local(1)),  # spontaneous yesterday
+        (None, None),  # undated, open
+    ]
+    db_session.add_all(
+        Task(user_id=user_id, name=f"Task {i}", priority=PriorityEnum.LOW, is_frog=False,
+             due_date=due, completed_at=done)
+        for i, (due, done) in enumerate(cases)
+    )
+    db_session.flush()
+
+
+def python_progress(user_id):
+    """The original full scan."""
+    completed = expected = 0
+    for task in db_session.scalars(select(Task).where(Task.user_id == user_id)):
+        due_today = task.due_date and dth.is_same_local_date(task.due_date, TZ)
+        completed_today = task.completed_at and dth.is_same_local_date(task.completed_at, TZ)
+        if due_today:
+            expected += 1
+            completed += bool(completed_today)
+        elif completed_today and task.due_date is None:
+            completed += 1
+            expected += 1
+    return completed, expected
+
+
+def test_aggregate_matches_full_scan(tasks_service, user_id):
+    add_tasks(user_id)
+    start_utc, end_utc = dth.today_range_utc(TZ)
+
+    assert tasks_service.task_repo.count_progress_in_window(start_utc, end_utc) == (2, 4)
+    assert python_progress(user_id) == (2, 4)
+    assert tasks_service.calculate_tasks_progress_today() == {"completed": 2, "total": 4, "percent": 50.0}
+
+
+def test_progress_is_served_from_rollup(tasks_service, user_id, count_queries):
+    add_tasks(user_id)
+    tasks_service.calculate_tasks_progress_today()
+
+    with count_queries() as statements:
+        progress = tasks_service.calculate_tasks_progress_today()
+    assert progress["total"] == 4
+    assert len(statements) == 1
+    assert "task_daily_rollups" in statements[0]
+
+
+def test_writes_refresh_progress(app, user_id, authenticated_client, csrf_headers, tasks_service):
+    add_tasks(user_id)
+    db_session.commit()
+    tasks_service.calculate_tasks_progress_today()
+    db_session.commit()
+    open_id = db_session.scalar(select(Task.id).where(Task.name == "Task 0"))
+
+    with app.app_context():
+        response = authenticated_client.patch(
+            f"/api/tasks/tasks/{open_id}", json={"completed_at": local(0).isoformat()}, headers=csrf_headers
+        )
+    assert response.get_json()["data"]["progress"]["completed"] == 3
+
+    with app.app_context():
+        response = authenticated_client.delete(f"/api/tasks/tasks/{open_id}", headers=csrf_headers)
+    assert response.get_json()["data"]["progress"] == {"completed": 2, "total": 3, "percent": 2 / 3 * 100}
+
+    with app.app_context():
+        response = authenticated_client.post(
+            "/api/tasks/tasks", data={"name": "New", "priority": "HIGH",
+                                      "due_date": local(0).date().isoformat()},
+            headers=csrf_headers,
+        )
+    assert response.status_code == 201
+    assert response.get_json()["data"]["progress"]["total"] == 4
+    db_session.expire_all()
+    assert len(db_session.scalars(select(TaskDailyRollup)).all()) == 1